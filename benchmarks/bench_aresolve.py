@@ -0,0 +1,102 @@
+"""Benchmark `aresolve_config` against `resolve_config` with slow sources.
+
+The config reads Parameter Store (a fake SSM client, two pages) and a
+custom remote source, with the same latency per round trip. The
+synchronous path pays for them one after the other, while the async path
+loads them concurrently.
+Also reports how long the event loop was blocked during `aresolve_config`.
+
+Run with `python benchmarks/bench_aresolve.py`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+
+from _timing import best_of, format_time
+from pydantic_settings import PydanticBaseSettingsSource
+
+from acme_config import AppConfig, ConfigField, aresolve_config, resolve_config
+from acme_config.parameter_store import clear_parameter_store_cache
+from acme_config.testing import FakeSSMClient
+
+LATENCY = 0.02
+client = FakeSSMClient(latency=LATENCY)
+for i in range(20):
+    client.put_parameter(Name=f"/bench/dev/1/BENCHASYNC_FIELD_{i}", Value=str(i))
+
+
+class RemoteSource(PydanticBaseSettingsSource):
+    """A remote store with one round trip per load."""
+
+    def get_field_value(self, field, field_name):
+        return None, field_name, False
+
+    def __call__(self):
+        time.sleep(LATENCY)
+        return {"region": "eu-west-1"}
+
+    async def acall(self):
+        await asyncio.sleep(LATENCY)
+        return {"region": "eu-west-1"}
+
+
+class BenchConfig(AppConfig):
+    model_config = {
+        "env_prefix": "BENCHASYNC_",
+        "env_file": None,
+        "parameter_store": {"app": "bench", "env": "dev", "version": 1, "client": client},
+    }
+
+    region: str = ConfigField(default="", description="Region")
+    field_0: int = ConfigField(default=0, description="Field 0")
+    field_1: int = ConfigField(default=0, description="Field 1")
+
+    @classmethod
+    def settings_customise_sources(
+        cls, settings_cls, init_settings, env_settings, dotenv_settings, file_secret_settings
+    ):
+        return init_settings, env_settings, RemoteSource(settings_cls), dotenv_settings
+
+
+def sync_resolve() -> None:
+    clear_parameter_store_cache()
+    resolve_config(BenchConfig)
+
+
+async def async_resolve() -> float:
+    """Resolve once; return the longest gap between ticks of a 1 ms heartbeat."""
+    clear_parameter_store_cache()
+    longest = 0.0
+    done = False
+
+    async def heartbeat() -> None:
+        nonlocal longest
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            longest = max(longest, now - last)
+            last = now
+
+    beat = asyncio.create_task(heartbeat())
+    await aresolve_config(BenchConfig)
+    done = True
+    await beat
+    return longest
+
+
+def main() -> None:
+    sync_time = best_of(sync_resolve)
+    async_time = best_of(lambda: asyncio.run(async_resolve()))
+    blocked = min(asyncio.run(async_resolve()) for _ in range(5))
+    print(f"two sources, {LATENCY * 1e3:.0f} ms each")
+    print(f"{'resolve_config':>16}  {format_time(sync_time)}")
+    print(f"{'aresolve_config':>16}  {format_time(async_time)}  ({sync_time / async_time:.1f}x)")
+    print(f"{'loop blocked':>16}  {format_time(blocked)}  (longest heartbeat gap)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Benchmark CLI startup for a config class with many CLI flags.
+
+Compares building an argparse parser per call (`build_cli_parser`) with
+the cached parser, the compiled-spec fast path (`parse_cli`), and a spec
+loaded from JSON.
+
+Run with `python benchmarks/bench_cli.py`.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+
+from _timing import best_of, format_time
+from pydantic import create_model
+
+from acme_config import AppConfig, CliSpec, ConfigField, build_cli_parser, parse_cli
+from acme_config.cli import get_cli_parser, get_cli_spec
+
+FIELDS = 80
+
+
+def make_class() -> type[AppConfig]:
+    fields = {
+        f"option_{i}": (
+            str,
+            ConfigField(default="x", description=f"Option {i}", cli_flag=f"--option-{i}"),
+        )
+        for i in range(FIELDS)
+    }
+    return create_model("BigCliConfig", __base__=AppConfig, **fields)
+
+
+def main() -> None:
+    config_class = make_class()
+    argv = ["--option-1", "a", "--option-40=b", "--option-79", "c"]
+
+    def build_and_parse() -> None:
+        vars(build_cli_parser(config_class).parse_args(argv))
+
+    def cached_parser() -> None:
+        vars(get_cli_parser(config_class).parse_args(argv))
+
+    def fast_path() -> None:
+        parse_cli(config_class, argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cli.json")
+        get_cli_spec(config_class).save(path)
+        rows = [
+            ("build_cli_parser", best_of(build_and_parse, number=100)),
+            ("cached parser", best_of(cached_parser, number=1_000)),
+            ("parse_cli", best_of(fast_path, number=10_000)),
+            ("load spec + parse", best_of(lambda: CliSpec.load(path).parse(argv), number=1_000)),
+        ]
+    print(f"{FIELDS} CLI flags, {len(argv)} args")
+    for name, seconds in rows:
+        print(f"{name:>18}  {format_time(seconds)}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
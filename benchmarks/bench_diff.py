@@ -0,0 +1,62 @@
+"""Benchmark bulk config diffs.
+
+Diffs 10,000 pairs of 50-field configs, where most pairs are equal and
+some differ in one field, with `diff_config` and with a comparison of
+`model_dump()` output.
+
+Run with `python benchmarks/bench_diff.py`.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from _timing import best_of, format_time
+
+from acme_config import AppConfig, ConfigField, diff_config, freeze
+
+PAIRS = 10_000
+FIELDS = 50
+# Every n-th pair differs in one field.
+CHANGE_EVERY = 10
+
+BenchConfig = type(
+    "BenchConfig",
+    (AppConfig,),
+    {
+        "__module__": __name__,
+        "__annotations__": {f"field_{i}": str for i in range(FIELDS)},
+        "model_config": {"env_prefix": "BENCHDIFF_", "env_file": None},
+        **{
+            f"field_{i}": ConfigField(default=f"value-{i}", description=f"Field {i}")
+            for i in range(FIELDS)
+        },
+    },
+)
+
+
+def dump_diff(old: AppConfig, new: AppConfig) -> list[str]:
+    a, b = old.model_dump(), new.model_dump()
+    return [name for name in a if a[name] != b[name]]
+
+
+def main() -> None:
+    base = BenchConfig()
+    changed = BenchConfig(field_7="changed")
+    old = [BenchConfig() for _ in range(PAIRS)]
+    new = [changed if i % CHANGE_EVERY == 0 else BenchConfig() for i in range(PAIRS)]
+    frozen_old = [freeze(c) for c in old]
+    frozen_new = [freeze(c) for c in new]
+    assert diff_config(base, changed).changed == dump_diff(base, changed) == ["field_7"]
+
+    dump = best_of(lambda: [dump_diff(a, b) for a, b in zip(old, new)])
+    compiled = best_of(lambda: [diff_config(a, b) for a, b in zip(old, new)])
+    frozen = best_of(lambda: [diff_config(a, b) for a, b in zip(frozen_old, frozen_new)])
+    print(f"{PAIRS} pairs, {FIELDS} fields, 1 in {CHANGE_EVERY} changed")
+    print(f"{'model_dump':>16}  {format_time(dump)}")
+    print(f"{'diff_config':>16}  {format_time(compiled)}  ({dump / compiled:.1f}x)")
+    print(f"{'diff_config frozen':>16}  {format_time(frozen)}  ({dump / frozen:.1f}x)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
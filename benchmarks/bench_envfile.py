@@ -0,0 +1,67 @@
+"""Benchmark acme_config's .env reader against python-dotenv.
+
+Run with `python benchmarks/bench_envfile.py`.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+
+from _timing import best_of, format_time
+from dotenv import dotenv_values
+
+from acme_config.envfile import clear_env_file_cache, read_env_file
+
+# python-dotenv slows down superlinearly with file size (about 10 s for
+# 1 MB), so files of 1 MB and up are timed with a single run.
+SIZES = {"1 KB": 1_000, "100 KB": 100_000, "1 MB": 1_000_000}
+
+
+def make_env_text(target_bytes: int) -> str:
+    """Generate env text of roughly `target_bytes` in the shape of generated configs."""
+    lines = []
+    size = 0
+    i = 0
+    while size < target_bytes:
+        if i % 10 == 0:
+            line = f"# section {i}\n"
+        elif i % 7 == 0:
+            line = f'SERVICE_{i}_DSN="postgres://user:pw@host-{i}:5432/db?opt=1"\n'
+        elif i % 5 == 0:
+            line = f"export SERVICE_{i}_FLAG=true  # inline comment\n"
+        else:
+            line = f"SERVICE_{i}_VALUE=value-{i}-{'x' * 24}\n"
+        lines.append(line)
+        size += len(line)
+        i += 1
+    return "".join(lines)
+
+
+def main() -> None:
+    print(f"{'size':>8}  {'python-dotenv':>13}  {'acme cold':>11}  {'acme cached':>11}  speedup")
+    for label, size in SIZES.items():
+        with tempfile.NamedTemporaryFile("w", suffix=".env", delete=False) as f:
+            f.write(make_env_text(size))
+        try:
+            repeat = 1 if size >= 1_000_000 else 5
+            reference = best_of(lambda: dotenv_values(f.name), repeat=repeat)
+
+            def cold() -> None:
+                clear_env_file_cache()
+                read_env_file(f.name)
+
+            cold_time = best_of(cold, repeat=repeat)
+            read_env_file(f.name)
+            warm_time = best_of(lambda: read_env_file(f.name), number=10, repeat=repeat)
+            print(
+                f"{label:>8}  {format_time(reference):>13}  {format_time(cold_time):>11}  "
+                f"{format_time(warm_time):>11}  {reference / cold_time:5.1f}x cold"
+            )
+        finally:
+            os.unlink(f.name)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Benchmark config instantiation with a large environment.
+
+Compares pydantic-settings' stock env source (which case-folds the whole
+environment on every instantiation) with acme_config's prefix index.
+
+Run with `python benchmarks/bench_environ.py`.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+from _timing import best_of, format_time
+from pydantic_settings import BaseSettings
+
+from acme_config.schema import AppConfig, ConfigField
+
+SIZES = (100, 1_000, 10_000)
+
+
+class StockConfig(BaseSettings):
+    model_config = {"env_prefix": "BENCH_", "env_file": None}
+
+    name: str = "svc"
+    port: int = 8080
+    debug: bool = False
+
+
+class IndexedConfig(AppConfig):
+    model_config = {"env_prefix": "BENCH_", "env_file": None}
+
+    name: str = ConfigField(default="svc", description="Name")
+    port: int = ConfigField(default=8080, description="Port")
+    debug: bool = ConfigField(default=False, description="Debug")
+
+
+def main() -> None:
+    os.environ["BENCH_PORT"] = "9000"
+    print(f"{'env vars':>8}  {'stock':>11}  {'indexed':>11}  speedup")
+    added: list[str] = []
+    for size in SIZES:
+        while len(added) < size:
+            name = f"NOISE_VAR_{len(added)}"
+            os.environ[name] = "x" * 32
+            added.append(name)
+        stock = best_of(StockConfig, number=100)
+        indexed = best_of(IndexedConfig, number=100)
+        print(
+            f"{size:>8}  {format_time(stock):>11}  {format_time(indexed):>11}  "
+            f"{stock / indexed:5.1f}x"
+        )
+    for name in added:
+        del os.environ[name]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
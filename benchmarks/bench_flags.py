@@ -0,0 +1,84 @@
+"""Microbenchmark the per-check cost of `FeatureFlags.is_enabled`.
+
+Compares the compiled bitmask lookup with the previous getattr/isinstance
+implementation and with plain attribute access, and times per-entity
+rollout evaluation.
+
+Run with `python benchmarks/bench_flags.py`.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from _timing import best_of, format_time
+
+from acme_config.features import FeatureFlag, FeatureFlags
+
+CHECKS = 100_000
+
+
+class BenchFeatures(FeatureFlags):
+    model_config = {"env_prefix": "BENCH_FEATURE_", "env_file": None}
+
+    new_dashboard: bool = FeatureFlag(default=False, description="New dashboard")
+    parallel: bool = FeatureFlag(default=True, description="Parallel processing")
+    beta_search: bool = FeatureFlag(default=True, description="Beta search")
+    dark_mode: bool = FeatureFlag(default=False, description="Dark mode")
+    new_checkout: bool = FeatureFlag(
+        default=True, description="New checkout", rollout=5, allow=["tenant-1", "tenant-2"]
+    )
+
+
+def getattr_is_enabled(features: FeatureFlags, flag_name: str) -> bool:
+    """The pre-bitmask implementation, kept for comparison."""
+    value = getattr(features, flag_name)
+    if not isinstance(value, bool):
+        raise TypeError(f"Flag '{flag_name}' is not a boolean field")
+    return value
+
+
+def main() -> None:
+    features = BenchFeatures()
+    is_enabled = features.is_enabled
+    features.is_enabled("parallel")
+
+    def run_compiled() -> None:
+        for _ in range(CHECKS):
+            is_enabled("beta_search")
+
+    def run_getattr() -> None:
+        for _ in range(CHECKS):
+            getattr_is_enabled(features, "beta_search")
+
+    def run_attribute() -> None:
+        for _ in range(CHECKS):
+            features.beta_search  # noqa: B018
+
+    def run_enabled_set() -> None:
+        for _ in range(CHECKS):
+            features.enabled_set()
+
+    entity_ids = [f"user-{i}" for i in range(CHECKS)]
+
+    def run_evaluate() -> None:
+        for entity_id in entity_ids:
+            features.evaluate("new_checkout", entity_id)
+
+    def run_evaluate_many() -> None:
+        features.evaluate_many("new_checkout", entity_ids)
+
+    print(f"{'variant':<22}  {'per check':>11}")
+    for label, fn in (
+        ("getattr + isinstance", run_getattr),
+        ("is_enabled (bitmask)", run_compiled),
+        ("attribute access", run_attribute),
+        ("enabled_set()", run_enabled_set),
+        ("evaluate (5% rollout)", run_evaluate),
+        ("evaluate_many", run_evaluate_many),
+    ):
+        print(f"{label:<22}  {format_time(best_of(fn) / CHECKS):>11}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Benchmark per-tenant config snapshots: memory, pickle size and pickle time.
+
+Compares keeping resolved `AppConfig` instances with keeping `freeze()`d
+copies, for many tenants that share most of their string values.
+
+Run with `python benchmarks/bench_frozen.py`.
+"""
+
+from __future__ import annotations
+
+import pickle
+import sys
+import tracemalloc
+
+from _timing import best_of, format_time
+
+from acme_config import AppConfig, ConfigField, freeze
+
+TENANTS = 10_000
+REGIONS = ("eu-west-1", "us-east-1", "ap-south-2")
+
+
+class TenantConfig(AppConfig):
+    model_config = {"env_prefix": "TENANT_", "env_file": None}
+
+    tenant_id: str = ConfigField(description="Tenant ID")
+    bucket: str = ConfigField(description="Bucket")
+    region: str = ConfigField(description="Region")
+    tier: str = ConfigField(default="standard", description="Tier")
+    replicas: int = ConfigField(default=2, description="Replicas")
+    debug: bool = ConfigField(default=False, description="Debug")
+
+
+def make_configs() -> list[TenantConfig]:
+    # Values come from parsing, so equal strings are distinct objects.
+    return [
+        TenantConfig(
+            tenant_id=f"tenant-{i}",
+            bucket="-".join(["shared", "data", "bucket"]),
+            region="".join(REGIONS[i % len(REGIONS)]),
+            tier="".join(["prem", "ium"]) if i % 10 == 0 else "".join(["stand", "ard"]),
+        )
+        for i in range(TENANTS)
+    ]
+
+
+def measure(build: object) -> tuple[object, int]:
+    tracemalloc.start()
+    value = build()  # type: ignore[operator]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size
+
+
+def main() -> None:
+    configs, config_bytes = measure(make_configs)
+    frozen, frozen_bytes = measure(lambda: [freeze(c) for c in configs])
+    print(f"{TENANTS} tenants")
+    print(f"{'':>14}  {'AppConfig':>11}  {'FrozenConfig':>12}")
+    print(f"{'memory':>14}  {config_bytes / 1e6:9.2f} MB  {frozen_bytes / 1e6:10.2f} MB")
+    config_pickle = pickle.dumps(configs, protocol=pickle.HIGHEST_PROTOCOL)
+    frozen_pickle = pickle.dumps(frozen, protocol=pickle.HIGHEST_PROTOCOL)
+    print(
+        f"{'pickle size':>14}  {len(config_pickle) / 1e6:9.2f} MB  "
+        f"{len(frozen_pickle) / 1e6:10.2f} MB"
+    )
+    dump_config = best_of(lambda: pickle.dumps(configs, protocol=pickle.HIGHEST_PROTOCOL))
+    dump_frozen = best_of(lambda: pickle.dumps(frozen, protocol=pickle.HIGHEST_PROTOCOL))
+    print(f"{'pickle.dumps':>14}  {format_time(dump_config):>11}  {format_time(dump_frozen):>12}")
+    load_config = best_of(lambda: pickle.loads(config_pickle))
+    load_frozen = best_of(lambda: pickle.loads(frozen_pickle))
+    print(f"{'pickle.loads':>14}  {format_time(load_config):>11}  {format_time(load_frozen):>12}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
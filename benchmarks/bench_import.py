@@ -0,0 +1,66 @@
+"""Import-time regression benchmark.
+
+Measures the cumulative `-X importtime` cost of `import acme_config` and of
+the `ac` CLI module in fresh interpreters, and exits non-zero if either
+exceeds its budget.
+
+Run with `python benchmarks/bench_import.py [--scale 2.0]`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+# Best-of-N cumulative import time, in milliseconds.
+BUDGETS_MS = {
+    "acme_config": 20.0,
+    "acme_config.legacy._main": 80.0,
+}
+# Reported for reference only: the cost once a config class is actually used.
+REPORT_ONLY = ("acme_config.schema",)
+RUNS = 7
+
+
+def import_time_ms(module: str) -> float:
+    """Return the cumulative import time of `module` in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"no importtime entry for {module}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiply budgets (for slower machines)"
+    )
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'module':<28}  {'best':>9}  {'budget':>9}")
+    for module in (*BUDGETS_MS, *REPORT_ONLY):
+        best = min(import_time_ms(module) for _ in range(RUNS))
+        budget = BUDGETS_MS.get(module)
+        if budget is None:
+            print(f"{module:<28}  {best:7.1f}ms  {'-':>9}")
+            continue
+        budget *= args.scale
+        over = best > budget
+        failed |= over
+        status = "  OVER BUDGET" if over else ""
+        print(f"{module:<28}  {best:7.1f}ms  {budget:7.1f}ms{status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""Benchmark instrumentation overhead on config resolution.
+
+Resolves a small config with no hook registered (the default), with a
+no-op `Instrumentation` and with `StatsInstrumentation`.
+
+Run with `python benchmarks/bench_instrument.py`.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+from _timing import best_of, format_time
+
+from acme_config import AppConfig, ConfigField, Instrumentation, StatsInstrumentation
+from acme_config.instrument import instrumentation
+
+
+class BenchConfig(AppConfig):
+    model_config = {"env_prefix": "BENCHINST_", "env_file": None}
+
+    name: str = ConfigField(description="Name")
+    port: int = ConfigField(default=8080, description="Port")
+    debug: bool = ConfigField(default=False, description="Debug")
+    tags: list[str] = ConfigField(default=[], description="Tags")
+
+
+def main() -> None:
+    os.environ["BENCHINST_NAME"] = "svc"
+    os.environ["BENCHINST_TAGS"] = '["a", "b"]'
+    baseline = best_of(BenchConfig)
+    print(f"{'no hook':>24}  {format_time(baseline):>10}")
+    for label, hook in (
+        ("Instrumentation()", Instrumentation()),
+        ("StatsInstrumentation()", StatsInstrumentation()),
+    ):
+        with instrumentation(hook):
+            seconds = best_of(BenchConfig)
+        print(f"{label:>24}  {format_time(seconds):>10}  ({seconds / baseline - 1:+.1%})")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Benchmark manifest generation for a large catalog of config classes.
+
+Compares joining `generate_manifest` output per class with streaming one
+multi-class manifest via `write_manifest`, and with `update_manifest` when
+no class or a single class changed.
+
+Run with `python benchmarks/bench_manifest.py`.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+
+from _timing import best_of, format_time
+from pydantic import create_model
+
+from acme_config import AppConfig, ConfigField, generate_manifest, update_manifest, write_manifest
+from acme_config.metadata import invalidate_config_meta
+
+CLASSES = 1_500
+FIELDS = 12
+
+
+def make_classes() -> list[type[AppConfig]]:
+    classes = []
+    for i in range(CLASSES):
+        fields = {
+            f"field_{j}": (str, ConfigField(default=f"value-{j}", description=f"Field {j}"))
+            for j in range(FIELDS)
+        }
+        cls = create_model(f"Service{i}Config", __base__=AppConfig, **fields)
+        cls.model_config["env_prefix"] = f"SVC{i}_"
+        classes.append(cls)
+    return classes
+
+
+def main() -> None:
+    classes = make_classes()
+    with tempfile.TemporaryDirectory() as tmp:
+        joined_path = os.path.join(tmp, "joined.manifest")
+        streamed_path = os.path.join(tmp, "streamed.manifest")
+        incremental_path = os.path.join(tmp, "incremental.manifest")
+
+        def joined() -> None:
+            # Cold metadata, as on a fresh CI run.
+            invalidate_config_meta()
+            with open(joined_path, "w") as f:
+                f.write("".join(generate_manifest(cls) for cls in classes))
+
+        def streamed() -> None:
+            invalidate_config_meta()
+            with open(streamed_path, "w") as f:
+                write_manifest(f, classes)
+
+        update_manifest(incremental_path, classes)
+
+        def unchanged() -> None:
+            invalidate_config_meta()
+            update_manifest(incremental_path, classes)
+
+        def one_changed() -> None:
+            invalidate_config_meta()
+            with open(incremental_path) as f:
+                text = f.read()
+            first = text.index("schema=") + len("schema=")
+            with open(incremental_path, "w") as f:
+                f.write(text[:first] + "0" + text[first + 1 :])
+            update_manifest(incremental_path, classes)
+
+        rows = [
+            ("join per class", best_of(joined)),
+            ("write_manifest", best_of(streamed)),
+            ("update, no change", best_of(unchanged)),
+            ("update, 1 changed", best_of(one_changed)),
+        ]
+    print(f"{CLASSES} classes x {FIELDS} fields")
+    for name, seconds in rows:
+        print(f"{name:>18}  {format_time(seconds)}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
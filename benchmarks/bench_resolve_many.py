@@ -0,0 +1,69 @@
+"""Benchmark resolving many config classes at boot.
+
+Compares a `resolve_config` loop (each class rechecks the environment and
+the .env file) with `resolve_many` (one read of each, shared by every class).
+
+Run with `python benchmarks/bench_resolve_many.py`.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+
+from _timing import best_of, format_time
+from pydantic import create_model
+
+from acme_config import AppConfig, ConfigField, resolve_config, resolve_many
+
+COUNTS = (1, 10, 30, 60)
+NOISE_VARS = 1_000
+
+
+def make_classes(count: int) -> list[type[AppConfig]]:
+    classes = []
+    for i in range(count):
+        cls = create_model(
+            f"Service{i}Config",
+            __base__=AppConfig,
+            host=(str, ConfigField(default="localhost", description="Host")),
+            port=(int, ConfigField(default=8000 + i, description="Port")),
+            debug=(bool, ConfigField(default=False, description="Debug")),
+        )
+        cls.model_config["env_prefix"] = f"SVC{i}_"
+        classes.append(cls)
+    return classes
+
+
+def main() -> None:
+    for i in range(NOISE_VARS):
+        os.environ[f"NOISE_VAR_{i}"] = "x" * 32
+    with tempfile.TemporaryDirectory() as tmp:
+        env_file = os.path.join(tmp, ".env")
+        with open(env_file, "w") as f:
+            for i in range(max(COUNTS)):
+                f.write(f"SVC{i}_HOST=svc{i}.internal\nSVC{i}_DEBUG=true\n")
+        print(f"{'classes':>7}  {'loop':>11}  {'resolve_many':>12}  speedup")
+        for count in COUNTS:
+            classes = make_classes(count)
+
+            def loop(classes: list[type[AppConfig]] = classes) -> None:
+                for cls in classes:
+                    resolve_config(cls, env_file=env_file)
+
+            def bulk(classes: list[type[AppConfig]] = classes) -> None:
+                resolve_many(classes, env_file=env_file)
+
+            looped = best_of(loop, number=20)
+            bulked = best_of(bulk, number=20)
+            print(
+                f"{count:>7}  {format_time(looped):>11}  {format_time(bulked):>12}  "
+                f"{looped / bulked:5.1f}x"
+            )
+    for i in range(NOISE_VARS):
+        del os.environ[f"NOISE_VAR_{i}"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
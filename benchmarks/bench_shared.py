@@ -0,0 +1,79 @@
+"""Benchmark worker startup: resolving config vs attaching to a shared snapshot.
+
+Each pool worker either calls `resolve_config` (environment scan, .env
+parse, validation) or attaches to a snapshot the master published with
+`SharedConfig` and reads one field or the whole config.
+
+Run with `python benchmarks/bench_shared.py`.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+
+from _timing import best_of, format_time
+
+from acme_config import (
+    AppConfig,
+    ConfigField,
+    SharedConfig,
+    SharedConfigView,
+    resolve_config,
+)
+
+NOISE_VARS = 1_000
+
+
+class WorkerConfig(AppConfig):
+    model_config = {"env_prefix": "WORKER_"}
+
+    bucket: str = ConfigField(description="Bucket")
+    region: str = ConfigField(default="eu-west-1", description="Region")
+    workers: int = ConfigField(default=4, description="Workers")
+    timeout: float = ConfigField(default=30.0, description="Timeout")
+    tags: list[str] = ConfigField(default_factory=list, description="Tags")
+    debug: bool = ConfigField(default=False, description="Debug")
+
+
+def main() -> None:
+    for i in range(NOISE_VARS):
+        os.environ[f"NOISE_VAR_{i}"] = "x" * 32
+    with tempfile.TemporaryDirectory() as tmp:
+        env_file = os.path.join(tmp, ".env")
+        with open(env_file, "w") as f:
+            f.write('WORKER_BUCKET=data\nWORKER_TAGS=["a","b"]\nWORKER_DEBUG=true\n')
+        config = resolve_config(WorkerConfig, env_file=env_file)
+        with SharedConfig(WorkerConfig) as shared:
+            shared.publish(config)
+
+            def attach_field() -> None:
+                with SharedConfigView(shared.name, WorkerConfig) as view:
+                    view.bucket
+
+            def attach_config() -> None:
+                with SharedConfigView(shared.name, WorkerConfig) as view:
+                    view.config()
+
+            with SharedConfigView(shared.name, WorkerConfig) as view:
+                view.bucket
+                cached = best_of(lambda: view.bucket, number=10_000)
+
+            rows = [
+                (
+                    "resolve_config",
+                    best_of(lambda: resolve_config(WorkerConfig, env_file=env_file), number=200),
+                ),
+                ("attach + 1 field", best_of(attach_field, number=200)),
+                ("attach + config()", best_of(attach_config, number=200)),
+                ("cached field read", cached),
+            ]
+    for name, seconds in rows:
+        print(f"{name:>18}  {format_time(seconds)}")
+    for i in range(NOISE_VARS):
+        del os.environ[f"NOISE_VAR_{i}"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Benchmark cold-start loading from a snapshot.
+
+Builds a 100-field config from 10,000 environment variables with
+`resolve_config`, then loads the same config from a snapshot, both with
+an unchanged class (no validation) and after a schema change (full
+validation of the stored values).
+
+Run with `python benchmarks/bench_snapshot.py`.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+from _timing import best_of, format_time
+
+from acme_config import AppConfig, ConfigField, dump_snapshot, load_snapshot, resolve_config
+
+FIELDS = 100
+ENV_VARS = 10_000
+
+
+def make_config(name: str, added: bool = False) -> type[AppConfig]:
+    kinds = [str, int, bool, list[str]]
+    annotations = {f"field_{i}": kinds[i % len(kinds)] for i in range(FIELDS)}
+    fields = {f"field_{i}": ConfigField(description=f"Field {i}") for i in range(FIELDS)}
+    if added:
+        annotations["added"] = int
+        fields["added"] = ConfigField(default=0, description="Added field")
+    return type(
+        name,
+        (AppConfig,),
+        {
+            "__module__": __name__,
+            "__annotations__": annotations,
+            "model_config": {"env_prefix": "BENCHSNAP_", "env_file": None},
+            **fields,
+        },
+    )
+
+
+def main() -> None:
+    values = ("value", "42", "true", '["a", "b"]')
+    for i in range(ENV_VARS):
+        os.environ[f"BENCH_NOISE_{i}"] = "x"
+    for i in range(FIELDS):
+        os.environ[f"BENCHSNAP_FIELD_{i}"] = values[i % len(values)]
+
+    config_class = make_config("SnapBenchConfig")
+    changed_class = make_config("SnapBenchConfig", added=True)
+    config = resolve_config(config_class)
+    data = dump_snapshot(config)
+    assert load_snapshot(config_class, data) == config
+
+    resolve = best_of(lambda: resolve_config(config_class))
+    fast = best_of(lambda: load_snapshot(config_class, data))
+    validated = best_of(lambda: load_snapshot(changed_class, data))
+    print(f"{FIELDS} fields, {ENV_VARS} env vars, snapshot {len(data)} bytes")
+    print(f"{'resolve_config':>22}  {format_time(resolve)}")
+    print(f"{'load_snapshot':>22}  {format_time(fast)}  ({resolve / fast:.1f}x)")
+    print(
+        f"{'load_snapshot (changed)':>22}  {format_time(validated)}  ({resolve / validated:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""Benchmark `ac sync` against `ac set` for a large version.
+
+Writes a 1,000-key version to a fake SSM client with 2 ms latency, then
+publishes the same keys as a new version three ways: with `ac set`
+(every key written), with a sync plan where nothing changed (the path is
+read and nothing is written), and with a sync plan where 3 keys changed
+(the path is read, then the new version is written as the 3 changed keys
+plus a pointer to its base, since published versions are never edited).
+All go through a `ParameterStore` with the default client-side rate limit.
+
+Run with `python benchmarks/bench_sync.py`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from acme_config.parameter_store import AdaptiveThrottle, ParameterStore
+from acme_config.testing import FakeSSMClient
+
+KEYS = 1000
+CHANGED = 3
+LATENCY = 0.002
+
+
+def make_client() -> FakeSSMClient:
+    client = FakeSSMClient(latency=LATENCY)
+    store = ParameterStore(client, throttle=AdaptiveThrottle(rate=1e6, max_rate=1e6))
+    store.put_parameters({f"/app/dev/1/KEY_{i}": str(i) for i in range(KEYS)})
+    client.calls.clear()
+    return client
+
+
+def timed(run) -> tuple[float, dict[str, int]]:
+    client = make_client()
+    store = ParameterStore(client)
+    start = time.perf_counter()
+    run(store)
+    return time.perf_counter() - start, dict(client.calls)
+
+
+def sync(store: ParameterStore, params: dict[str, str]) -> None:
+    plan = store.plan_sync("/app/dev/1", params)
+    if plan:
+        store.apply_sync(plan, "/app/dev/2")
+
+
+def main() -> None:
+    unchanged = {f"KEY_{i}": str(i) for i in range(KEYS)}
+    changed = dict(unchanged)
+    for i in range(CHANGED):
+        changed[f"KEY_{i}"] = "changed"
+
+    results = {
+        "set": timed(
+            lambda store: store.put_parameters({f"/app/dev/2/{k}": v for k, v in changed.items()})
+        ),
+        "sync =": timed(lambda store: sync(store, unchanged)),
+        f"sync ~{CHANGED}": timed(lambda store: sync(store, changed)),
+    }
+
+    print(f"{KEYS} keys, {LATENCY * 1000:.0f} ms latency")
+    for name, (seconds, calls) in results.items():
+        print(f"{name:>8}  {seconds * 1000:8.1f} ms  {calls}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
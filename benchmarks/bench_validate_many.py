@@ -0,0 +1,74 @@
+"""Benchmark bulk validation of env files.
+
+Compares instantiating the config once per file (what a `validate_env`
+style loop does, rebuilding every settings source each time) with
+`validate_many`, in-process and on a process pool.
+
+Run with `python benchmarks/bench_validate_many.py`.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+
+from pydantic import ValidationError
+
+from acme_config import AppConfig, ConfigField, validate_many
+
+SIZES = (1_000, 10_000)
+WORKERS = min(8, os.cpu_count() or 1)
+
+
+class ServiceConfig(AppConfig):
+    model_config = {"env_prefix": "SVC_"}
+
+    name: str = ConfigField(description="Service name")
+    port: int = ConfigField(default=8080, description="Port")
+    hosts: list[str] = ConfigField(default_factory=list, description="Hosts")
+    timeout: float = ConfigField(default=30.0, description="Timeout")
+    debug: bool = ConfigField(default=False, description="Debug")
+
+
+def write_files(directory: str, count: int) -> list[str]:
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"{i}.env")
+        port = "not-a-port" if i % 50 == 0 else str(8000 + i % 1000)
+        with open(path, "w") as f:
+            f.write(f'SVC_NAME=svc{i}\nSVC_PORT={port}\nSVC_HOSTS=["a", "b"]\nSVC_DEBUG=true\n')
+        paths.append(path)
+    return paths
+
+
+def instantiate_each(paths: list[str]) -> int:
+    failures = 0
+    for path in paths:
+        try:
+            ServiceConfig(_env_file=path)
+        except ValidationError:
+            failures += 1
+    return failures
+
+
+def timed(fn: object) -> float:
+    start = time.perf_counter()
+    fn()  # type: ignore[operator]
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{'files':>6}  {'instantiate':>11}  {'validate_many':>13}  {f'{WORKERS} procs':>9}")
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = write_files(tmp, size)
+            loop = timed(lambda: instantiate_each(paths))
+            bulk = timed(lambda: validate_many(ServiceConfig, paths))
+            pooled = timed(lambda: validate_many(ServiceConfig, paths, max_workers=WORKERS))
+            print(f"{size:>6}  {loop:10.2f}s  {bulk:12.2f}s  {pooled:8.2f}s")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
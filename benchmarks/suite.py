@@ -0,0 +1,383 @@
+"""Benchmark suite with a JSON history and baseline comparison.
+
+Times the main entry points over synthetic workloads:
+
+- `resolve_config` for schemas of 10/100/1,000 fields in environments of
+  100/10,000 variables;
+- `FeatureFlags.is_enabled` and `describe_config` for the same schema sizes;
+- cold `.env` parsing for files from 1 KB to 10 MB;
+- `ac fetch` (legacy CLI) against a fake SSM with injected latency, with
+  and without the local version cache.
+
+Each run is appended to `benchmarks/results/history.jsonl` and compared with
+`benchmarks/results/baseline.json` if it exists; the exit status is 1 if a
+case got slower than the baseline by more than `--threshold`. Baselines are
+machine specific: record one with `--save-baseline` on the machine you
+compare on.
+
+Run with `just bench` or `python benchmarks/suite.py [--quick] [-k resolve]`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import datetime
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from _timing import format_time
+
+from acme_config import AppConfig, ConfigField, FeatureFlag, FeatureFlags, describe_config
+
+RESULTS_DIR = Path(__file__).parent / "results"
+FORMAT_VERSION = 1
+# Minimum duration of one timed repeat; fast cases are looped to reach it.
+MIN_REPEAT_SECONDS = 0.05
+REPEAT = 5
+# Injected fake SSM latency per call, in seconds.
+SSM_LATENCY = 0.002
+
+Factory = Callable[..., contextlib.AbstractContextManager[Callable[[], Any]]]
+
+
+@dataclass
+class Case:
+    name: str
+    grid: dict[str, tuple[Any, ...]]
+    quick: dict[str, tuple[Any, ...]]
+    factory: Factory
+
+    def variants(self, quick: bool) -> Iterator[dict[str, Any]]:
+        grid = {**self.grid, **self.quick} if quick else self.grid
+        for values in itertools.product(*grid.values()):
+            yield dict(zip(grid, values, strict=True))
+
+
+@dataclass
+class Result:
+    case: str
+    params: dict[str, Any]
+    best: float
+    median: float
+    number: int
+    repeat: int = REPEAT
+    key: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.key = result_key(self.case, self.params)
+
+
+CASES: list[Case] = []
+
+
+def case(name: str, quick: dict[str, tuple[Any, ...]] | None = None, **grid: tuple[Any, ...]):
+    """Register a benchmark: a context manager yielding the function to time.
+
+    `grid` maps each parameter to the values to run; `quick` overrides some
+    of them for `--quick` runs.
+    """
+
+    def register(fn: Callable[..., Iterator[Callable[[], Any]]]) -> Factory:
+        factory = contextlib.contextmanager(fn)
+        CASES.append(Case(name, grid, quick or {}, factory))
+        return factory
+
+    return register
+
+
+def result_key(name: str, params: dict[str, Any]) -> str:
+    return f"{name}[{','.join(f'{k}={v}' for k, v in params.items())}]"
+
+
+# -- synthetic workloads ------------------------------------------------------
+
+
+def make_config_class(fields: int) -> type[AppConfig]:
+    """Return an `AppConfig` subclass with `fields` fields of mixed types."""
+    annotations: dict[str, Any] = {}
+    namespace: dict[str, Any] = {
+        "__module__": __name__,
+        "__annotations__": annotations,
+        "model_config": {"env_prefix": "BENCH_SUITE_", "env_file": None},
+    }
+    for i in range(fields):
+        kind = i % 4
+        name = f"field_{i}"
+        if kind == 0:
+            annotations[name] = str
+            namespace[name] = ConfigField(default="value", description=f"Field {i}")
+        elif kind == 1:
+            annotations[name] = int
+            namespace[name] = ConfigField(default=i, description=f"Field {i}")
+        elif kind == 2:
+            annotations[name] = bool
+            namespace[name] = ConfigField(default=False, description=f"Field {i}")
+        else:
+            annotations[name] = list[str]
+            namespace[name] = ConfigField(default=[], description=f"Field {i}")
+    return type(f"Suite{fields}Config", (AppConfig,), namespace)
+
+
+def config_environ(fields: int, env_vars: int) -> dict[str, str]:
+    """Env values for half the fields, padded with unrelated variables to `env_vars`."""
+    values = ("from-env", "42", "true", '["a", "b"]')
+    env = {f"BENCH_SUITE_FIELD_{i}": values[i % 4] for i in range(fields // 2)}
+    for i in range(max(0, env_vars - len(env))):
+        env[f"UNRELATED_{i}"] = f"value-{i}"
+    return env
+
+
+@contextlib.contextmanager
+def patched_environ(values: dict[str, str]) -> Iterator[None]:
+    saved = dict(os.environ)
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+def make_env_text(target_bytes: int) -> str:
+    """Generate .env text of roughly `target_bytes`."""
+    from bench_envfile import make_env_text
+
+    return make_env_text(target_bytes)
+
+
+# -- cases --------------------------------------------------------------------
+
+
+@case(
+    "resolve_config", fields=(10, 100, 1_000), env_vars=(100, 10_000), quick={"fields": (10, 100)}
+)
+def bench_resolve(fields: int, env_vars: int) -> Iterator[Callable[[], Any]]:
+    from acme_config import resolve_config
+
+    config_class = make_config_class(fields)
+    with patched_environ(config_environ(fields, env_vars)):
+        yield lambda: resolve_config(config_class)
+
+
+@case("is_enabled", flags=(10, 100, 1_000), quick={"flags": (10, 100)})
+def bench_is_enabled(flags: int) -> Iterator[Callable[[], Any]]:
+    namespace: dict[str, Any] = {
+        "__module__": __name__,
+        "__annotations__": {f"flag_{i}": bool for i in range(flags)},
+        "model_config": {"env_prefix": "BENCH_SUITE_FLAG_", "env_file": None},
+    }
+    for i in range(flags):
+        namespace[f"flag_{i}"] = FeatureFlag(default=i % 2 == 0, description=f"Flag {i}")
+    flags_class = type(f"Suite{flags}Flags", (FeatureFlags,), namespace)
+    features = flags_class()
+    names = [f"flag_{i}" for i in range(0, flags, max(1, flags // 10))]
+
+    def check() -> None:
+        for name in names:
+            features.is_enabled(name)
+
+    yield check
+
+
+@case("describe_config", fields=(10, 100, 1_000), quick={"fields": (10, 100)})
+def bench_describe(fields: int) -> Iterator[Callable[[], Any]]:
+    config = make_config_class(fields)()
+    yield lambda: describe_config(config)
+
+
+@case("envfile_parse", size_kb=(1, 100, 1_000, 10_000), quick={"size_kb": (1, 100)})
+def bench_envfile(size_kb: int) -> Iterator[Callable[[], Any]]:
+    from acme_config.envfile import clear_env_file_cache, read_env_file
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / ".env"
+        path.write_text(make_env_text(size_kb * 1_000))
+
+        def cold() -> None:
+            clear_env_file_cache()
+            read_env_file(path)
+
+        yield cold
+
+
+@case("ac_fetch", parameters=(100, 1_000), cache=(False, True), quick={"parameters": (100,)})
+def bench_ac_fetch(parameters: int, cache: bool) -> Iterator[Callable[[], Any]]:
+    from acme_config import parameter_store
+    from acme_config.legacy._main import main_logic
+    from acme_config.testing import FakeSSMClient
+
+    client = FakeSSMClient()
+    for i in range(parameters):
+        client.put_parameter(Name=f"/bench/dev/1/PARAM_{i}", Value=f"value-{i}")
+    client.latency = SSM_LATENCY
+    store = parameter_store.ParameterStore(
+        client, throttle=parameter_store.AdaptiveThrottle(rate=1e6)
+    )
+    args = argparse.Namespace(
+        command="fetch", app_name="bench", env="dev", ver_number=1, no_cache=not cache
+    )
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        args.cache_dir = os.path.join(tmp, "cache")
+        os.chdir(tmp)
+        parameter_store.set_default_store(store)
+        try:
+            # `ac fetch` prints the path of the saved file.
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                yield lambda: main_logic(args)
+        finally:
+            parameter_store.set_default_store(None)
+            os.chdir(cwd)
+
+
+# -- running and reporting ----------------------------------------------------
+
+
+def time_case(fn: Callable[[], Any]) -> tuple[float, float, int]:
+    """Return (best, median) seconds per call and the calls per repeat."""
+    fn()  # warm up caches and lazy imports
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_REPEAT_SECONDS:
+            break
+        number *= 10 if elapsed < MIN_REPEAT_SECONDS / 10 else 2
+    timings = [elapsed / number]
+    for _ in range(REPEAT - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - start) / number)
+    return min(timings), statistics.median(timings), number
+
+
+def run(quick: bool, pattern: str | None) -> list[Result]:
+    results = []
+    for bench in CASES:
+        if pattern and pattern not in bench.name:
+            continue
+        for params in bench.variants(quick):
+            with bench.factory(**params) as fn:
+                best, median, number = time_case(fn)
+            result = Result(bench.name, params, best, median, number)
+            print(f"{result.key:<48}  {format_time(best)}  (median {format_time(median).strip()})")
+            results.append(result)
+    return results
+
+
+def git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def make_record(results: list[Result], quick: bool) -> dict[str, Any]:
+    return {
+        "format": FORMAT_VERSION,
+        "timestamp": datetime.datetime.now(datetime.UTC).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.node(),
+        "quick": quick,
+        "results": {
+            r.key: {
+                "case": r.case,
+                "params": r.params,
+                "best": r.best,
+                "median": r.median,
+                "number": r.number,
+                "repeat": r.repeat,
+            }
+            for r in results
+        },
+    }
+
+
+def compare(record: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Print the ratio to the baseline per case; return the keys slower than `threshold`."""
+    regressions = []
+    print(f"\ncompared with baseline from {baseline.get('timestamp')} ({baseline.get('commit')})")
+    for key, result in record["results"].items():
+        previous = baseline["results"].get(key)
+        if previous is None:
+            continue
+        ratio = result["best"] / previous["best"]
+        flag = ""
+        if ratio > threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        print(f"{key:<48}  {ratio:6.2f}x{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="Skip the largest workloads")
+    parser.add_argument("-k", dest="pattern", help="Only run cases whose name contains this")
+    parser.add_argument(
+        "--history",
+        type=Path,
+        default=RESULTS_DIR / "history.jsonl",
+        help="JSON Lines file each run is appended to",
+    )
+    parser.add_argument("--no-history", action="store_true", help="Do not append to the history")
+    parser.add_argument("--baseline", type=Path, default=RESULTS_DIR / "baseline.json")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Store this run as the baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Slowdown ratio (best time vs baseline) reported as a regression",
+    )
+    args = parser.parse_args()
+
+    record = make_record(run(args.quick, args.pattern), args.quick)
+    if not args.no_history:
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.history, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(record, indent=2) + "\n", encoding="utf-8")
+        print(f"\nbaseline saved to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(record, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than {args.threshold:.2f}x the baseline")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,29 +1,156 @@
-"""App configuration framework: schema declaration, env/CLI resolution, feature flags."""
-
-from acme_config.features import FeatureFlag, FeatureFlags, list_flags
-from acme_config.inspect import (
-    describe_config,
-    generate_dotenv_template,
-    generate_manifest,
-    validate_env,
-)
-from acme_config.resolver import build_cli_parser, resolve_config
-from acme_config.schema import AppConfig, ConfigField
+"""App configuration framework: schema declaration, env/CLI resolution, feature flags.
+
+Public names are imported lazily (PEP 562): `import acme_config` loads
+only this module, and pydantic and friends are imported on first access
+to a name that needs them.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+# Not `from typing import TYPE_CHECKING`: importing typing alone costs more
+# than the rest of this module.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from acme_config.cache import ResolutionCache
+    from acme_config.cli import CliSpec, parse_cli
+    from acme_config.diff import ConfigDiff, diff_config
+    from acme_config.features import FeatureFlag, FeatureFlags, LiveFeatureFlags, list_flags
+    from acme_config.frozen import FrozenConfig, freeze
+    from acme_config.inspect import (
+        ValidationIssue,
+        describe_config,
+        generate_dotenv_template,
+        generate_manifest,
+        iter_manifest_lines,
+        update_manifest,
+        validate_env,
+        validate_many,
+        write_manifest,
+    )
+    from acme_config.instrument import (
+        Instrumentation,
+        LoggingInstrumentation,
+        OpenTelemetryInstrumentation,
+        StatsInstrumentation,
+        set_instrumentation,
+    )
+    from acme_config.resolver import (
+        ConfigBundle,
+        ConfigResolver,
+        aresolve_config,
+        build_cli_parser,
+        resolve_config,
+        resolve_many,
+    )
+    from acme_config.schema import AppConfig, ConfigField
+    from acme_config.secrets import SecretRef, SecretTTL
+    from acme_config.shared import SharedConfig, SharedConfigView
+    from acme_config.snapshot import dump_snapshot, load_snapshot
+
+# Public name -> defining module.
+_EXPORTS = {
+    "ResolutionCache": "acme_config.cache",
+    "CliSpec": "acme_config.cli",
+    "parse_cli": "acme_config.cli",
+    "ConfigDiff": "acme_config.diff",
+    "diff_config": "acme_config.diff",
+    "FeatureFlag": "acme_config.features",
+    "FeatureFlags": "acme_config.features",
+    "LiveFeatureFlags": "acme_config.features",
+    "list_flags": "acme_config.features",
+    "FrozenConfig": "acme_config.frozen",
+    "freeze": "acme_config.frozen",
+    "describe_config": "acme_config.inspect",
+    "generate_dotenv_template": "acme_config.inspect",
+    "generate_manifest": "acme_config.inspect",
+    "iter_manifest_lines": "acme_config.inspect",
+    "write_manifest": "acme_config.inspect",
+    "update_manifest": "acme_config.inspect",
+    "validate_env": "acme_config.inspect",
+    "validate_many": "acme_config.inspect",
+    "ValidationIssue": "acme_config.inspect",
+    "Instrumentation": "acme_config.instrument",
+    "LoggingInstrumentation": "acme_config.instrument",
+    "OpenTelemetryInstrumentation": "acme_config.instrument",
+    "StatsInstrumentation": "acme_config.instrument",
+    "set_instrumentation": "acme_config.instrument",
+    "ConfigBundle": "acme_config.resolver",
+    "ConfigResolver": "acme_config.resolver",
+    "aresolve_config": "acme_config.resolver",
+    "build_cli_parser": "acme_config.resolver",
+    "resolve_config": "acme_config.resolver",
+    "resolve_many": "acme_config.resolver",
+    "AppConfig": "acme_config.schema",
+    "ConfigField": "acme_config.schema",
+    "SecretRef": "acme_config.secrets",
+    "SecretTTL": "acme_config.secrets",
+    "SharedConfig": "acme_config.shared",
+    "SharedConfigView": "acme_config.shared",
+    "dump_snapshot": "acme_config.snapshot",
+    "load_snapshot": "acme_config.snapshot",
+}
 
 __all__ = [
     # Schema
     "AppConfig",
     "ConfigField",
+    "SecretRef",
+    "SecretTTL",
     # Feature flags
     "FeatureFlags",
     "FeatureFlag",
     "list_flags",
+    "LiveFeatureFlags",
     # Resolver
     "resolve_config",
+    "aresolve_config",
     "build_cli_parser",
+    "parse_cli",
+    "CliSpec",
+    "ResolutionCache",
+    "ConfigResolver",
+    "resolve_many",
+    "ConfigBundle",
+    "freeze",
+    "FrozenConfig",
+    "SharedConfig",
+    "SharedConfigView",
+    "diff_config",
+    "ConfigDiff",
+    "dump_snapshot",
+    "load_snapshot",
     # Inspection
     "validate_env",
+    "validate_many",
+    "ValidationIssue",
     "describe_config",
     "generate_manifest",
+    "iter_manifest_lines",
+    "write_manifest",
+    "update_manifest",
     "generate_dotenv_template",
+    # Instrumentation
+    "set_instrumentation",
+    "Instrumentation",
+    "StatsInstrumentation",
+    "LoggingInstrumentation",
+    "OpenTelemetryInstrumentation",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # Cache on the package so later lookups skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*__all__, *(name for name in globals() if name.startswith("__"))})
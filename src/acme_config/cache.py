@@ -0,0 +1,295 @@
+"""Resolution cache for `resolve_config`.
+
+Resolving a config class rereads the .env file, scans the environment and
+revalidates every field. `ResolutionCache` keys each resolution on what
+could change the result and, while none of it has, hands back a copy of
+the cached instance instead of resolving again.
+"""
+
+from __future__ import annotations
+
+import copy
+import datetime
+import decimal
+import enum
+import os
+import pathlib
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from typing import Any
+
+from pydantic import SecretBytes, SecretStr
+from pydantic_settings import BaseSettings
+
+from acme_config import instrument
+from acme_config.envfile import env_file_references
+from acme_config.environ import environ_index
+from acme_config.metadata import get_config_meta
+from acme_config.parameter_store import resolve_version
+from acme_config.resolver import resolve_config
+from acme_config.schema import AppConfig
+from acme_config.secrets import SecretRef
+
+_MISSING_FILE = (None, None, None)
+
+# Values of these types are never changed in place, so copies can share them.
+# (A SecretRef is shared too, so its resolved value stays cached across hits.)
+_IMMUTABLE_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    decimal.Decimal,
+    enum.Enum,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+    pathlib.PurePath,
+    SecretStr,
+    SecretBytes,
+    SecretRef,
+)
+
+_DEFAULT_SOURCES = BaseSettings.__dict__["settings_customise_sources"].__func__
+
+
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if type(value) is tuple or type(value) is frozenset:
+        return all(_is_immutable(item) for item in value)
+    return False
+
+
+def _mutable_fields(config: AppConfig) -> tuple[str, ...]:
+    """Names of the fields whose values a copy must not share with `config`."""
+    return tuple(name for name, value in config.__dict__.items() if not _is_immutable(value))
+
+
+def _copy_instance[T: AppConfig](config: T, mutable: tuple[str, ...]) -> T:
+    """Copy `config`, deep-copying only the values in `mutable` fields."""
+    clone = config.model_copy()
+    if mutable:
+        values = clone.__dict__
+        for name in mutable:
+            values[name] = copy.deepcopy(values[name])
+    return clone
+
+
+def _freeze_value(value: Any) -> Hashable:
+    """Turn a CLI/override value into a hashable key component."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze_value(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze_value(v) for v in value)
+    hash(value)
+    return value
+
+
+def _env_file_key(env_file: Any, encoding: str | None = None) -> tuple[Any, ...]:
+    """Stat each configured env file: (path, mtime_ns, size, inode, referenced variables).
+
+    Values interpolated with `${VAR}` come from the environment, so the
+    variables a file references are part of its key.
+    """
+    if env_file is None:
+        return ()
+    paths = [env_file] if isinstance(env_file, (str, os.PathLike)) else list(env_file)
+    key = []
+    for path in paths:
+        path = os.path.expanduser(os.fspath(path))
+        try:
+            st = os.stat(path)
+        except OSError:
+            key.append((path, *_MISSING_FILE))
+        else:
+            try:
+                names = env_file_references(path, encoding=encoding or "utf-8")
+            except OSError:
+                key.append((path, *_MISSING_FILE))
+                continue
+            referenced = tuple((name, os.environ.get(name)) for name in sorted(names))
+            key.append((path, st.st_mtime_ns, st.st_size, st.st_ino, referenced))
+    return tuple(key)
+
+
+def _environ_fingerprint(config_class: type[AppConfig]) -> tuple[tuple[str, str | None], ...]:
+    """Collect the values of the environment variables that can feed `config_class` fields."""
+    meta = get_config_meta(config_class)
+    case_sensitive = bool(config_class.model_config.get("case_sensitive"))
+    if meta.has_aliases:
+        view = environ_index.lookup("", case_sensitive=case_sensitive)
+        return tuple(sorted(view.items()))
+    view = environ_index.lookup(meta.env_prefix, case_sensitive=case_sensitive)
+    if config_class.model_config.get("env_nested_delimiter"):
+        # Nested fields read any number of PREFIX_FIELD__SUB variables.
+        return tuple(sorted(view.items()))
+    if case_sensitive:
+        return tuple((f.env_var, view.get(f"{meta.env_prefix}{f.name}")) for f in meta.fields)
+    return tuple((f.env_var, view.get(f.env_var.lower())) for f in meta.fields)
+
+
+def _secrets_dir_key(secrets_dir: Any) -> tuple[Any, ...]:
+    """Stat every file in each configured secrets directory."""
+    if secrets_dir is None:
+        return ()
+    paths = [secrets_dir] if isinstance(secrets_dir, (str, os.PathLike)) else list(secrets_dir)
+    key = []
+    for path in paths:
+        path = os.path.expanduser(os.fspath(path))
+        try:
+            with os.scandir(path) as entries:
+                files = sorted(
+                    (entry.name, st.st_mtime_ns, st.st_size, st.st_ino)
+                    for entry in entries
+                    for st in (entry.stat(),)
+                )
+        except OSError:
+            key.append((path, None))
+        else:
+            key.append((path, tuple(files)))
+    return tuple(key)
+
+
+def _parameter_store_key(config_class: type[AppConfig]) -> tuple[Any, ...]:
+    """The Parameter Store path `config_class` reads; versions are immutable."""
+    options = config_class.model_config.get("parameter_store") or {}
+    app, env = options.get("app"), options.get("env")
+    if not app or not env:
+        return ()
+    version = options.get("version")
+    if version is None:
+        version = resolve_version(app, env, options.get("client"))
+    return (app, env, str(version))
+
+
+class ResolutionCache:
+    """Bounded LRU cache of resolved config instances.
+
+    Entries are keyed on the config class, the stat of its .env file(s)
+    (path, mtime, size, inode) and the environment variables they
+    interpolate, the stat of its secrets directory, the values of the
+    environment variables its fields map to, its Parameter Store version,
+    and the normalized `cli_args` / `overrides`. Classes that customise
+    their settings sources are not cached.
+
+    Every call returns its own instance of the config class: fields
+    holding mutable values (lists, dicts, models, ...) are deep-copied per
+    hit, so changes made by one caller never reach another.
+
+    Example::
+
+        cache = ResolutionCache(maxsize=1024)
+        config = resolve_config(TenantConfig, overrides={"tenant": tid}, cache=cache)
+
+    Args:
+        maxsize: Maximum number of cached instances before the least
+            recently used one is evicted.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[AppConfig, tuple[str, ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _make_key(
+        self,
+        config_class: type[AppConfig],
+        cli_args: dict[str, Any] | None,
+        overrides: dict[str, Any] | None,
+        env_file: str | None,
+    ) -> Hashable | None:
+        """Build the cache key, or None if `config_class` cannot be cached."""
+        if config_class.settings_customise_sources.__func__ is not _DEFAULT_SOURCES:
+            return None
+        model_config = config_class.model_config
+        files = env_file if env_file is not None else model_config.get("env_file")
+        cli = {k: v for k, v in (cli_args or {}).items() if v is not None}
+        return (
+            config_class,
+            _env_file_key(files, model_config.get("env_file_encoding")),
+            _secrets_dir_key(model_config.get("secrets_dir")),
+            _environ_fingerprint(config_class),
+            _parameter_store_key(config_class),
+            _freeze_value(cli),
+            _freeze_value(overrides or {}),
+        )
+
+    def resolve[T: AppConfig](
+        self,
+        config_class: type[T],
+        cli_args: dict[str, Any] | None = None,
+        overrides: dict[str, Any] | None = None,
+        env_file: str | None = None,
+    ) -> T:
+        """Resolve `config_class` like `resolve_config`, reusing a cached instance if possible.
+
+        Values that cannot be hashed in `cli_args` or `overrides`, and classes
+        that customise their settings sources, bypass the cache (counted as a
+        miss) instead of failing.
+        """
+        try:
+            key = self._make_key(config_class, cli_args, overrides, env_file)
+        except TypeError:
+            key = None
+
+        if key is not None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+            if entry is not None:
+                instrument.event("cache.hit", cache="resolution", config=config_class.__name__)
+                return _copy_instance(*entry)  # type: ignore[return-value]
+
+        instrument.event("cache.miss", cache="resolution", config=config_class.__name__)
+
+        config = resolve_config(
+            config_class, cli_args=cli_args, overrides=overrides, env_file=env_file
+        )
+
+        if key is not None:
+            # Keep a private copy so the caller is free to change `config`.
+            mutable = _mutable_fields(config)
+            entry = (_copy_instance(config, mutable), mutable)
+        with self._lock:
+            self.misses += 1
+            if key is not None:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return config
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        """Drop all cached instances and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,266 @@
+"""Compiled CLI specs and fast command-line parsing for config classes.
+
+`CliSpec` is the part of a config class that matters for the command line:
+one entry per field with a `cli_flag`. It is compiled from the class once,
+can be saved as JSON and loaded again without importing pydantic, and can
+either build an `argparse` parser or parse arguments itself.
+
+`parse_cli` parses with the spec and returns only the values given on the
+command line, falling back to the (cached) argparse parser for anything
+beyond plain `--flag value` / `--flag=value` / `--switch` arguments, such
+as `--help`, abbreviations or errors.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import weakref
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import argparse
+
+    from pydantic_settings import BaseSettings
+
+    from acme_config.metadata import ConfigMeta
+
+FORMAT_VERSION = 1
+
+VALUE = "value"
+STORE_TRUE = "store_true"
+STORE_FALSE = "store_false"
+
+
+class CliOption:
+    """One command-line option of a `CliSpec`."""
+
+    __slots__ = ("flag", "dest", "kind", "help")
+
+    def __init__(self, flag: str, dest: str, kind: str, help: str = "") -> None:
+        self.flag = flag
+        self.dest = dest
+        self.kind = kind
+        self.help = help
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CliOption):
+            return NotImplemented
+        return (self.flag, self.dest, self.kind, self.help) == (
+            other.flag,
+            other.dest,
+            other.kind,
+            other.help,
+        )
+
+    def __repr__(self) -> str:
+        return f"CliOption({self.flag!r}, dest={self.dest!r}, kind={self.kind!r})"
+
+
+class CliSpec:
+    """Serializable description of a config class's command-line options.
+
+    Args:
+        class_name: Name of the config class it was compiled from.
+        schema_hash: The class's `ConfigMeta.schema_hash` at compile time.
+        options: The options, in field declaration order.
+    """
+
+    __slots__ = ("class_name", "schema_hash", "options", "_by_flag")
+
+    def __init__(self, class_name: str, schema_hash: str, options: Sequence[CliOption]) -> None:
+        self.class_name = class_name
+        self.schema_hash = schema_hash
+        self.options = tuple(options)
+        self._by_flag = {option.flag: option for option in self.options}
+
+    @classmethod
+    def from_meta(cls, meta: ConfigMeta) -> CliSpec:
+        """Compile the spec from a class's field metadata."""
+        options = []
+        for field in meta.cli_fields:
+            if field.annotation is bool:
+                # Boolean fields become switches that flip the default
+                kind = STORE_TRUE if field.default is False else STORE_FALSE
+            else:
+                kind = VALUE
+            options.append(CliOption(field.cli_flag or "", field.name, kind, field.description))
+        return cls(meta.class_name, meta.schema_hash, options)
+
+    def to_json(self) -> str:
+        """Serialize the spec; see `from_json`."""
+        return json.dumps(
+            {
+                "format": FORMAT_VERSION,
+                "class": self.class_name,
+                "schema": self.schema_hash,
+                "options": [[o.flag, o.dest, o.kind, o.help] for o in self.options],
+            }
+        )
+
+    @classmethod
+    def from_json(cls, text: str | bytes) -> CliSpec:
+        """Load a spec written by `to_json`.
+
+        Raises:
+            ValueError: If the text is not a spec in this format version.
+        """
+        data = json.loads(text)
+        if not isinstance(data, dict) or data.get("format") != FORMAT_VERSION:
+            raise ValueError(f"not a CLI spec (format {FORMAT_VERSION})")
+        options = [CliOption(*entry) for entry in data["options"]]
+        return cls(data["class"], data["schema"], options)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Write the spec to `path` as JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> CliSpec:
+        """Read a spec saved with `save`. Compare `schema_hash` to detect a stale file."""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_json(f.read())
+
+    def build_parser(
+        self,
+        prog: str | None = None,
+        description: str | None = None,
+        *,
+        omit_missing: bool = False,
+    ) -> argparse.ArgumentParser:
+        """Build a new argparse parser for the options.
+
+        By default value options that are not given parse as None, and
+        switches as the opposite of what they store. With `omit_missing`
+        they are left out of the namespace instead.
+        """
+        import argparse
+
+        parser = argparse.ArgumentParser(
+            prog=prog,
+            description=description,
+            argument_default=argparse.SUPPRESS if omit_missing else None,
+        )
+        for option in self.options:
+            kwargs: dict[str, Any] = {"dest": option.dest, "help": option.help}
+            if option.kind == VALUE:
+                # Values stay strings; pydantic handles type coercion
+                if not omit_missing:
+                    kwargs["default"] = None  # None = "not provided via CLI"
+            else:
+                kwargs["action"] = option.kind
+            parser.add_argument(option.flag, **kwargs)
+        return parser
+
+    def parse(self, argv: Sequence[str]) -> dict[str, Any] | None:
+        """Parse `argv`, returning only the options it sets.
+
+        Returns None if `argv` needs the full argparse parser: unknown or
+        abbreviated flags, `--help`, positional arguments, or a missing value.
+        """
+        by_flag = self._by_flag
+        values: dict[str, Any] = {}
+        i = 0
+        count = len(argv)
+        while i < count:
+            arg = argv[i]
+            i += 1
+            if not arg.startswith("-") or arg == "--":
+                return None
+            flag, eq, inline = arg.partition("=")
+            option = by_flag.get(flag)
+            if option is None:
+                return None
+            if option.kind == VALUE:
+                if eq:
+                    values[option.dest] = inline
+                elif i < count and not argv[i].startswith("-"):
+                    values[option.dest] = argv[i]
+                    i += 1
+                else:
+                    return None
+            elif eq:
+                return None
+            else:
+                values[option.dest] = option.kind == STORE_TRUE
+        return values
+
+    def __repr__(self) -> str:
+        return f"CliSpec({self.class_name}, options={len(self.options)})"
+
+
+# Keyed weakly by config class; entries are rebuilt when the metadata changes.
+_SPECS: weakref.WeakKeyDictionary[type, tuple[ConfigMeta, CliSpec]] = weakref.WeakKeyDictionary()
+_PARSERS: weakref.WeakKeyDictionary[
+    type, dict[tuple[str | None, str | None, bool], tuple[CliSpec, argparse.ArgumentParser]]
+] = weakref.WeakKeyDictionary()
+
+
+def get_cli_spec(config_class: type[BaseSettings]) -> CliSpec:
+    """Return the compiled `CliSpec` for a config class, building it on first use."""
+    from acme_config.metadata import get_config_meta
+
+    meta = get_config_meta(config_class)
+    cached = _SPECS.get(config_class)
+    if cached is not None and cached[0] is meta:
+        return cached[1]
+    spec = CliSpec.from_meta(meta)
+    _SPECS[config_class] = (meta, spec)
+    return spec
+
+
+def get_cli_parser(
+    config_class: type[BaseSettings], prog: str | None = None, description: str | None = None
+) -> argparse.ArgumentParser:
+    """Return a parser shared by all callers with the same class, prog and description.
+
+    Do not add arguments to it; use `build_cli_parser` for a parser of your own.
+    """
+    return _cached_parser(config_class, prog, description, False)
+
+
+def _cached_parser(
+    config_class: type[BaseSettings], prog: str | None, description: str | None, omit_missing: bool
+) -> argparse.ArgumentParser:
+    spec = get_cli_spec(config_class)
+    parsers = _PARSERS.setdefault(config_class, {})
+    key = (prog, description, omit_missing)
+    cached = parsers.get(key)
+    if cached is not None and cached[0] is spec:
+        return cached[1]
+    parser = spec.build_parser(prog, description, omit_missing=omit_missing)
+    parsers[key] = (spec, parser)
+    return parser
+
+
+def parse_cli(
+    config_class: type[BaseSettings],
+    argv: Sequence[str] | None = None,
+    prog: str | None = None,
+    description: str | None = None,
+) -> dict[str, Any]:
+    """Parse command-line arguments into the values that were actually given.
+
+    The result can be passed straight to `resolve_config(cli_args=...)`;
+    fields not on the command line are absent rather than None, so a
+    switch left off does not override the environment.
+
+    Args:
+        config_class: The config class whose `cli_flag` fields are accepted.
+        argv: Arguments to parse. Defaults to `sys.argv[1:]`.
+        prog: Program name, used by `--help` and error messages.
+        description: Description, used by `--help`.
+
+    Raises:
+        SystemExit: On `--help` or invalid arguments, as argparse does.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    values = get_cli_spec(config_class).parse(argv)
+    if values is None:
+        parser = _cached_parser(config_class, prog, description, True)
+        values = vars(parser.parse_args(argv))
+    return values
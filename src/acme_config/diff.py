@@ -0,0 +1,236 @@
+"""Field-level diffs between two instances of a config class.
+
+`diff_config(old, new)` reports which fields changed, redacting secret
+values, and whether any changed field needs a restart (see the `reload`
+argument of `ConfigField` and `FeatureFlag`). Diffs are computed with a
+per-class compiled comparison: equal configs cost a single dict (or, for
+frozen copies, tuple) comparison, and only differing configs are walked
+field by field.
+
+Example::
+
+    diff = diff_config(running, resolve_config(MyConfig))
+    if diff.restart_required:
+        schedule_restart(diff.restart)
+    elif diff:
+        running = diff.apply(running)   # take the hot-reloadable changes
+"""
+
+from __future__ import annotations
+
+import weakref
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+from acme_config.frozen import FrozenConfig, _freeze_value
+from acme_config.metadata import get_config_meta
+
+if TYPE_CHECKING:
+    from pydantic_settings import BaseSettings
+
+    from acme_config.metadata import ConfigMeta
+
+REDACTED = "***"
+
+
+@dataclass(frozen=True, slots=True)
+class FieldChange:
+    """One changed field. `old` and `new` are `"***"` for secret fields."""
+
+    name: str
+    env_var: str
+    old: Any
+    new: Any
+    secret: bool
+    reload: str
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.old!r} -> {self.new!r} [{self.reload}]"
+
+
+class ConfigDiff:
+    """The changes between two instances of one config class.
+
+    Falsy when nothing changed. Iterating yields `FieldChange`s in field
+    declaration order; `diff["name"]` returns the change to one field.
+
+    Attributes:
+        config_class: The config class compared.
+        changes: The changed fields, in declaration order.
+    """
+
+    __slots__ = ("config_class", "changes", "_new")
+
+    def __init__(
+        self,
+        config_class: type[BaseSettings],
+        changes: tuple[FieldChange, ...],
+        new: BaseSettings | FrozenConfig | None = None,
+    ) -> None:
+        self.config_class = config_class
+        self.changes = changes
+        self._new = new
+
+    @property
+    def changed(self) -> list[str]:
+        """Names of the changed fields."""
+        return [c.name for c in self.changes]
+
+    @property
+    def hot(self) -> list[str]:
+        """Changed fields a running app can pick up (`reload="hot"`)."""
+        return [c.name for c in self.changes if c.reload == "hot"]
+
+    @property
+    def restart(self) -> list[str]:
+        """Changed fields that need a restart (`reload="restart"`)."""
+        return [c.name for c in self.changes if c.reload != "hot"]
+
+    @property
+    def restart_required(self) -> bool:
+        """Whether any changed field needs a restart."""
+        return any(c.reload != "hot" for c in self.changes)
+
+    def apply[C: BaseSettings](self, config: C, *, restart: bool = False) -> C:
+        """Return a copy of `config` with the new values of the changed fields.
+
+        Only hot-reloadable fields are taken unless `restart` is True. The
+        values come from the `new` instance the diff was computed against,
+        so they are already validated, and secrets are carried over as is.
+
+        Raises:
+            TypeError: If `config` is not an instance of the diffed class.
+        """
+        if not isinstance(config, self.config_class):
+            raise TypeError(
+                f"expected a {self.config_class.__name__} instance, got {type(config).__name__}"
+            )
+        names = self.changed if restart else self.hot
+        if not names or self._new is None:
+            return config
+        new = self._new
+        if isinstance(new, FrozenConfig):
+            # A FrozenConfig holds tuples for lists etc.; get typed values back.
+            new = new.thaw()
+        update = {name: getattr(new, name) for name in names}
+        return config.model_copy(update=update)
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def __iter__(self) -> Iterator[FieldChange]:
+        return iter(self.changes)
+
+    def __contains__(self, name: object) -> bool:
+        return any(c.name == name for c in self.changes)
+
+    def __getitem__(self, name: str) -> FieldChange:
+        for change in self.changes:
+            if change.name == name:
+                return change
+        raise KeyError(name)
+
+    def __repr__(self) -> str:
+        return f"ConfigDiff({self.config_class.__name__}, changed={self.changed})"
+
+
+class _Differ:
+    """Compiled comparison for one config class."""
+
+    __slots__ = ("meta", "values", "fields")
+
+    def __init__(self, meta: ConfigMeta) -> None:
+        self.meta = meta
+        self.fields = meta.fields
+        names = [f.name for f in meta.fields]
+        getter: Callable[[dict[str, Any]], Any]
+        if len(names) == 1:
+            getter = lambda values, name=names[0]: (values[name],)  # noqa: E731
+        elif names:
+            getter = itemgetter(*names)
+        else:
+            getter = lambda values: ()  # noqa: E731
+        self.values = getter
+
+    def changes(self, old: tuple[Any, ...], new: tuple[Any, ...]) -> tuple[FieldChange, ...]:
+        if old == new:
+            return ()
+        changes = []
+        # A subclass's frozen copy has its extra fields last; zip stops before them.
+        for field, a, b in zip(self.fields, old, new):
+            if a is b or a == b:
+                continue
+            if field.secret:
+                a = b = REDACTED
+            changes.append(FieldChange(field.name, field.env_var, a, b, field.secret, field.reload))
+        return tuple(changes)
+
+
+# Keyed weakly by config class; rebuilt when the class's metadata changes.
+_DIFFERS: weakref.WeakKeyDictionary[type, _Differ] = weakref.WeakKeyDictionary()
+
+
+def _get_differ(config_class: type[BaseSettings]) -> _Differ:
+    meta = get_config_meta(config_class)
+    differ = _DIFFERS.get(config_class)
+    if differ is None or differ.meta is not meta:
+        differ = _Differ(meta)
+        _DIFFERS[config_class] = differ
+    return differ
+
+
+def _config_class(config: Any) -> type[BaseSettings]:
+    if isinstance(config, FrozenConfig):
+        return config.config_class
+    return type(config)
+
+
+def diff_config(old: BaseSettings | FrozenConfig, new: BaseSettings | FrozenConfig) -> ConfigDiff:
+    """Compare two instances of a config (or feature-flag) class field by field.
+
+    Either side may be a config instance or its `freeze()`d copy. Values
+    are compared with `==`; secret fields are reported as changed with both
+    values shown as `"***"`.
+
+    Args:
+        old: The current config.
+        new: The candidate config.
+
+    Raises:
+        TypeError: If `old` and `new` are not of the same config class.
+    """
+    old_class, new_class = _config_class(old), _config_class(new)
+    if old_class is new_class or issubclass(new_class, old_class):
+        config_class = old_class
+    elif issubclass(old_class, new_class):
+        config_class = new_class
+    else:
+        raise TypeError(f"cannot diff {old_class.__name__} against {new_class.__name__}")
+    old_frozen, new_frozen = isinstance(old, FrozenConfig), isinstance(new, FrozenConfig)
+    # One C-level comparison settles the common, unchanged case.
+    if old_frozen and new_frozen:
+        if tuple.__eq__(old, new):
+            return ConfigDiff(config_class, (), new)
+    elif not old_frozen and not new_frozen and old.__dict__ == new.__dict__:
+        return ConfigDiff(config_class, (), new)
+    differ = _get_differ(config_class)
+    old_values, new_values = _values(differ, old), _values(differ, new)
+    if old_frozen is not new_frozen:
+        # Compare a frozen copy with a live config in frozen form (lists as tuples).
+        if old_frozen:
+            new_values = tuple([_freeze_value(v) for v in new_values])
+        else:
+            old_values = tuple([_freeze_value(v) for v in old_values])
+    return ConfigDiff(config_class, differ.changes(old_values, new_values), new)
+
+
+def _values(differ: _Differ, config: Any) -> tuple[Any, ...]:
+    if isinstance(config, FrozenConfig):
+        # Already the values in field order.
+        return config
+    return differ.values(config.__dict__)
@@ -0,0 +1,108 @@
+"""Prefix-indexed view of the process environment.
+
+pydantic-settings' env source copies and case-folds the whole of
+`os.environ` for every settings instantiation. `EnvironIndex` does that
+once per environment change and hands each config class only the
+variables under its `env_prefix`, so a lookup costs O(fields) rather than
+O(environ).
+
+Changes are detected by comparing the environment with the snapshot the
+index was built from. On CPython that is a C-level comparison of the
+encoded variables, with no decoding. Call `EnvironIndex.refresh(force=True)`
+to rebuild unconditionally.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+
+def _raw_environ() -> Any:
+    """The mapping backing `os.environ` (encoded on CPython), snapshotted on rebuild."""
+    return getattr(os.environ, "_data", os.environ)
+
+
+class EnvironIndex:
+    """Case-folded environment index partitioned by upper-cased prefix.
+
+    The index is rebuilt lazily when the environment differs from the
+    snapshot it was built from. Per-prefix views are computed on first
+    request and shared (read-only) until the next change.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snapshot: dict[Any, Any] | None = None
+        self._source: Any = None
+        self._environ: dict[str, str] = {}
+        self._folded: dict[str, str] = {}
+        self._views: dict[tuple[str, bool], Mapping[str, str]] = {}
+        self.generation = 0
+
+    def _is_stale(self) -> bool:
+        snapshot = self._snapshot
+        if snapshot is None or os.environ is not self._source:
+            return True
+        raw = _raw_environ()
+        return len(snapshot) != len(raw) or snapshot != raw
+
+    def _rebuild(self) -> None:
+        self._source = os.environ
+        raw = _raw_environ()
+        self._snapshot = dict(raw)
+        self._environ = dict(os.environ)
+        self._folded = {k.lower(): v for k, v in self._environ.items()}
+        self._views = {}
+        self.generation += 1
+
+    def refresh(self, force: bool = False) -> bool:
+        """Rebuild the index if the environment changed. Returns True if it did.
+
+        Args:
+            force: Rebuild unconditionally, e.g. after writing to
+                `os.environ._data` directly.
+        """
+        if not force and not self._is_stale():
+            return False
+        with self._lock:
+            if not force and not self._is_stale():
+                return False
+            self._rebuild()
+            return True
+
+    def lookup(
+        self, prefix: str = "", case_sensitive: bool = False, refresh: bool = True
+    ) -> Mapping[str, str]:
+        """Return a read-only mapping of the variables starting with `prefix`.
+
+        Args:
+            prefix: Env prefix (matched case-insensitively unless `case_sensitive`).
+            case_sensitive: If False, keys are lower-cased as pydantic-settings
+                expects; otherwise they keep their original case.
+            refresh: Check the environment for changes first. Callers that
+                just refreshed (see `sources.shared_sources`) can skip it.
+        """
+        if refresh or self._snapshot is None:
+            self.refresh()
+        key = (prefix if case_sensitive else prefix.upper(), case_sensitive)
+        view = self._views.get(key)
+        if view is None:
+            with self._lock:
+                source = self._environ if case_sensitive else self._folded
+                if not prefix:
+                    view = MappingProxyType(source)
+                else:
+                    match = prefix if case_sensitive else prefix.lower()
+                    view = MappingProxyType(
+                        {k: v for k, v in source.items() if k.startswith(match)}
+                    )
+                self._views[key] = view
+        return view
+
+
+environ_index = EnvironIndex()
+"""Process-wide index shared by all config classes."""
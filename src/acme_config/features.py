@@ -1,33 +1,153 @@
 """Feature flag support.
 
 Apps subclass `FeatureFlags` to declare boolean features that can be
-toggled via environment variables.
+toggled via environment variables. Flags may also carry a percentage
+rollout and allow/deny lists, evaluated per entity with `evaluate()`.
+`LiveFeatureFlags` keeps an instance up to date as the environment and
+`.env` files change.
 """
 
 from __future__ import annotations
 
-from typing import Any
+import hashlib
+import logging
+import os
+import threading
+import weakref
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+from acme_config.environ import environ_index
+from acme_config.metadata import get_config_meta
+from acme_config.sources import _ValidateStage, settings_init
+from acme_config.watch import FileWatcher
+
+logger = logging.getLogger(__name__)
+
 
 def FeatureFlag(
     default: bool = False,
     *,
     description: str = "",
+    rollout: float | None = None,
+    allow: Iterable[str | int] | None = None,
+    deny: Iterable[str | int] | None = None,
+    reload: Literal["hot", "restart"] = "hot",
     **kwargs: Any,
 ) -> Any:
     """Declare a feature flag.
 
+    The flag's value is a global switch. While it is on, `evaluate()`
+    decides per entity: `deny` wins over `allow`, listed entities skip the
+    rollout, and everyone else is enabled if their stable hash falls in
+    the first `rollout` percent.
+
     Args:
         default: Whether the feature is enabled by default.
         description: Human-readable description of the feature.
+        rollout: Percentage (0-100) of entities to enable. None means all.
+        allow: Entity IDs that are always enabled while the flag is on.
+            Ints are converted with `str()`, as `evaluate()` does.
+        deny: Entity IDs that are never enabled, converted likewise.
+        reload: "hot" (the default; see `LiveFeatureFlags`) or "restart",
+            as reported by `diff_config()`.
+
+    Raises:
+        ValueError: If `rollout` is outside 0-100, or `reload` is not
+            "hot" or "restart".
     """
+    if rollout is not None and not 0 <= rollout <= 100:
+        raise ValueError(f"rollout must be between 0 and 100, got {rollout}")
+    if reload not in ("hot", "restart"):
+        raise ValueError(f"reload must be 'hot' or 'restart', got {reload!r}")
+    extra = dict(kwargs.pop("json_schema_extra", None) or {})
+    extra["reload"] = reload
+    if rollout is not None or allow is not None or deny is not None:
+        extra["rollout"] = rollout
+        extra["allow"] = sorted(str(e) for e in allow or ())
+        extra["deny"] = sorted(str(e) for e in deny or ())
+    kwargs["json_schema_extra"] = extra
     return Field(default=default, description=description, **kwargs)
 
 
-class FeatureFlags(BaseSettings):
+class _Targeting:
+    """Compiled rollout and allow/deny rules for one flag."""
+
+    __slots__ = ("allow", "deny", "threshold", "_hasher")
+
+    # Hashes are 64-bit; an entity is in the rollout if its hash < threshold.
+    _SPACE = 1 << 64
+
+    def __init__(self, flag_name: str, rollout: float | None, allow: Any, deny: Any) -> None:
+        self.allow: frozenset[str] = frozenset(allow or ())
+        self.deny: frozenset[str] = frozenset(deny or ())
+        self.threshold: int = self._SPACE if rollout is None else int(rollout * self._SPACE) // 100
+        # The flag name salts the hash so each flag samples its own population.
+        # blake2b is used for stability: the bucket an entity lands in must not
+        # change across processes, Python versions or platforms.
+        self._hasher = hashlib.blake2b(f"{flag_name}:".encode(), digest_size=8)
+
+    def bucket(self, entity_id: str) -> int:
+        """Stable 64-bit hash of an entity ID for this flag."""
+        hasher = self._hasher.copy()
+        hasher.update(entity_id.encode())
+        return int.from_bytes(hasher.digest())
+
+    def __call__(self, entity_id: str) -> bool:
+        if entity_id in self.deny:
+            return False
+        if entity_id in self.allow or self.threshold >= self._SPACE:
+            return True
+        if self.threshold <= 0:
+            return False
+        return self.bucket(entity_id) < self.threshold
+
+    def many(self, entity_ids: Sequence[str]) -> list[bool]:
+        """Evaluate the rules for many entities, in input order."""
+        allow, deny, threshold = self.allow, self.deny, self.threshold
+        if threshold >= self._SPACE:
+            return [e not in deny for e in entity_ids]
+        if threshold <= 0:
+            return [e in allow and e not in deny for e in entity_ids]
+        copy = self._hasher.copy
+        results = []
+        for entity_id in entity_ids:
+            if entity_id in deny:
+                results.append(False)
+            elif entity_id in allow:
+                results.append(True)
+            else:
+                hasher = copy()
+                hasher.update(entity_id.encode())
+                results.append(int.from_bytes(hasher.digest()) < threshold)
+        return results
+
+
+# Compiled rules per class, tagged with the ConfigMeta they were built from
+# so a `model_rebuild()` recompiles them.
+_TARGETING: weakref.WeakKeyDictionary[type, tuple[Any, dict[str, _Targeting]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _compile_targeting(flags_class: type[FeatureFlags]) -> dict[str, _Targeting]:
+    meta = get_config_meta(flags_class)
+    cached = _TARGETING.get(flags_class)
+    if cached is not None and cached[0] is meta:
+        return cached[1]
+    rules: dict[str, _Targeting] = {}
+    for name, field_info in flags_class.__pydantic_fields__.items():
+        extra = field_info.json_schema_extra
+        if isinstance(extra, dict) and name in meta.flag_bits and "rollout" in extra:
+            rules[name] = _Targeting(name, extra["rollout"], extra["allow"], extra["deny"])
+    _TARGETING[flags_class] = (meta, rules)
+    return rules
+
+
+class FeatureFlags(BaseSettings, _ValidateStage):
     """Base class for feature flag declarations.
 
     Subclass this and declare boolean fields for each feature.
@@ -50,6 +170,50 @@ class FeatureFlags(BaseSettings):
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8", "extra": "ignore"}
 
+    __init__ = settings_init
+
+    # Compiled flag state, filled lazily and dropped on any assignment.
+    # `_flag_mask` packs the bool fields into an int (see `as_mask`), and
+    # `_flag_state` maps each bool-valued flag to its bit, pre-tested
+    # against the mask, so `is_enabled` is a single dict lookup.
+    # `_flag_rules` holds the class's compiled rollout/targeting rules.
+    __slots__ = ("_flag_state", "_flag_mask", "_flag_rules")
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        _compile_targeting(cls)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        self._reset_flags()
+
+    def _reset_flags(self) -> None:
+        try:
+            object.__delattr__(self, "_flag_state")
+            object.__delattr__(self, "_flag_mask")
+        except AttributeError:
+            pass
+
+    def _compile_flags(self) -> dict[str, bool]:
+        bits = get_config_meta(type(self)).flag_bits
+        values = self.__dict__
+        mask = 0
+        for name, bit in bits.items():
+            if values.get(name) is True:
+                mask |= bit
+        # Fields set without validation (e.g. `model_construct`) may hold
+        # non-bools; leave those to the getattr path so they raise TypeError.
+        state = {
+            name: (mask & bit) != 0
+            for name, bit in bits.items()
+            if isinstance(values.get(name), bool)
+        }
+        object.__setattr__(self, "_flag_rules", _compile_targeting(type(self)))
+        object.__setattr__(self, "_flag_mask", mask)
+        object.__setattr__(self, "_flag_state", state)
+        return state
+
     def is_enabled(self, flag_name: str) -> bool:
         """Check if a feature flag is enabled by name.
 
@@ -58,12 +222,81 @@ class FeatureFlags(BaseSettings):
 
         Raises:
             AttributeError: If the flag doesn't exist.
+            TypeError: If the field is not a boolean.
         """
+        try:
+            state = self._flag_state
+        except AttributeError:
+            state = self._compile_flags()
+        enabled = state.get(flag_name)
+        if enabled is not None:
+            return enabled
         value = getattr(self, flag_name)
         if not isinstance(value, bool):
             raise TypeError(f"Flag '{flag_name}' is not a boolean field")
         return value
 
+    def evaluate(self, flag_name: str, entity_id: str | int) -> bool:
+        """Check whether a flag is enabled for one entity (user, tenant, ...).
+
+        Flags without rollout or allow/deny rules behave like `is_enabled`.
+
+        Args:
+            flag_name: The field name of the flag.
+            entity_id: Entity key; ints are converted with `str()`.
+
+        Raises:
+            AttributeError: If the flag doesn't exist.
+            TypeError: If the field is not a boolean.
+        """
+        try:
+            state, rules = self._flag_state, self._flag_rules
+        except AttributeError:
+            state = self._compile_flags()
+            rules = self._flag_rules
+        enabled = state.get(flag_name)
+        if enabled is None:
+            enabled = self.is_enabled(flag_name)
+        if not enabled:
+            return False
+        rule = rules.get(flag_name)
+        if rule is None:
+            return True
+        return rule(entity_id if isinstance(entity_id, str) else str(entity_id))
+
+    def evaluate_many(self, flag_name: str, entity_ids: Iterable[str | int]) -> list[bool]:
+        """Evaluate one flag for many entities. See `evaluate`.
+
+        Returns:
+            One result per entity, in input order.
+        """
+        ids = [e if isinstance(e, str) else str(e) for e in entity_ids]
+        if not self.is_enabled(flag_name):
+            return [False] * len(ids)
+        rule = self._flag_rules.get(flag_name)
+        if rule is None:
+            return [True] * len(ids)
+        return rule.many(ids)
+
+    def as_mask(self) -> int:
+        """Return the enabled flags packed into an int.
+
+        Bit `i` is the `i`-th `bool` field in declaration order.
+        """
+        try:
+            return self._flag_mask
+        except AttributeError:
+            self._compile_flags()
+            return self._flag_mask
+
+    def enabled_set(self) -> frozenset[str]:
+        """Return the names of all enabled flags."""
+        try:
+            state = self._flag_state
+        except AttributeError:
+            state = self._compile_flags()
+        return frozenset(name for name, enabled in state.items() if enabled)
+
 
 def list_flags(features: FeatureFlags) -> list[dict[str, Any]]:
     """List all feature flags with their current state.
@@ -72,14 +305,159 @@ def list_flags(features: FeatureFlags) -> list[dict[str, Any]]:
     Useful for admin/debug endpoints.
     """
     result: list[dict[str, Any]] = []
-    for name, field_info in features.__class__.model_fields.items():
-        value = getattr(features, name)
+    for field in get_config_meta(features.__class__).fields:
+        value = getattr(features, field.name)
         if not isinstance(value, bool):
             continue
         result.append({
-            "name": name,
+            "name": field.name,
             "value": value,
-            "description": field_info.description or "",
-            "default": field_info.default,
+            "description": field.description,
+            "default": field.default,
         })
     return result
+
+
+class LiveFeatureFlags[F: FeatureFlags]:
+    """Feature flags that reload while the process runs.
+
+    A background thread watches the class's `.env` file(s) (inotify where
+    available, stat polling otherwise) and the process environment, and
+    rebuilds the flags when either changes. Each rebuild is published by
+    swapping a single reference, so readers never lock: `flags.current`
+    always returns a complete, immutable-in-practice snapshot.
+
+    Example::
+
+        live = LiveFeatureFlags(MyFeatures)
+        live.subscribe(lambda old, new: log.info("flags now %s", new.enabled_set()))
+        if live.is_enabled("new_dashboard"):
+            ...
+        live.close()
+
+    Args:
+        flags_class: The FeatureFlags subclass to load.
+        env_file: .env file(s) to load and watch. If None, uses the class default.
+        poll_interval: Seconds between stat/environment checks.
+        use_inotify: Set to False to force stat polling.
+        start: Start the watcher thread immediately.
+    """
+
+    def __init__(
+        self,
+        flags_class: type[F],
+        env_file: str | os.PathLike[str] | Sequence[str | os.PathLike[str]] | None = None,
+        *,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+        start: bool = True,
+    ) -> None:
+        self.flags_class = flags_class
+        self._init_kwargs: dict[str, Any] = {} if env_file is None else {"_env_file": env_file}
+        if env_file is None:
+            env_file = flags_class.model_config.get("env_file")
+        if env_file is None:
+            paths: list[str | os.PathLike[str]] = []
+        elif isinstance(env_file, (str, os.PathLike)):
+            paths = [env_file]
+        else:
+            paths = list(env_file)
+        self._watcher = FileWatcher(paths, poll_interval=poll_interval, use_inotify=use_inotify)
+        self._lock = threading.Lock()
+        self._callbacks: tuple[Callable[[F, F], None], ...] = ()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        environ_index.refresh()
+        self._env_generation = environ_index.generation
+        self._snapshot: F = flags_class(**self._init_kwargs)
+        if start:
+            self.start()
+
+    @property
+    def current(self) -> F:
+        """The latest flags snapshot. Do not mutate it; it is shared by all readers."""
+        return self._snapshot
+
+    def is_enabled(self, flag_name: str) -> bool:
+        """Check a flag against the latest snapshot. See `FeatureFlags.is_enabled`."""
+        return self._snapshot.is_enabled(flag_name)
+
+    def subscribe(self, callback: Callable[[F, F], None]) -> Callable[[], None]:
+        """Call `callback(old, new)` after each change. Returns an unsubscribe function.
+
+        Callbacks run on the thread that performed the reload; exceptions
+        they raise are logged and do not stop other callbacks.
+        """
+        with self._lock:
+            self._callbacks = (*self._callbacks, callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                self._callbacks = tuple(cb for cb in self._callbacks if cb is not callback)
+
+        return unsubscribe
+
+    def reload(self) -> bool:
+        """Rebuild the flags now. Returns True if any value changed.
+
+        Raises:
+            ValidationError: If the new values are invalid; the previous
+                snapshot stays in place.
+        """
+        with self._lock:
+            environ_index.refresh()
+            self._env_generation = environ_index.generation
+            new = self.flags_class(**self._init_kwargs)
+            old = self._snapshot
+            if new.__dict__ == old.__dict__:
+                return False
+            self._snapshot = new
+            callbacks = self._callbacks
+        for callback in callbacks:
+            try:
+                callback(old, new)
+            except Exception:
+                logger.exception("Feature flag subscriber %r failed", callback)
+        return True
+
+    def _environ_changed(self) -> bool:
+        environ_index.refresh()
+        return environ_index.generation != self._env_generation
+
+    def _run(self) -> None:
+        watcher = self._watcher
+        try:
+            while not self._stop.is_set():
+                changed = watcher.wait(watcher.poll_interval)
+                if self._stop.is_set():
+                    break
+                if changed or self._environ_changed():
+                    try:
+                        self.reload()
+                    except Exception:
+                        logger.exception("Reloading %s failed", self.flags_class.__name__)
+        finally:
+            watcher.close()
+
+    def start(self) -> None:
+        """Start the background watcher thread (no-op if already running)."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name=f"LiveFeatureFlags-{self.flags_class.__name__}", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the watcher thread. May block for up to `poll_interval` seconds."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        else:
+            self._watcher.close()
+
+    def __enter__(self) -> LiveFeatureFlags[F]:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,33 @@
+"""File helpers shared by the library and the `ac` command.
+
+Kept free of pydantic and boto3 imports so the CLI can use them without
+slowing down its startup.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+
+def atomic_write(path: str | os.PathLike[str], data: bytes) -> None:
+    """Replace `path` with `data` so readers see the old or the new file, never a partial one.
+
+    The data is written to a temporary file in the same directory, which
+    then replaces `path`. Missing parent directories are created. The new
+    file is readable by its owner only.
+
+    Args:
+        path: Destination file.
+        data: The complete file contents.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
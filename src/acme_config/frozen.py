@@ -0,0 +1,188 @@
+"""Immutable, compact snapshots of resolved config instances.
+
+`freeze(config)` turns a config into a `FrozenConfig`: a tuple holding the
+field values in declaration order, with one generated subclass per config
+class providing attribute access. Compared with the pydantic model it has
+no per-instance `__dict__`, cannot be mutated, is hashable (when its values
+are), and interns string values so tenants sharing a bucket name or region
+share one string object.
+
+Pickling sends the config class by reference plus the bare value tuple, so
+field names are not repeated per instance::
+
+    frozen = freeze(config)
+    frozen.bucket                  # attribute access, like the config
+    pickle.dumps(frozen)           # class reference + values only
+    frozen.thaw()                  # back to a validated config instance
+"""
+
+from __future__ import annotations
+
+import sys
+import weakref
+from operator import itemgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from acme_config.metadata import get_config_meta
+
+if TYPE_CHECKING:
+    from pydantic_settings import BaseSettings
+
+    from acme_config.metadata import ConfigMeta
+
+
+def _freeze_value(value: Any) -> Any:
+    """Return an immutable equivalent of `value`, interning strings."""
+    cls = type(value)
+    if cls is str:
+        return sys.intern(value)
+    if cls is list or cls is tuple:
+        return tuple([_freeze_value(item) for item in value])
+    if cls is set or cls is frozenset:
+        return frozenset([_freeze_value(item) for item in value])
+    if cls is dict or cls is MappingProxyType:
+        return MappingProxyType({_freeze_value(k): _freeze_value(v) for k, v in value.items()})
+    return value
+
+
+def _thaw_value(value: Any) -> Any:
+    """Undo `_freeze_value` for mappings, which cannot be pickled as proxies."""
+    cls = type(value)
+    if cls is MappingProxyType:
+        return {k: _thaw_value(v) for k, v in value.items()}
+    if cls is tuple:
+        return tuple([_thaw_value(item) for item in value])
+    return value
+
+
+class FrozenConfig(tuple):
+    """Immutable, tuple-backed view of a config instance.
+
+    Do not instantiate directly; use `freeze`. Each config class gets its
+    own subclass (see `frozen_type`) with one read-only property per field.
+    Instances compare equal only to frozen instances of the same class with
+    equal values. Lists become tuples, sets frozensets and dicts read-only
+    mappings; configs holding mappings are therefore not hashable.
+
+    Attributes:
+        config_class: The config class this was frozen from.
+        field_names: Field names in tuple order.
+    """
+
+    __slots__ = ()
+
+    config_class: type[BaseSettings]
+    field_names: tuple[str, ...]
+    _meta: ConfigMeta
+
+    def __new__(cls, values: Any = ()) -> FrozenConfig:
+        values = tuple(values)
+        if len(values) != len(cls.field_names):
+            raise ValueError(
+                f"{cls.__name__} expects {len(cls.field_names)} values, got {len(values)}"
+            )
+        return super().__new__(cls, values)
+
+    def __eq__(self, other: object) -> bool:
+        # Not NotImplemented: tuple.__eq__ would then match a plain tuple.
+        return type(self) is type(other) and tuple.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        return tuple.__hash__(self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        parts = []
+        for field, value in zip(self._meta.fields, self, strict=True):
+            parts.append(f"{field.name}={'***' if field.secret else repr(value)}")
+        return f"{type(self).__name__}({', '.join(parts)})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Class by reference and values by position: no repeated field names.
+        return (_restore, (self.config_class, tuple([_thaw_value(v) for v in self])))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the values keyed by field name (mappings as plain dicts)."""
+        return {name: _thaw_value(v) for name, v in zip(self.field_names, self, strict=True)}
+
+    def thaw(self) -> BaseSettings:
+        """Rebuild a config instance from the frozen values.
+
+        Values are validated against the config class, but no source
+        (.env, environment, Parameter Store) is read.
+        """
+        from acme_config.resolver import _validate_values
+
+        return _validate_values(self.config_class, self.as_dict())
+
+
+# Field names that would shadow FrozenConfig's own attributes and methods.
+_RESERVED_NAMES = frozenset(
+    ["config_class", "field_names", *(name for name in dir(FrozenConfig) if name[0] != "_")]
+)
+
+# Keyed weakly by config class so generated types go away with the class.
+_FROZEN_TYPES: weakref.WeakKeyDictionary[type, type[FrozenConfig]] = weakref.WeakKeyDictionary()
+
+
+def frozen_type(config_class: type[BaseSettings]) -> type[FrozenConfig]:
+    """Return the `FrozenConfig` subclass for `config_class`, creating it on first use.
+
+    Raises:
+        TypeError: If a field is named like a `FrozenConfig` attribute or
+            method (`count`, `index`, `as_dict`, `thaw`, `config_class` or
+            `field_names`).
+    """
+    meta = get_config_meta(config_class)
+    frozen_cls = _FROZEN_TYPES.get(config_class)
+    if frozen_cls is not None and frozen_cls._meta is meta:
+        return frozen_cls
+    clashes = sorted(_RESERVED_NAMES.intersection(meta.by_name))
+    if clashes:
+        raise TypeError(
+            f"cannot freeze {config_class.__name__}: field(s) {', '.join(clashes)} "
+            "would shadow FrozenConfig attributes"
+        )
+    namespace: dict[str, Any] = {
+        "__slots__": (),
+        "__module__": config_class.__module__,
+        "__qualname__": f"Frozen{config_class.__qualname__}",
+        "config_class": config_class,
+        "field_names": tuple(f.name for f in meta.fields),
+        "_meta": meta,
+    }
+    for index, field in enumerate(meta.fields):
+        namespace[field.name] = property(itemgetter(index), doc=field.description or None)
+    frozen_cls = type(f"Frozen{config_class.__name__}", (FrozenConfig,), namespace)
+    _FROZEN_TYPES[config_class] = frozen_cls
+    return frozen_cls
+
+
+def freeze(config: BaseSettings) -> FrozenConfig:
+    """Return an immutable, compact copy of a config or feature-flag instance.
+
+    String values (including inside lists, sets and dicts) are interned, so
+    equal strings across many frozen configs share one object.
+
+    Args:
+        config: An `AppConfig` or `FeatureFlags` instance.
+    """
+    frozen_cls = frozen_type(type(config))
+    values = config.__dict__
+    return tuple.__new__(frozen_cls, [_freeze_value(values[n]) for n in frozen_cls.field_names])
+
+
+def _restore(config_class: type[BaseSettings], values: tuple[Any, ...]) -> FrozenConfig:
+    frozen_cls = frozen_type(config_class)
+    if len(values) != len(frozen_cls.field_names):
+        raise ValueError(
+            f"{config_class.__name__} has changed since this snapshot was pickled: "
+            f"expected {len(frozen_cls.field_names)} values, got {len(values)}"
+        )
+    return tuple.__new__(frozen_cls, [_freeze_value(v) for v in values])
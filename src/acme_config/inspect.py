@@ -1,15 +1,49 @@
 """Config inspection utilities.
 
-Generate manifests, dotenv templates, validate environments, and
-describe config instances with secret redaction.
+Generate manifests (streamed and incrementally updated for many
+classes), dotenv templates, validate environments (one, or
+many env files in bulk), and describe config instances with secret
+redaction.
 """
 
 from __future__ import annotations
 
-from typing import Any
+import os
+import tempfile
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TextIO
 
-from acme_config.resolver import _get_field_metadata
-from acme_config.schema import AppConfig
+from acme_config.envfile import load_env_mapping
+from acme_config.metadata import get_config_meta
+
+if TYPE_CHECKING:
+    from pydantic import ValidationError
+    from pydantic.fields import FieldInfo
+    from pydantic_settings import BaseSettings
+
+    from acme_config.metadata import FieldMeta
+    from acme_config.schema import AppConfig
+
+EnvSource = str | os.PathLike[str] | Mapping[str, str | None]
+
+
+def _manifest_line(field: FieldMeta) -> str:
+    env_var = field.env_var
+    desc = field.description
+    if field.required:
+        suffix = "# required"
+    elif field.default is not None:
+        suffix = f"# default={field.default}"
+    else:
+        suffix = "# optional"
+    if field.secret:
+        suffix += " [secret]"
+
+    line = f"{env_var}  {suffix}"
+    if desc:
+        line = f"{env_var}  # {desc} [{suffix.lstrip('# ')}]"
+    return line
 
 
 def generate_manifest(config_class: type[AppConfig]) -> str:
@@ -24,56 +58,157 @@ def generate_manifest(config_class: type[AppConfig]) -> str:
         "# Format: ENV_VAR_NAME  # description [required|default=value]",
         "",
     ]
+    lines.extend(_manifest_line(field) for field in get_config_meta(config_class).fields)
+    return "\n".join(lines) + "\n"
 
-    prefix = config_class.model_config.get("env_prefix", "")
-    metadata = _get_field_metadata(config_class)
 
-    for field_name, meta in metadata.items():
-        env_var = f"{prefix}{field_name}".upper()
-        desc = meta["description"]
-        if meta["required"]:
-            suffix = "# required"
-        elif meta["default"] is not None:
-            suffix = f"# default={meta['default']}"
-        else:
-            suffix = "# optional"
-        if meta["secret"]:
-            suffix += " [secret]"
+_MANIFEST_HEADER = (
+    "# Environment variable manifest\n",
+    "# Format: ENV_VAR_NAME  # description [required|default=value]\n",
+    "\n",
+)
+_SECTION_PREFIX = "# == "
 
-        line = f"{env_var}  {suffix}"
-        if desc:
-            line = f"{env_var}  # {desc} [{suffix.lstrip('# ')}]"
-        lines.append(line)
 
-    return "\n".join(lines) + "\n"
+def _section_key(config_class: type) -> str:
+    return f"{config_class.__module__}.{config_class.__qualname__}"
 
 
-def generate_dotenv_template(config_class: type[AppConfig]) -> str:
-    """Generate a .env.example template from a config class."""
-    lines = [
-        f"# .env template for {config_class.__name__}",
-        "# Copy to .env and fill in values",
-        "",
+def read_manifest_sections(lines: Iterable[str]) -> dict[str, tuple[str, list[str]]]:
+    """Split a manifest written by `write_manifest` into its per-class sections.
+
+    Args:
+        lines: The manifest's lines, with line endings (e.g. an open file).
+
+    Returns:
+        Class key (`module.QualName`) mapped to (schema hash, section lines).
+    """
+    sections: dict[str, tuple[str, list[str]]] = {}
+    current: list[str] | None = None
+    for line in lines:
+        if line.startswith(_SECTION_PREFIX):
+            key, _, schema = line[len(_SECTION_PREFIX) :].rstrip("\n").partition(" schema=")
+            current = [line]
+            sections[key] = (schema, current)
+        elif current is not None:
+            current.append(line)
+    return sections
+
+
+def iter_manifest_lines(
+    config_classes: Iterable[type[BaseSettings]],
+    previous: Mapping[str, tuple[str, list[str]]] | None = None,
+) -> Iterator[str]:
+    """Yield a multi-class manifest line by line (each ending in a newline).
+
+    Every class gets a section headed by `# == module.QualName schema=<hash>`,
+    where the hash is `ConfigMeta.schema_hash`. Sections in `previous` (see
+    `read_manifest_sections`) whose hash still matches are yielded verbatim
+    instead of being regenerated.
+
+    Args:
+        config_classes: `AppConfig` and/or `FeatureFlags` subclasses, in output order.
+        previous: Sections of an earlier manifest to reuse.
+    """
+    for section in _manifest_sections(config_classes, previous):
+        yield from section.splitlines(keepends=True)
+
+
+def _manifest_sections(
+    config_classes: Iterable[type[BaseSettings]],
+    previous: Mapping[str, tuple[str, list[str]]] | None,
+) -> Iterator[str]:
+    """Yield the manifest header, then one string per class section."""
+    yield "".join(_MANIFEST_HEADER)
+    for config_class in config_classes:
+        meta = get_config_meta(config_class)
+        key = _section_key(config_class)
+        old = previous.get(key) if previous else None
+        if old is not None and old[0] == meta.schema_hash:
+            yield "".join(old[1])
+            continue
+        lines = [f"{_SECTION_PREFIX}{key} schema={meta.schema_hash}"]
+        lines.extend(_manifest_line(field) for field in meta.fields)
+        lines.append("\n")
+        yield "\n".join(lines)
+
+
+def write_manifest(
+    fp: TextIO,
+    config_classes: Iterable[type[BaseSettings]],
+    previous: Mapping[str, tuple[str, list[str]]] | None = None,
+) -> None:
+    """Stream a multi-class manifest to an open text file.
+
+    See `iter_manifest_lines`; nothing beyond one class's lines is held in memory
+    (apart from reused `previous` sections).
+    """
+    # Written a section at a time: one write per class rather than per line.
+    fp.writelines(_manifest_sections(config_classes, previous))
+
+
+def update_manifest(
+    path: str | os.PathLike[str], config_classes: Iterable[type[BaseSettings]]
+) -> list[str]:
+    """Regenerate a manifest file, rewriting only classes whose schema changed.
+
+    Sections of unchanged classes are copied byte for byte. The file is
+    replaced atomically, and left untouched when nothing changed.
+
+    Returns:
+        Keys (`module.QualName`) of the classes that were (re)generated.
+    """
+    classes = list(config_classes)
+    try:
+        with open(path, encoding="utf-8", newline="") as f:
+            previous = read_manifest_sections(f)
+    except FileNotFoundError:
+        previous = {}
+    keys = [_section_key(cls) for cls in classes]
+    changed = [
+        key
+        for key, cls in zip(keys, classes, strict=True)
+        if key not in previous or previous[key][0] != get_config_meta(cls).schema_hash
     ]
+    if not changed and keys == list(previous):
+        return []
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".tmp-")
+    try:
+        with open(fd, "w", encoding="utf-8", newline="") as f:
+            write_manifest(f, classes, previous)
+        os.chmod(tmp, 0o644)  # mkstemp creates files private to the owner
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return changed
 
-    prefix = config_class.model_config.get("env_prefix", "")
-    metadata = _get_field_metadata(config_class)
 
-    for field_name, meta in metadata.items():
-        env_var = f"{prefix}{field_name}".upper()
-        desc = meta["description"]
+def iter_dotenv_template_lines(config_class: type[AppConfig]) -> Iterator[str]:
+    """Yield `generate_dotenv_template`'s output line by line (each ending in a newline)."""
+    yield f"# .env template for {config_class.__name__}\n"
+    yield "# Copy to .env and fill in values\n"
+    yield "\n"
+
+    for field in get_config_meta(config_class).fields:
+        env_var = field.env_var
+        desc = field.description
         if desc:
-            lines.append(f"# {desc}")
+            yield f"# {desc}\n"
 
-        if meta["required"]:
-            lines.append(f"{env_var}=")
-        elif meta["default"] is not None:
-            lines.append(f"# {env_var}={meta['default']}")
+        if field.required:
+            yield f"{env_var}=\n"
+        elif field.default is not None:
+            yield f"# {env_var}={field.default}\n"
         else:
-            lines.append(f"# {env_var}=")
-        lines.append("")
+            yield f"# {env_var}=\n"
+        yield "\n"
 
-    return "\n".join(lines)
+
+def generate_dotenv_template(config_class: type[AppConfig]) -> str:
+    """Generate a .env.example template from a config class."""
+    # The line-joined form has no newline after the final blank line.
+    return "".join(iter_dotenv_template_lines(config_class))[:-1]
 
 
 def validate_env(config_class: type[AppConfig]) -> list[str]:
@@ -81,35 +216,247 @@ def validate_env(config_class: type[AppConfig]) -> list[str]:
 
     Returns a list of issue descriptions. Empty list means all is well.
     """
-    issues: list[str] = []
+    from pydantic import ValidationError
 
     try:
         config_class()
+    except ValidationError as e:
+        return [str(issue) for issue in _issues_from_error(config_class, e, "environment")]
     except Exception as e:
-        # Parse pydantic validation errors
-        error_str = str(e)
-        for line in error_str.splitlines():
-            line = line.strip()
-            if line and not line.startswith("For further"):
-                issues.append(line)
+        # e.g. a complex field whose env value is not valid JSON
+        return [str(e)]
+    return []
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationIssue:
+    """One problem found while validating a config source.
 
+    Attributes:
+        source: The env file path, or `<mapping N>` for the Nth mapping passed in.
+        field: Field name, or None for errors not tied to one field.
+        env_var: Env var the field is read from, or None.
+        type: Pydantic error type, e.g. "missing" or "int_parsing".
+        message: Human-readable description.
+        input: The offending input value (None for missing fields).
+    """
+
+    source: str
+    field: str | None
+    env_var: str | None
+    type: str
+    message: str
+    input: Any = None
+
+    def __str__(self) -> str:
+        where = f"{self.env_var} ({self.field})" if self.env_var else self.field or "config"
+        return f"{where}: {self.message} [type={self.type}]"
+
+
+def _issues_from_error(
+    config_class: type[BaseSettings], error: ValidationError, source: str
+) -> list[ValidationIssue]:
+    by_name = get_config_meta(config_class).by_name
+    issues = []
+    for detail in error.errors(include_url=False):
+        loc = detail["loc"]
+        field = by_name.get(loc[0]) if loc and isinstance(loc[0], str) else None
+        issues.append(
+            ValidationIssue(
+                source=source,
+                field=field.name if field else None,
+                env_var=field.env_var if field else None,
+                type=detail["type"],
+                message=detail["msg"],
+                input=None if detail["type"] == "missing" else detail.get("input"),
+            )
+        )
     return issues
 
 
+class _CompiledValidator:
+    """Validates env mappings for one config class without reading any settings source.
+
+    Env var names are resolved to fields once, and every mapping goes
+    through the class's own compiled pydantic validator (model validators
+    included). With `env_nested_delimiter` set, nested variables such as
+    `PREFIX_DB__HOST` are exploded into their fields by the env source.
+    """
+
+    def __init__(self, config_class: type[BaseSettings]) -> None:
+        from acme_config.sources import IndexedEnvSource
+
+        self.config_class = config_class
+        self._validator = config_class.__pydantic_validator__
+        self._source = IndexedEnvSource(config_class)
+        model_config = config_class.model_config
+        self._ignore_empty = bool(model_config.get("env_ignore_empty"))
+        self._none_str = model_config.get("env_parse_none_str")
+        self._case_sensitive = bool(model_config.get("case_sensitive"))
+        infos = config_class.__pydantic_fields__
+        # env var -> (field name, field info if the value is JSON-decoded)
+        self._lookup: dict[str, tuple[str, FieldInfo | None]] = {}
+        # Complex fields that can also be set through nested variables.
+        self._nested: list[tuple[str, FieldInfo]] = []
+        nested = bool(model_config.get("env_nested_delimiter"))
+        for field in get_config_meta(config_class).fields:
+            info = infos[field.name]
+            names = [field.env_var]
+            for alias in (info.validation_alias, info.alias):
+                if isinstance(alias, str):
+                    names = [alias]
+                    break
+            complex_info = info if self._source.field_is_complex(info) else None
+            if nested and complex_info is not None:
+                self._nested.append((field.name, info))
+            for env_var in names:
+                key = env_var if self._case_sensitive else env_var.upper()
+                self._lookup[key] = (field.name, complex_info)
+
+    def values(self, env: Mapping[str, str | None]) -> dict[str, Any]:
+        """Map env vars onto field names, decoding complex (JSON) values."""
+        data: dict[str, Any] = {}
+        lookup = self._lookup
+        for key, value in env.items():
+            entry = lookup.get(key if self._case_sensitive else key.upper())
+            if entry is None or value is None:
+                continue
+            if self._ignore_empty and value == "":
+                continue
+            name, complex_info = entry
+            if self._none_str is not None and value == self._none_str:
+                data[name] = None
+                continue
+            if complex_info is not None:
+                try:
+                    value = self._source.decode_complex_value(name, complex_info, value)
+                except ValueError:
+                    pass  # left as a string for the validator to report
+            data[name] = value
+        if self._nested:
+            self._explode(env, data)
+        return data
+
+    def _explode(self, env: Mapping[str, str | None], data: dict[str, Any]) -> None:
+        """Merge nested variables into `data`, on top of any JSON value for the field."""
+        from pydantic_settings.sources.utils import parse_env_vars
+
+        env_vars = parse_env_vars(env, self._case_sensitive, self._ignore_empty, self._none_str)
+        for name, info in self._nested:
+            exploded = self._source.explode_env_vars(name, info, env_vars)
+            if not exploded:
+                continue
+            if name not in data:
+                data[name] = exploded
+            elif isinstance(data[name], dict):
+                data[name] = _deep_update(data[name], exploded)
+
+    def validate(self, env: Mapping[str, str | None], source: str) -> list[ValidationIssue]:
+        from pydantic import ValidationError
+
+        instance = self.config_class.__new__(self.config_class)
+        try:
+            self._validator.validate_python(self.values(env), self_instance=instance)
+        except ValidationError as e:
+            return _issues_from_error(self.config_class, e, source)
+        return []
+
+
+def _deep_update(mapping: dict[str, Any], update: Mapping[str, Any]) -> dict[str, Any]:
+    merged = dict(mapping)
+    for key, value in update.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_update(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _load_source(source: EnvSource) -> Mapping[str, str | None]:
+    if isinstance(source, Mapping):
+        return source
+    return load_env_mapping(source, case_sensitive=True)
+
+
+def _label(source: EnvSource, index: int) -> str:
+    return f"<mapping {index}>" if isinstance(source, Mapping) else os.fspath(source)
+
+
+def _check(validator: _CompiledValidator, index: int, source: EnvSource) -> list[ValidationIssue]:
+    label = _label(source, index)
+    try:
+        env = _load_source(source)
+    except OSError as e:
+        return [ValidationIssue(label, None, None, "source_unreadable", str(e))]
+    return validator.validate(env, label)
+
+
+# Set in each worker process by `_init_worker`.
+_worker_validator: _CompiledValidator | None = None
+
+
+def _init_worker(config_class: type[BaseSettings]) -> None:
+    global _worker_validator
+    _worker_validator = _CompiledValidator(config_class)
+
+
+def _check_in_worker(item: tuple[int, EnvSource]) -> list[ValidationIssue]:
+    assert _worker_validator is not None
+    return _check(_worker_validator, *item)
+
+
+def validate_many(
+    config_class: type[BaseSettings],
+    sources: Iterable[EnvSource],
+    *,
+    max_workers: int | None = None,
+    chunksize: int = 64,
+) -> list[ValidationIssue]:
+    """Validate many env files or mappings against one config class.
+
+    Each source is validated on its own: the process environment, the
+    class's default `.env` file and Parameter Store are not consulted, and
+    fields missing from the source fall back to their defaults. The class's
+    validator is compiled once and reused for every source.
+
+    Args:
+        config_class: An `AppConfig` or `FeatureFlags` subclass. Must be
+            importable by module path when `max_workers` is set.
+        sources: .env file paths and/or mappings of env var names to values.
+        max_workers: Validate in this many worker processes. None (the
+            default) validates in this process, which is faster for small batches.
+        chunksize: Sources handed to a worker process at a time.
+
+    Returns:
+        Issues for all sources, in source order. Empty means all sources are valid.
+        Unreadable files are reported with type "source_unreadable".
+    """
+    items = enumerate(sources)
+    if max_workers is None or max_workers <= 1:
+        validator = _CompiledValidator(config_class)
+        return [issue for index, source in items for issue in _check(validator, index, source)]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(config_class,)
+    ) as pool:
+        results = pool.map(_check_in_worker, items, chunksize=chunksize)
+        return [issue for issues in results for issue in issues]
+
+
 def describe_config(config: AppConfig) -> str:
     """Pretty-print a config instance with secret fields redacted.
 
     Useful for startup logging to confirm which config values are active.
     """
     lines: list[str] = [f"{config.__class__.__name__}:"]
-    metadata = _get_field_metadata(config.__class__)
-
-    for field_name, meta in metadata.items():
-        value: Any = getattr(config, field_name)
-        if meta["secret"]:
+    for field in get_config_meta(config.__class__).fields:
+        if field.secret:
             display = "***"
         else:
+            value: Any = getattr(config, field.name)
             display = repr(value)
-        lines.append(f"  {field_name} = {display}")
+        lines.append(f"  {field.name} = {display}")
 
     return "\n".join(lines)
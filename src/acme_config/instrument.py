@@ -0,0 +1,313 @@
+"""Instrumentation hooks for the resolution pipeline.
+
+Register an `Instrumentation` with `set_instrumentation` to receive:
+
+- stage timings: `resolve` (a whole config instantiation), `source` (one
+  settings source; attr `source`), `merge`, `validate`, `envfile.parse`
+  (attr `bytes`), `parameter_store.fetch` (attrs `parameters`, `bytes`),
+  `ssm.call` (legacy backend; attr `operation`) and, from
+  `profile_fields`, `validate.field` (attr `field`);
+- events: `cache.hit` / `cache.miss` (attr `cache`: `envfile`,
+  `parameter_store`, `resolution` or `version`) and `ssm.throttled`.
+
+Stages carry the config class name as attr `config` where there is one.
+Nothing is registered by default, and then each instrumentation point
+costs a function call.
+
+Example::
+
+    stats = StatsInstrumentation()
+    with instrumentation(stats):
+        resolve_config(MyConfig)
+    print(stats.summary())
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pydantic_settings import BaseSettings
+
+
+class Instrumentation:
+    """Base class for instrumentation hooks; every method is a no-op.
+
+    Override `stage` and `event`, and optionally `span` to wrap stages in
+    your own context (e.g. a tracing span).
+    """
+
+    def stage(self, name: str, seconds: float, attrs: Mapping[str, Any]) -> None:
+        """Called when a stage completes, with its wall-clock duration."""
+
+    def event(self, name: str, attrs: Mapping[str, Any]) -> None:
+        """Called for point events such as cache hits and misses."""
+
+    def span(self, name: str, attrs: dict[str, Any]) -> Any:
+        """Return a context manager timing one stage; reports it to `stage`."""
+        return _Timer(self, name, attrs)
+
+
+class _Timer:
+    __slots__ = ("hook", "name", "attrs", "start")
+
+    def __init__(self, hook: Instrumentation, name: str, attrs: dict[str, Any]) -> None:
+        self.hook = hook
+        self.name = name
+        self.attrs = attrs
+        self.start = 0.0
+
+    def __enter__(self) -> dict[str, Any]:
+        self.start = time.perf_counter()
+        return self.attrs
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        seconds = time.perf_counter() - self.start
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.hook.stage(self.name, seconds, self.attrs)
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> dict[str, Any]:
+        # Callers may add attrs to the yielded dict; a fresh one keeps that harmless.
+        return {}
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+# The registered hook; None means instrumentation is off.
+_hook: Instrumentation | None = None
+
+
+def get_instrumentation() -> Instrumentation | None:
+    """Return the registered hook, or None."""
+    return _hook
+
+
+def set_instrumentation(hook: Instrumentation | None) -> Instrumentation | None:
+    """Register `hook` for the whole process (None turns instrumentation off).
+
+    Returns:
+        The previously registered hook.
+    """
+    global _hook
+    previous, _hook = _hook, hook
+    return previous
+
+
+@contextmanager
+def instrumentation(hook: Instrumentation | None) -> Iterator[Instrumentation | None]:
+    """Register `hook` for the duration of a `with` block."""
+    previous = set_instrumentation(hook)
+    try:
+        yield hook
+    finally:
+        set_instrumentation(previous)
+
+
+def enabled() -> bool:
+    """Whether a hook is registered; check before computing costly attrs."""
+    return _hook is not None
+
+
+def span(name: str, **attrs: Any) -> Any:
+    """Time a stage: `with span("validate", config="MyConfig"): ...`.
+
+    The `with` target is the attrs dict, so attrs known only at the end
+    (e.g. byte counts) can be added inside the block.
+    """
+    hook = _hook
+    if hook is None:
+        return _NO_SPAN
+    return hook.span(name, attrs)
+
+
+def record(name: str, seconds: float, **attrs: Any) -> None:
+    """Report a stage that was timed by the caller."""
+    hook = _hook
+    if hook is not None:
+        hook.stage(name, seconds, attrs)
+
+
+def event(name: str, **attrs: Any) -> None:
+    """Report a point event, e.g. `event("cache.hit", cache="envfile")`."""
+    hook = _hook
+    if hook is not None:
+        hook.event(name, attrs)
+
+
+class StatsInstrumentation(Instrumentation):
+    """Aggregates stage timings and event counts in memory.
+
+    `summary()` returns per-stage count, total and max seconds (stages are
+    keyed by name, or `name:source` for sources) and per-event counts (keyed
+    by name, or `name:cache` for cache events).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stages: dict[str, list[float]] = {}
+        self._events: dict[str, int] = {}
+
+    def stage(self, name: str, seconds: float, attrs: Mapping[str, Any]) -> None:
+        key = f"{name}:{attrs['source']}" if "source" in attrs else name
+        with self._lock:
+            entry = self._stages.get(key)
+            if entry is None:
+                self._stages[key] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] = max(entry[2], seconds)
+
+    def event(self, name: str, attrs: Mapping[str, Any]) -> None:
+        key = f"{name}:{attrs['cache']}" if "cache" in attrs else name
+        with self._lock:
+            self._events[key] = self._events.get(key, 0) + 1
+
+    def summary(self) -> dict[str, Any]:
+        """Return `{"stages": {key: {count, total, max}}, "events": {key: count}}`."""
+        with self._lock:
+            return {
+                "stages": {
+                    key: {"count": int(count), "total": total, "max": peak}
+                    for key, (count, total, peak) in self._stages.items()
+                },
+                "events": dict(self._events),
+            }
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        with self._lock:
+            self._stages.clear()
+            self._events.clear()
+
+
+class LoggingInstrumentation(Instrumentation):
+    """Logs every stage and event.
+
+    Args:
+        logger: Logger to use. Defaults to the `acme_config.instrument` logger.
+        level: Log level for all records.
+    """
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.DEBUG) -> None:
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def stage(self, name: str, seconds: float, attrs: Mapping[str, Any]) -> None:
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "%s took %.3f ms %s", name, seconds * 1e3, dict(attrs))
+
+    def event(self, name: str, attrs: Mapping[str, Any]) -> None:
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "%s %s", name, dict(attrs))
+
+
+def _span_attributes(attrs: Mapping[str, Any]) -> dict[str, Any]:
+    # Span attributes must be primitives.
+    return {
+        f"acme_config.{k}": v if isinstance(v, (str, bool, int, float)) else str(v)
+        for k, v in attrs.items()
+    }
+
+
+class _TracerSpan:
+    __slots__ = ("tracer", "name", "attrs", "span", "scope")
+
+    def __init__(self, tracer: Any, name: str, attrs: dict[str, Any]) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.span: Any = None
+        self.scope: Any = None
+
+    def __enter__(self) -> dict[str, Any]:
+        self.scope = self.tracer.start_as_current_span(
+            self.name, attributes=_span_attributes(self.attrs)
+        )
+        self.span = self.scope.__enter__()
+        return self.attrs
+
+    def __exit__(self, *exc_info: Any) -> None:
+        # Attrs added inside the block are set before the span ends.
+        self.span.set_attributes(_span_attributes(self.attrs))
+        self.scope.__exit__(*exc_info)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Reports stages as spans and events as span events, OpenTelemetry style.
+
+    Works with an `opentelemetry.trace.Tracer` or anything with the same
+    `start_as_current_span` / `start_span` methods. Spans are named
+    `acme_config.<stage>`, and events are added to the current span.
+
+    Args:
+        tracer: The tracer to create spans with.
+    """
+
+    def __init__(self, tracer: Any) -> None:
+        self.tracer = tracer
+        self._current_span: Any = None
+
+    def span(self, name: str, attrs: dict[str, Any]) -> Any:
+        return _TracerSpan(self.tracer, f"acme_config.{name}", attrs)
+
+    def stage(self, name: str, seconds: float, attrs: Mapping[str, Any]) -> None:
+        # Stages timed by the caller become spans with explicit timestamps.
+        end = time.time_ns()
+        span = self.tracer.start_span(
+            f"acme_config.{name}",
+            attributes=_span_attributes(attrs),
+            start_time=end - int(seconds * 1e9),
+        )
+        span.end(end_time=end)
+
+    def event(self, name: str, attrs: Mapping[str, Any]) -> None:
+        get_current_span = self._current_span
+        if get_current_span is None:
+            try:
+                from opentelemetry.trace import get_current_span
+            except ImportError:
+                return
+            self._current_span = get_current_span
+        get_current_span().add_event(f"acme_config.{name}", _span_attributes(attrs))
+
+
+def profile_fields(config_class: type[BaseSettings], values: Mapping[str, Any]) -> dict[str, float]:
+    """Validate `values` one field at a time and time each field's validation.
+
+    A diagnostic for slow validation: each field goes through the class's
+    validator (field validators included) on its own. Timings are returned
+    and also reported as `validate.field` stages if a hook is registered.
+
+    Args:
+        config_class: The config class.
+        values: Raw field values keyed by field name, e.g. from a source.
+
+    Raises:
+        ValidationError: If a value is invalid.
+    """
+    validator = config_class.__pydantic_validator__
+    instance = config_class.model_construct()
+    fields = config_class.__pydantic_fields__
+    timings: dict[str, float] = {}
+    for name, value in values.items():
+        if name not in fields:
+            continue
+        start = time.perf_counter()
+        validator.validate_assignment(instance, name, value)
+        timings[name] = seconds = time.perf_counter() - start
+        record("validate.field", seconds, config=config_class.__name__, field=name)
+    return timings
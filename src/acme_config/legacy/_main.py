@@ -2,14 +2,8 @@ import os
 import argparse
 import logging
 
-from dotenv import dotenv_values
-
-from .aws_parameter_store import (
-    fetch_parameters,
-    set_parameters,
-    set_default_version,
-    get_default_version,
-)
+# The envfile, Parameter Store and cache modules are imported inside the
+# functions that use them, so `ac --help` and argument errors stay fast.
 
 
 logger = logging.getLogger(__name__)
@@ -67,7 +61,54 @@ def load_env_from_file(params_path: str) -> dict:
     """
     if not os.path.exists(params_path):
         raise FileNotFoundError(f"Env file {params_path} not found")
-    return dotenv_values(params_path)
+    from ..envfile import read_env_file
+
+    return read_env_file(params_path)
+
+
+def load_config_class(spec: str) -> type:
+    """
+    Import a config class given as `module:ClassName`.
+
+    Parameters:
+        spec (str): The module path and class name, separated by a colon.
+    Returns:
+        type: The config class.
+    Raises:
+        ValueError: If `spec` is not of the form `module:ClassName`.
+    """
+    import importlib
+
+    module_name, _, qualname = spec.partition(":")
+    if not module_name or not qualname:
+        raise ValueError(f"Expected module:ClassName, got {spec!r}")
+    obj = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def bake_snapshot(config_spec: str, output: str, env_file: str = None) -> str:
+    """
+    Resolve a config class and write it to a snapshot file.
+
+    Parameters:
+        config_spec (str): The config class as `module:ClassName`.
+        output (str): Path of the snapshot file to write.
+        env_file (str): A .env file to resolve from instead of the class default.
+    Returns:
+        str: The path of the written snapshot.
+    """
+    from ..fileutil import atomic_write
+    from ..resolver import resolve_config
+    from ..snapshot import dump_snapshot
+
+    config_class = load_config_class(config_spec)
+    config = resolve_config(config_class, env_file=env_file)
+    path = os.path.abspath(output)
+    atomic_write(path, dump_snapshot(config))
+    logger.info(f"Snapshot of {config_class.__name__} saved to {output}")
+    return output
 
 
 def add_main_arguments(parser: argparse.ArgumentParser) -> None:
@@ -76,6 +117,16 @@ def add_main_arguments(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("-ver-number", required=True, type=int, help="Version number")
 
 
+def add_cache_arguments(parser: argparse.ArgumentParser, no_cache: bool = True) -> None:
+    if no_cache:
+        parser.add_argument(
+            "--no-cache", action="store_true", help="Bypass the local version cache and query SSM"
+        )
+    parser.add_argument(
+        "--cache-dir", default=None, help="Local version cache directory (default: ~/.cache/acme-config)"
+    )
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         prog="ac", description="System to store application configuration"
@@ -88,6 +139,7 @@ def parse_args() -> argparse.Namespace:
         description="Fetch parameters from AWS AWS Parameter Store, print them to stdout, and save them to a file in CWD",
     )
     add_main_arguments(fetch_parser)
+    add_cache_arguments(fetch_parser)
 
     set_parser = subparsers.add_parser(
         "set",
@@ -99,12 +151,37 @@ def parse_args() -> argparse.Namespace:
         "--params-path", required=True, help="Path to .evn file to set as parameters"
     )
 
+    sync_parser = subparsers.add_parser(
+        "sync",
+        help="Sync parameters",
+        description="Compare a .env file with a version in AWS Parameter Store and, if they differ, "
+        "write the changes as a new version (-ver-number) based on it",
+    )
+    add_main_arguments(sync_parser)
+    sync_parser.add_argument(
+        "--params-path", required=True, help="Path to .env file with the wanted parameters"
+    )
+    sync_parser.add_argument(
+        "--from-version", type=int, default=None, help="Version to compare with (default: the default version)"
+    )
+    sync_parser.add_argument(
+        "--dry-run", action="store_true", help="Print the plan without writing anything"
+    )
+    sync_parser.add_argument(
+        "--no-delete", action="store_true", help="Carry over stored parameters missing from the .env file"
+    )
+    sync_parser.add_argument(
+        "--set-default", action="store_true", help="Make the new version the default version"
+    )
+    add_cache_arguments(sync_parser, no_cache=False)
+
     set_version_parser = subparsers.add_parser(
         "set-version",
         help="Set version",
         description="Set default version number to use for (app-name, env) combination",
     )
     add_main_arguments(set_version_parser)
+    add_cache_arguments(set_version_parser, no_cache=False)
 
     get_version_parser = subparsers.add_parser(
         "get-version",
@@ -115,28 +192,81 @@ def parse_args() -> argparse.Namespace:
         "-app-name", required=True, type=str, help="Application name"
     )
     get_version_parser.add_argument("-env", required=True, type=str, help="Environment")
+    add_cache_arguments(get_version_parser)
+
+    bake_parser = subparsers.add_parser(
+        "bake",
+        help="Bake a config snapshot",
+        description="Resolve a config class and save it as a binary snapshot to load at startup with acme_config.load_snapshot",
+    )
+    bake_parser.add_argument(
+        "--config", required=True, help="Config class to resolve, as module:ClassName"
+    )
+    bake_parser.add_argument("--output", required=True, help="Path of the snapshot file to write")
+    bake_parser.add_argument(
+        "--env-file", default=None, help="Path to .env file to resolve from (default: the class's own)"
+    )
 
     return parser.parse_args()
 
 
 def main_logic(args: argparse.Namespace) -> None:
+    from .aws_parameter_store import (
+        fetch_parameters,
+        set_parameters,
+        sync_parameters,
+        set_default_version,
+        get_default_version,
+    )
+    from .version_cache import VersionCache
+
     if args.command == "fetch" or args.command == "get":
-        parameters = fetch_parameters(args.app_name, args.env, args.ver_number)
+        if args.no_cache:
+            parameters = fetch_parameters(args.app_name, args.env, args.ver_number)
+        else:
+            cache = VersionCache(args.cache_dir)
+            parameters = cache.fetch_parameters(args.app_name, args.env, args.ver_number)
         fp = save_fetched_parameters(parameters, args.app_name, args.env, args.ver_number)
         print(fp)
     elif args.command == "set":
         params_dict = load_env_from_file(args.params_path)
         set_parameters(args.app_name, args.env, args.ver_number, params_dict)
         logger.info("Parameters set successfully")
+    elif args.command == "sync":
+        params_dict = load_env_from_file(args.params_path)
+        plan = sync_parameters(
+            args.app_name,
+            args.env,
+            args.ver_number,
+            params_dict,
+            delete=not args.no_delete,
+            dry_run=args.dry_run,
+            from_version=args.from_version,
+            set_default=args.set_default,
+        )
+        print(plan.format())
+        if plan and not args.dry_run:
+            if args.set_default:
+                VersionCache(args.cache_dir).forget_default_version(args.app_name, args.env)
+                logger.info(f"Parameters synced to version {args.ver_number} and set as default")
+            else:
+                logger.info(f"Parameters synced to version {args.ver_number}")
     elif args.command == "set-version":
         set_default_version(args.app_name, args.env, args.ver_number)
+        VersionCache(args.cache_dir).forget_default_version(args.app_name, args.env)
         logger.info("Default version set successfully")
     elif args.command == "get-version":
-        version = get_default_version(args.app_name, args.env)
+        if args.no_cache:
+            version = get_default_version(args.app_name, args.env)
+        else:
+            version = VersionCache(args.cache_dir).get_default_version(args.app_name, args.env)
         logger.info(
             f"Default version for `{args.app_name}` in `{args.env}` is `{version}`"
         )
         print(version)
+    elif args.command == "bake":
+        fp = bake_snapshot(args.config, args.output, args.env_file)
+        print(fp)
 
 
 def main() -> None:
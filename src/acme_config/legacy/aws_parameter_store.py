@@ -1,11 +1,20 @@
-
-import boto3
 import logging
 
+from ..parameter_store import (  # noqa: F401 (re-exported for the `ac` command and older callers)
+    BATCH_SIZE,
+    DEFAULT_MAX_WORKERS,
+    THROTTLE_CODES,
+    AdaptiveThrottle,
+    ParameterStore,
+    SyncPlan,
+    get_store,
+    set_default_store,
+)
+
 logger = logging.getLogger(__name__)
 
 
-def fetch_parameters(app_name, env, ver_number):
+def fetch_parameters(app_name, env, ver_number, client=None):
     """
     Fetches parameters from AWS Systems Manager Parameter Store for a given application, environment, and version number.
 
@@ -13,46 +22,95 @@ def fetch_parameters(app_name, env, ver_number):
         app_name (str): The name of the application.
         env (str): The environment (e.g., 'dev', 'prod').
         ver_number (str): The version number of the configuration.
+        client: Optional SSM client to use instead of the shared one.
     Returns:
         dict: A dictionary containing parameter names and their corresponding values.
     """
+    return get_store(client).fetch_parameters(f"/{app_name}/{env}/{ver_number}")
 
-    ssm = boto3.client("ssm")
-    path = f"/{app_name}/{env}/{ver_number}"
-
-    paginator = ssm.get_paginator("get_parameters_by_path")
-    parameters = {}
-
-    for page in paginator.paginate(Path=path, Recursive=True):
-        for param in page["Parameters"]:
-            param_name = param["Name"].split("/")[-1]
-            parameters[param_name] = param["Value"]
-
-    return parameters
 
-def set_parameters(app_name, env, ver_number, params_dict):
+def set_parameters(app_name, env, ver_number, params_dict, client=None):
     """
     Stores parameters in AWS Systems Manager Parameter Store.
-    
+
+    Parameters are written concurrently through the shared store's bounded
+    thread pool; if any write fails the remaining ones are cancelled and the
+    error is raised.
+
     Parameters:
         app_name (str): The name of the application.
         env (str): The environment (e.g., 'dev', 'prod').
         ver_number (str): The version number of the application.
         params_dict (dict): A dictionary of parameter names and their corresponding values.
+        client: Optional SSM client to use instead of the shared one.
     Returns:
         None
     """
-
-    ssm = boto3.client("ssm")
     path = f"/{app_name}/{env}/{ver_number}"
+    get_store(client).put_parameters(
+        {f"{path}/{name}": value for name, value in params_dict.items()}, overwrite=False
+    )
 
-    for param_name, param_value in params_dict.items():
-        param_path = f"{path}/{param_name}"
-        ssm.put_parameter(
-            Name=param_path, Value=param_value, Type="String", Overwrite=False
-        )
 
-def set_default_version(app_name, env, ver_number):
+def sync_parameters(
+    app_name,
+    env,
+    ver_number,
+    params_dict,
+    client=None,
+    delete=True,
+    dry_run=False,
+    from_version=None,
+    set_default=False,
+):
+    """
+    Publish `params_dict` as a new version if it differs from an existing one.
+
+    The base version is read in pages of 10 and compared locally. If
+    anything changed, version `ver_number` is written (concurrently through
+    the shared store, rate limited, with backoff on throttling). It stores
+    only the inserted and updated parameters, markers for the deleted ones
+    and a pointer to the base version, which is left untouched so hosts that
+    cached it stay consistent. Without a base version every parameter is
+    written.
+
+    Parameters:
+        app_name (str): The name of the application.
+        env (str): The environment (e.g., 'dev', 'prod').
+        ver_number (str): The new version number to write.
+        params_dict (dict): A dictionary of parameter names and their wanted values.
+        client: Optional SSM client to use instead of the shared one.
+        delete (bool): Leave out base parameters missing from `params_dict`.
+        dry_run (bool): Only compute the plan; write nothing.
+        from_version (str): The version to compare with. Defaults to the current
+            DEFAULT_VERSION; if that is not set, every parameter is new.
+        set_default (bool): Point DEFAULT_VERSION at the new version.
+    Returns:
+        SyncPlan: The plan that was (or, with `dry_run`, would be) applied.
+    Raises:
+        ValueError: If there are changes and version `ver_number` already exists.
+    """
+    store = get_store(client)
+    if from_version is None:
+        try:
+            response = store.call("get_parameter", Name=f"/{app_name}/{env}/DEFAULT_VERSION")
+            from_version = response["Parameter"]["Value"]
+        except store.client.exceptions.ParameterNotFound:
+            logger.info(f"No default version for `{app_name}` in `{env}`; syncing every parameter")
+    base = f"/{app_name}/{env}/{from_version}" if from_version is not None else None
+    plan = store.plan_sync(base, params_dict, delete=delete)
+    if plan and not dry_run:
+        path = f"/{app_name}/{env}/{ver_number}"
+        # Check up front so a partial write never mixes into a published version.
+        if str(ver_number) == str(from_version) or store.has_parameters(path):
+            raise ValueError(f"Version {path} already exists; sync to a new version number")
+        store.apply_sync(plan, path)
+        if set_default:
+            set_default_version(app_name, env, ver_number, client=client)
+    return plan
+
+
+def set_default_version(app_name, env, ver_number, client=None):
     """
     Sets the default version number for a given application and environment combination in AWS Parameter Store.
     This version number can be used as a reference point for the latest stable configuration.
@@ -61,21 +119,22 @@ def set_default_version(app_name, env, ver_number):
         app_name (str): The name of the application.
         env (str): The environment (e.g., 'dev', 'prod').
         ver_number (str): The version number to set as default.
+        client: Optional SSM client to use instead of the shared one.
     Returns:
         None
     """
-    ssm = boto3.client("ssm")
     path = f"/{app_name}/{env}/DEFAULT_VERSION"
-    ssm.put_parameter(
-        Name=path, Value=str(ver_number), Type="String", Overwrite=True
+    get_store(client).call(
+        "put_parameter", Name=path, Value=str(ver_number), Type="String", Overwrite=True
     )
 
-def get_default_version(app_name, env):
-    ssm = boto3.client("ssm")
+
+def get_default_version(app_name, env, client=None):
+    store = get_store(client)
     path = f"/{app_name}/{env}/DEFAULT_VERSION"
     try:
-        response = ssm.get_parameter(Name=path)
+        response = store.call("get_parameter", Name=path)
         return response["Parameter"]["Value"]
-    except ssm.exceptions.ParameterNotFound:
+    except store.client.exceptions.ParameterNotFound:
         logger.error(f"Default version for `{app_name}` in `{env}` not found. Set it with `set-version` command.")
-        raise
\ No newline at end of file
+        raise
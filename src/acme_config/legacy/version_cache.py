@@ -0,0 +1,193 @@
+import hashlib
+import json
+import logging
+import os
+import time
+
+from .. import instrument
+from ..fileutil import atomic_write
+from ..parameter_store import DEFAULT_VERSION_TTL
+from .aws_parameter_store import fetch_parameters, get_store
+
+logger = logging.getLogger(__name__)
+
+
+def default_cache_dir():
+    """
+    Return the cache directory: $ACME_CONFIG_CACHE_DIR, else $XDG_CACHE_HOME/acme-config,
+    else ~/.cache/acme-config.
+
+    Returns:
+        str: Path to the cache directory (not created).
+    """
+    override = os.environ.get("ACME_CONFIG_CACHE_DIR")
+    if override:
+        return os.path.expanduser(override)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "acme-config")
+
+
+def _safe(part):
+    # App and env names become path segments; keep them from escaping the cache dir.
+    return str(part).replace(os.sep, "%2F").replace("..", "%2E%2E")
+
+
+class VersionCache:
+    """
+    Persistent local cache of fetched Parameter Store versions.
+
+    Versions are immutable once written (`set` and `sync` use Overwrite=False), so a
+    version that has been fetched once is served from disk without touching
+    SSM. Parameter sets are stored content-addressed under `objects/<sha256>.json`
+    and referenced from `refs/<app>/<env>/<version>`, so identical versions
+    share one blob and a corrupted blob is detected and refetched.
+
+    `DEFAULT_VERSION` is mutable. Its value is cached for `default_version_ttl`
+    seconds; after that one `get_parameter` call revalidates it, using the
+    parameter's Version number as an ETag. If revalidation fails for any reason
+    other than the parameter being missing, the stale value is used.
+
+    Parameters:
+        cache_dir (str): Cache directory. Defaults to `default_cache_dir()`.
+        default_version_ttl (float): Seconds a cached DEFAULT_VERSION is trusted.
+    """
+
+    def __init__(self, cache_dir=None, default_version_ttl=DEFAULT_VERSION_TTL):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.default_version_ttl = default_version_ttl
+
+    def _ref_path(self, app_name, env, name):
+        return os.path.join(self.cache_dir, "refs", _safe(app_name), _safe(env), _safe(name))
+
+    def _object_path(self, digest):
+        return os.path.join(self.cache_dir, "objects", f"{digest}.json")
+
+    def _read_object(self, digest):
+        try:
+            with open(self._object_path(digest), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        if hashlib.sha256(data).hexdigest() != digest:
+            logger.warning(f"Cache object {digest} is corrupt; refetching")
+            return None
+        return json.loads(data)
+
+    def get_cached_parameters(self, app_name, env, ver_number):
+        """
+        Return the cached parameters for a version, or None if not cached.
+
+        Parameters:
+            app_name (str): The name of the application.
+            env (str): The environment (e.g., 'dev', 'prod').
+            ver_number (str): The version number of the configuration.
+        Returns:
+            dict | None: The cached parameters.
+        """
+        try:
+            with open(self._ref_path(app_name, env, ver_number)) as f:
+                digest = f.read().strip()
+        except FileNotFoundError:
+            return None
+        return self._read_object(digest)
+
+    def store_parameters(self, app_name, env, ver_number, parameters):
+        """
+        Store the parameters of a version.
+
+        Parameters:
+            app_name (str): The name of the application.
+            env (str): The environment (e.g., 'dev', 'prod').
+            ver_number (str): The version number of the configuration.
+            parameters (dict): Parameter names mapped to values.
+        Returns:
+            str: The content hash the parameters are stored under.
+        """
+        data = json.dumps(parameters, sort_keys=True, separators=(",", ":")).encode()
+        digest = hashlib.sha256(data).hexdigest()
+        if not os.path.exists(self._object_path(digest)):
+            atomic_write(self._object_path(digest), data)
+        atomic_write(self._ref_path(app_name, env, ver_number), digest.encode())
+        return digest
+
+    def fetch_parameters(self, app_name, env, ver_number, client=None):
+        """
+        Fetch a version's parameters, from the cache if it has been fetched before.
+
+        Parameters:
+            app_name (str): The name of the application.
+            env (str): The environment (e.g., 'dev', 'prod').
+            ver_number (str): The version number of the configuration.
+            client: Optional SSM client to use instead of the shared one.
+        Returns:
+            dict: A dictionary containing parameter names and their corresponding values.
+        """
+        parameters = self.get_cached_parameters(app_name, env, ver_number)
+        if parameters is not None:
+            instrument.event("cache.hit", cache="version", app=app_name, env=env, version=ver_number)
+            return parameters
+        instrument.event("cache.miss", cache="version", app=app_name, env=env, version=ver_number)
+        parameters = fetch_parameters(app_name, env, ver_number, client=client)
+        # An empty result may mean the version is not written yet; don't pin it.
+        if parameters:
+            self.store_parameters(app_name, env, ver_number, parameters)
+        return parameters
+
+    def get_default_version(self, app_name, env, client=None):
+        """
+        Return DEFAULT_VERSION for (app_name, env), revalidating it once the TTL has passed.
+
+        Parameters:
+            app_name (str): The name of the application.
+            env (str): The environment (e.g., 'dev', 'prod').
+            client: Optional SSM client to use instead of the shared one.
+        Returns:
+            str: The default version number.
+        Raises:
+            ParameterNotFound: If DEFAULT_VERSION is not set.
+        """
+        ref_path = self._ref_path(app_name, env, "DEFAULT_VERSION.json")
+        try:
+            with open(ref_path) as f:
+                cached = json.load(f)
+        except (FileNotFoundError, ValueError):
+            cached = None
+        now = time.time()
+        if cached is not None and now - cached["checked_at"] < self.default_version_ttl:
+            return cached["value"]
+
+        store = get_store(client)
+        path = f"/{app_name}/{env}/DEFAULT_VERSION"
+        try:
+            parameter = store.call("get_parameter", Name=path)["Parameter"]
+        except store.client.exceptions.ParameterNotFound:
+            self.forget_default_version(app_name, env)
+            logger.error(f"Default version for `{app_name}` in `{env}` not found. Set it with `set-version` command.")
+            raise
+        except Exception as exc:
+            if cached is None:
+                raise
+            logger.warning(f"Could not revalidate default version ({exc}); using cached value")
+            return cached["value"]
+
+        if cached is not None and cached.get("etag") == parameter.get("Version"):
+            cached["checked_at"] = now
+        else:
+            cached = {"value": parameter["Value"], "etag": parameter.get("Version"), "checked_at": now}
+        atomic_write(ref_path, json.dumps(cached).encode())
+        return cached["value"]
+
+    def forget_default_version(self, app_name, env):
+        """
+        Drop the cached DEFAULT_VERSION for (app_name, env), e.g. after `set-version`.
+
+        Parameters:
+            app_name (str): The name of the application.
+            env (str): The environment (e.g., 'dev', 'prod').
+        Returns:
+            None
+        """
+        try:
+            os.unlink(self._ref_path(app_name, env, "DEFAULT_VERSION.json"))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,188 @@
+"""Compiled per-class field metadata.
+
+Config and feature-flag classes are introspected once and the result is
+kept in a registry, so CLI generation, inspection and resolution do not
+re-walk `model_fields` and `json_schema_extra` on every call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import weakref
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pydantic_settings import BaseSettings
+
+
+def _is_secret_ref(annotation: Any) -> bool:
+    from acme_config.secrets import SecretRef
+
+    return isinstance(annotation, type) and issubclass(annotation, SecretRef)
+
+
+class FieldMeta:
+    """Precomputed metadata for a single config field."""
+
+    __slots__ = (
+        "name",
+        "env_var",
+        "cli_flag",
+        "secret",
+        "description",
+        "default",
+        "required",
+        "annotation",
+        "reload",
+        "aliases",
+    )
+
+    def __init__(self, name: str, field_info: Any, env_prefix: str) -> None:
+        extra = field_info.json_schema_extra
+        if not isinstance(extra, dict):
+            extra = {}
+        self.name: str = name
+        self.env_var: str = f"{env_prefix}{name}".upper()
+        self.cli_flag: str | None = extra.get("cli_flag")
+        self.secret: bool = bool(extra.get("secret", False)) or _is_secret_ref(
+            field_info.annotation
+        )
+        self.description: str = field_info.description or ""
+        self.default: Any = field_info.default
+        self.required: bool = field_info.is_required()
+        self.annotation: Any = field_info.annotation
+        # "hot" or "restart"; fields not declared with ConfigField/FeatureFlag need a restart.
+        self.reload: str = extra.get("reload") or "restart"
+        # Validation aliases a settings source may return the value under.
+        alias = field_info.validation_alias
+        choices = (alias,) if isinstance(alias, str) else getattr(alias, "choices", ())
+        self.aliases: tuple[str, ...] = tuple(c for c in choices if isinstance(c, str))
+
+    def __repr__(self) -> str:
+        return f"FieldMeta(name={self.name!r}, env_var={self.env_var!r})"
+
+
+class ConfigMeta:
+    """Precomputed metadata for a config class.
+
+    Attributes:
+        class_name: Name of the config class.
+        env_prefix: The class's `env_prefix` (may be empty).
+        fields: Field metadata in declaration order.
+        by_name: Field metadata keyed by field name.
+        by_env: Field metadata keyed by upper-cased env var name.
+        by_key: Field metadata keyed by field name and by each string
+            validation alias, i.e. every key a settings source may return.
+        input_names: For fields that validate from an alias rather than their
+            name, the field name mapped to that alias.
+        cli_fields: Fields that declare a `cli_flag`.
+        has_aliases: Whether any field sets an alias (aliases bypass `env_prefix`).
+        flag_bits: Single-bit masks for `bool` fields, in declaration order
+            (the first bool field is bit 0).
+        schema_hash: Hex digest of the class name and each field's name, env
+            var, type, default, description and flags. Equal hashes mean
+            generated artifacts (manifests, templates) are unchanged.
+    """
+
+    __slots__ = (
+        "class_name",
+        "env_prefix",
+        "fields",
+        "by_name",
+        "by_env",
+        "by_key",
+        "input_names",
+        "cli_fields",
+        "has_aliases",
+        "flag_bits",
+        "_schema_hash",
+        "_model_fields",
+        "_model_config",
+    )
+
+    def __init__(self, config_class: type[BaseSettings]) -> None:
+        model_fields = config_class.__pydantic_fields__
+        model_config = config_class.model_config
+        env_prefix = model_config.get("env_prefix") or ""
+
+        fields = tuple(
+            FieldMeta(name, field_info, env_prefix) for name, field_info in model_fields.items()
+        )
+        self.class_name: str = config_class.__name__
+        self.env_prefix: str = env_prefix
+        self.fields: tuple[FieldMeta, ...] = fields
+        self.by_name: dict[str, FieldMeta] = {f.name: f for f in fields}
+        self.by_env: dict[str, FieldMeta] = {f.env_var: f for f in fields}
+        self.by_key: dict[str, FieldMeta] = {
+            **{alias: f for f in fields for alias in f.aliases},
+            **self.by_name,
+        }
+        by_name_allowed = (
+            model_config.get("validate_by_name")
+            or model_config.get("populate_by_name")
+            or model_config.get("validate_by_alias") is False
+        )
+        self.input_names: dict[str, str] = (
+            {} if by_name_allowed else {f.name: f.aliases[0] for f in fields if f.aliases}
+        )
+        self.cli_fields: tuple[FieldMeta, ...] = tuple(f for f in fields if f.cli_flag)
+        self.has_aliases: bool = any(
+            info.alias or info.validation_alias for info in model_fields.values()
+        )
+        bool_fields = [f.name for f in fields if f.annotation is bool]
+        self.flag_bits: dict[str, int] = {name: 1 << i for i, name in enumerate(bool_fields)}
+        self._schema_hash: str | None = None
+        # Identity of the pydantic structures this was compiled from; a
+        # `model_rebuild()` or config swap replaces them and invalidates us.
+        self._model_fields = model_fields
+        self._model_config = model_config
+
+    @property
+    def schema_hash(self) -> str:
+        # Computed on first use; most callers never need it.
+        if self._schema_hash is None:
+            parts = [self.class_name, self.env_prefix]
+            for f in self.fields:
+                parts.append(
+                    f"{f.name}\t{f.env_var}\t{f.annotation!r}\t{f.required}\t{f.default!r}"
+                    f"\t{f.secret}\t{f.cli_flag}\t{f.description}"
+                )
+            digest = hashlib.blake2b("\n".join(parts).encode(), digest_size=16)
+            self._schema_hash = digest.hexdigest()
+        return self._schema_hash
+
+    def is_current(self, config_class: type[BaseSettings]) -> bool:
+        """Whether this metadata still matches the class's pydantic fields and config."""
+        return (
+            self._model_fields is config_class.__pydantic_fields__
+            and self._model_config is config_class.model_config
+        )
+
+    def __repr__(self) -> str:
+        return f"ConfigMeta({self.class_name}, fields={len(self.fields)})"
+
+
+# Keyed weakly by class: a redefined class is a new key, and the old entry
+# disappears together with the old class object.
+_REGISTRY: weakref.WeakKeyDictionary[type, ConfigMeta] = weakref.WeakKeyDictionary()
+
+
+def get_config_meta(config_class: type[BaseSettings]) -> ConfigMeta:
+    """Return the compiled metadata for a config class, building it on first use.
+
+    Args:
+        config_class: An `AppConfig` or `FeatureFlags` subclass.
+    """
+    meta = _REGISTRY.get(config_class)
+    if meta is None or not meta.is_current(config_class):
+        meta = ConfigMeta(config_class)
+        _REGISTRY[config_class] = meta
+    return meta
+
+
+def invalidate_config_meta(config_class: type[BaseSettings] | None = None) -> None:
+    """Drop compiled metadata for one class, or for all classes if None."""
+    if config_class is None:
+        _REGISTRY.clear()
+    else:
+        _REGISTRY.pop(config_class, None)
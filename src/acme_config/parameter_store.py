@@ -0,0 +1,646 @@
+"""AWS Systems Manager Parameter Store access for settings resolution.
+
+Parameters live under `/{app}/{env}/{version}`, the layout written by the
+`ac set` command. Versions are immutable once written, so a fetched version
+is kept in memory for the life of the process. The mutable
+`/{app}/{env}/DEFAULT_VERSION` pointer is re-read once it is older than
+`DEFAULT_VERSION_TTL` seconds, and on `ConfigResolver.reload("parameter_store")`.
+
+All requests go through a `ParameterStore`, which applies an adaptive
+client-side rate limit and retries throttled calls with backoff. The
+shared one (`get_store()`) is also used by the `ac` commands. boto3 is an
+optional dependency (`pip install acme_config[aws]`) and is only imported
+when the default client is first needed.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from types import MappingProxyType
+from typing import Any, TypedDict
+
+from acme_config import instrument
+
+DEFAULT_VERSION = "DEFAULT_VERSION"
+
+# Seconds a resolved DEFAULT_VERSION is reused before it is read again
+# (here and in the `ac` command's on-disk version cache).
+DEFAULT_VERSION_TTL = 30.0
+
+
+class ParameterStoreConfig(TypedDict, total=False):
+    """Shape of the `parameter_store` entry in a settings class's `model_config`.
+
+    Keys:
+        app: Application name (first path segment).
+        env: Environment name (second path segment).
+        version: Version to load. None resolves `DEFAULT_VERSION`.
+        client: SSM client to use instead of the shared boto3 client.
+    """
+
+    app: str
+    env: str
+    version: str | int | None
+    client: Any
+
+
+# SSM caps GetParameters (and DeleteParameters) at 10 names per call.
+BATCH_SIZE = 10
+DEFAULT_MAX_WORKERS = 8
+THROTTLE_CODES = frozenset(
+    {"ThrottlingException", "TooManyUpdates", "Throttling", "RequestLimitExceeded"}
+)
+
+
+# A version written by `ParameterStore.apply_sync` may store only what changed
+# from its base version: `{path}/__base__` holds the base version's path and
+# `{path}/__deleted__/{NAME}` marks a base parameter as left out.
+BASE_MARKER = "__base__"
+DELETED_PREFIX = "__deleted__/"
+# A sync writes a full version once its base is this many deltas deep, which
+# bounds the reads needed to load a version.
+MAX_DELTA_DEPTH = 8
+
+
+def _error_code(exc: BaseException) -> str | None:
+    response = getattr(exc, "response", None)
+    if not isinstance(response, dict):
+        return None
+    return response.get("Error", {}).get("Code")
+
+
+class AdaptiveThrottle:
+    """Client-side rate limiter that adapts to Parameter Store throttling.
+
+    Calls are spaced to at most `rate` per second. Each throttled call halves
+    the rate (down to `min_rate`); each successful call raises it additively
+    (up to `max_rate`), so the limiter settles just under the account's limit.
+
+    Args:
+        rate: Initial calls per second.
+        min_rate: Lower bound for the rate.
+        max_rate: Upper bound for the rate.
+    """
+
+    def __init__(self, rate: float = 40.0, min_rate: float = 1.0, max_rate: float = 200.0) -> None:
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller may issue the next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self.rate
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + 1.0)
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+
+class ParameterStore:
+    """Parameter Store backend sharing one client, one rate limiter and a bounded thread pool.
+
+    All requests go through `call`, which applies the adaptive rate limit and
+    retries throttled requests with exponential backoff and full jitter.
+
+    Args:
+        client: A boto3 SSM client (or compatible stand-in such as
+            `acme_config.testing.FakeSSMClient`). Created lazily if None.
+        max_workers: Upper bound on concurrent requests.
+        throttle: Rate limiter. A new one is created if None.
+        max_attempts: Attempts per request before a throttling error is raised.
+        base_delay: Backoff base in seconds.
+        max_delay: Backoff cap in seconds.
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        throttle: AdaptiveThrottle | None = None,
+        max_attempts: int = 8,
+        base_delay: float = 0.05,
+        max_delay: float = 5.0,
+    ) -> None:
+        self._client = client
+        self._client_lock = threading.Lock()
+        self.max_workers = max_workers
+        self.throttle = throttle if throttle is not None else AdaptiveThrottle()
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @property
+    def client(self) -> Any:
+        """The SSM client, created on first use if none was given."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = _create_client(self.max_workers)
+        return self._client
+
+    def call(self, operation: str, **kwargs: Any) -> dict[str, Any]:
+        """Call `client.<operation>(**kwargs)` with rate limiting and backoff on throttling.
+
+        Args:
+            operation: Client method name, e.g. "put_parameter".
+
+        Returns:
+            The client response.
+        """
+        method = getattr(self.client, operation)
+        attempt = 0
+        with instrument.span("ssm.call", operation=operation) as attrs:
+            while True:
+                self.throttle.acquire()
+                try:
+                    response = method(**kwargs)
+                except Exception as exc:
+                    attempt += 1
+                    if _error_code(exc) not in THROTTLE_CODES or attempt >= self.max_attempts:
+                        raise
+                    instrument.event("ssm.throttled", operation=operation, attempt=attempt)
+                    self.throttle.on_throttle()
+                    cap = min(self.max_delay, self.base_delay * 2**attempt)
+                    time.sleep(random.uniform(0, cap))
+                    continue
+                self.throttle.on_success()
+                attrs["attempts"] = attempt + 1
+                return response
+
+    def _map[T, R](self, fn: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """Run `fn` over `items` on the pool; cancel the rest and raise on the first error."""
+        items = list(items)
+        if len(items) <= 1 or self.max_workers <= 1:
+            return [fn(item) for item in items]
+        from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as pool:
+            futures = [pool.submit(fn, item) for item in items]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            for future in futures:
+                if future in done and (exc := future.exception()) is not None:
+                    raise exc
+            return [future.result() for future in futures]
+
+    def get_parameters_by_path(
+        self, path: str, recursive: bool = True, with_decryption: bool = False
+    ) -> dict[str, str]:
+        """Fetch all parameters under `path` in pages of 10.
+
+        Args:
+            path: Parameter path, e.g. "/app/dev/3".
+            recursive: Include parameters in sub-paths.
+            with_decryption: Decrypt SecureString values.
+
+        Returns:
+            Full parameter names mapped to values.
+        """
+        parameters = {}
+        token = None
+        while True:
+            kwargs: dict[str, Any] = {
+                "Path": path,
+                "Recursive": recursive,
+                "MaxResults": BATCH_SIZE,
+            }
+            if with_decryption:
+                kwargs["WithDecryption"] = True
+            if token:
+                kwargs["NextToken"] = token
+            page = self.call("get_parameters_by_path", **kwargs)
+            for param in page["Parameters"]:
+                parameters[param["Name"]] = param["Value"]
+            token = page.get("NextToken")
+            if not token:
+                return parameters
+
+    def has_parameters(self, path: str) -> bool:
+        """Return whether any parameter is stored under `path` (recursively).
+
+        SSM may return an empty page with a NextToken, so pages are read
+        until a parameter is found or there are no more pages.
+
+        Args:
+            path: Parameter path, e.g. "/app/dev/3".
+        """
+        token = None
+        while True:
+            kwargs: dict[str, Any] = {"Path": path, "Recursive": True, "MaxResults": BATCH_SIZE}
+            if token:
+                kwargs["NextToken"] = token
+            page = self.call("get_parameters_by_path", **kwargs)
+            if page["Parameters"]:
+                return True
+            token = page.get("NextToken")
+            if not token:
+                return False
+
+    def read_version(self, path: str, with_decryption: bool = False) -> dict[str, str]:
+        """Read the parameters of the version at `path`, following delta versions to their base.
+
+        Args:
+            path: Parameter path, e.g. "/app/dev/3".
+            with_decryption: Decrypt SecureString values.
+
+        Returns:
+            Parameter names relative to `path` (e.g. "DB_HOST" or "sub/KEY")
+            mapped to values.
+
+        Raises:
+            ValueError: If the base versions form a cycle.
+        """
+        return self._read_version(path, with_decryption)[0]
+
+    def _read_version(self, path: str, with_decryption: bool = False) -> tuple[dict[str, str], int]:
+        """Like `read_version`, also returning the number of delta versions that were read."""
+        layers: list[tuple[dict[str, str], set[str]]] = []
+        seen = set()
+        base: str | None = path
+        while base is not None:
+            base = base.rstrip("/")
+            if base in seen:
+                raise ValueError(f"Base versions of {path} form a cycle")
+            seen.add(base)
+            prefix = base + "/"
+            stored = self.get_parameters_by_path(base, with_decryption=with_decryption)
+            own = {}
+            deleted = set()
+            for name, value in stored.items():
+                name = name[len(prefix) :]
+                if name.startswith(DELETED_PREFIX):
+                    deleted.add(name[len(DELETED_PREFIX) :])
+                else:
+                    own[name] = value
+            base = own.pop(BASE_MARKER, None)
+            layers.append((own, deleted))
+
+        values = layers[-1][0]
+        # A delta carries over its base's direct parameters, the ones a sync compares.
+        for own, deleted in reversed(layers[:-1]):
+            inherited = {
+                name: value
+                for name, value in values.items()
+                if "/" not in name and name not in deleted
+            }
+            values = {**inherited, **own}
+        return values, len(layers) - 1
+
+    def fetch_parameters(self, path: str) -> dict[str, str]:
+        """Fetch all parameters of the version at `path` as {leaf name: value}.
+
+        Args:
+            path: Parameter path, e.g. "/app/dev/3".
+
+        Returns:
+            Parameter names (last path segment) mapped to values.
+        """
+        return {name.split("/")[-1]: value for name, value in self.read_version(path).items()}
+
+    def get_parameters(self, names: Iterable[str]) -> dict[str, str]:
+        """Read parameters by full name with `get_parameters` in concurrent batches of 10.
+
+        Args:
+            names: Full parameter names.
+
+        Returns:
+            Full names mapped to values. Missing parameters are left out.
+        """
+        names = list(dict.fromkeys(names))
+        batches = [names[i : i + BATCH_SIZE] for i in range(0, len(names), BATCH_SIZE)]
+        responses = self._map(lambda batch: self.call("get_parameters", Names=batch), batches)
+        return {
+            param["Name"]: param["Value"]
+            for response in responses
+            for param in response["Parameters"]
+        }
+
+    def put_parameters(self, params: Mapping[str, str], overwrite: bool = False) -> dict[str, Any]:
+        """Write {full name: value} concurrently, one `put_parameter` per key.
+
+        Args:
+            params: Full parameter names mapped to values.
+            overwrite: Replace existing parameters.
+
+        Returns:
+            Full names mapped to the new parameter version.
+        """
+
+        def put(item: tuple[str, str]) -> tuple[str, Any]:
+            name, value = item
+            response = self.call(
+                "put_parameter", Name=name, Value=value, Type="String", Overwrite=overwrite
+            )
+            return name, response.get("Version")
+
+        return dict(self._map(put, params.items()))
+
+    def delete_parameters(self, names: Iterable[str]) -> list[str]:
+        """Delete parameters by full name with `delete_parameters` in concurrent batches of 10.
+
+        Args:
+            names: Full parameter names.
+
+        Returns:
+            The names that were deleted. Names that did not exist are left out.
+        """
+        names = list(dict.fromkeys(names))
+        batches = [names[i : i + BATCH_SIZE] for i in range(0, len(names), BATCH_SIZE)]
+        responses = self._map(lambda batch: self.call("delete_parameters", Names=batch), batches)
+        return [name for response in responses for name in response["DeletedParameters"]]
+
+    def plan_sync(
+        self, path: str | None, params: Mapping[str, str], delete: bool = True
+    ) -> SyncPlan:
+        """Compare `params` with the parameters stored directly under the version at `path`.
+
+        Reads the version (and its base versions) in pages of 10; nothing is
+        written.
+
+        Args:
+            path: Parameter path of the version to compare with, e.g. "/app/dev/3".
+                None compares with an empty version.
+            params: Parameter names (relative to `path`) mapped to the wanted values.
+            delete: Leave out stored parameters missing from `params`; otherwise
+                they are carried over unchanged.
+
+        Returns:
+            The changes from `path` to the wanted parameters.
+
+        Raises:
+            ValueError: If a name in `params` is reserved for delta versions.
+        """
+        for name in params:
+            if name == BASE_MARKER or name.startswith(DELETED_PREFIX):
+                raise ValueError(f"Parameter name {name!r} is reserved")
+        existing: dict[str, str] = {}
+        depth = None
+        if path is not None:
+            stored, depth = self._read_version(path)
+            existing = {name: value for name, value in stored.items() if "/" not in name}
+            if not stored and not depth:
+                depth = None
+        inserts = {}
+        updates = {}
+        for name, value in params.items():
+            if name not in existing:
+                inserts[name] = value
+            elif existing[name] != value:
+                updates[name] = value
+        if delete:
+            deletes = sorted(name for name in existing if name not in params)
+            values = dict(params)
+        else:
+            deletes = []
+            values = {**existing, **params}
+        unchanged = len(values) - len(inserts) - len(updates)
+        return SyncPlan(path, inserts, updates, deletes, unchanged, values, depth)
+
+    def apply_sync(self, plan: SyncPlan, path: str) -> None:
+        """Write the parameters a `SyncPlan` arrives at as a new version under `path`.
+
+        Published versions are never changed in place, since readers cache
+        them for good. The new version stores only the plan's inserts and
+        updates, a marker for each delete and a pointer to the plan's version
+        as its base. Every version is written in full when there is no base
+        version or the base is already `MAX_DELTA_DEPTH` deltas deep.
+        Parameters are written concurrently with Overwrite=False, so an
+        existing version fails the sync instead of being modified.
+
+        Args:
+            plan: The plan returned by `plan_sync`.
+            path: Parameter path of the new version, e.g. "/app/dev/4".
+        """
+        prefix = path.rstrip("/")
+        if plan.path is None or plan.depth is None or plan.depth >= MAX_DELTA_DEPTH:
+            self.put_parameters({f"{prefix}/{name}": value for name, value in plan.values.items()})
+            return
+        # The pointer goes first so a reader never sees a delta without its base.
+        self.put_parameters({f"{prefix}/{BASE_MARKER}": plan.path.rstrip("/")})
+        delta = {
+            f"{prefix}/{name}": value for name, value in {**plan.inserts, **plan.updates}.items()
+        }
+        delta.update({f"{prefix}/{DELETED_PREFIX}{name}": "deleted" for name in plan.deletes})
+        self.put_parameters(delta)
+
+
+class SyncPlan:
+    """The changes from a stored Parameter Store version to a wanted set of parameters.
+
+    Values are kept for applying the plan but never shown by `format`, as
+    they may be secrets.
+
+    Args:
+        path: The parameter path of the version the plan compares with, or
+            None for an empty version.
+        inserts: Names to add, mapped to their values.
+        updates: Names whose value changes, mapped to their new values.
+        deletes: Names to leave out.
+        unchanged: Number of parameters that are already up to date.
+        values: Every parameter of the resulting version, mapped to its value.
+        depth: Number of delta versions `path` is built from, or None if
+            nothing is stored there.
+    """
+
+    def __init__(
+        self,
+        path: str | None,
+        inserts: dict[str, str],
+        updates: dict[str, str],
+        deletes: list[str],
+        unchanged: int = 0,
+        values: dict[str, str] | None = None,
+        depth: int | None = None,
+    ) -> None:
+        self.path = path
+        self.inserts = inserts
+        self.updates = updates
+        self.deletes = deletes
+        self.unchanged = unchanged
+        self.values = values if values is not None else {**inserts, **updates}
+        self.depth = depth
+
+    def __len__(self) -> int:
+        return len(self.inserts) + len(self.updates) + len(self.deletes)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __repr__(self) -> str:
+        return (
+            f"SyncPlan({self.path!r}, inserts={len(self.inserts)}, "
+            f"updates={len(self.updates)}, deletes={len(self.deletes)})"
+        )
+
+    def format(self) -> str:
+        """Describe the plan, one line per changed parameter and a summary line.
+
+        Returns:
+            Lines like `+ NAME` (insert), `~ NAME` (update) and `- NAME` (delete).
+        """
+        lines = [f"+ {name}" for name in sorted(self.inserts)]
+        lines += [f"~ {name}" for name in sorted(self.updates)]
+        lines += [f"- {name}" for name in self.deletes]
+        lines.append(
+            f"{self.path or '(no base version)'}: {len(self.inserts)} to add, "
+            f"{len(self.updates)} to change, {len(self.deletes)} to delete, "
+            f"{self.unchanged} unchanged"
+        )
+        return "\n".join(lines)
+
+
+def _create_client(max_workers: int) -> Any:
+    # Imported lazily so the package (and its tests) work without boto3.
+    try:
+        import boto3
+        from botocore.config import Config
+    except ImportError as e:
+        raise ImportError(
+            "Parameter Store support requires boto3: pip install acme_config[aws]"
+        ) from e
+
+    config = Config(
+        max_pool_connections=max(10, max_workers),
+        # Retries are handled by ParameterStore.call so throttling feeds the limiter.
+        retries={"mode": "standard", "max_attempts": 1},
+    )
+    return boto3.client("ssm", config=config)
+
+
+_default_store: ParameterStore | None = None
+_default_store_lock = threading.Lock()
+
+
+def get_store(client: Any = None) -> ParameterStore:
+    """Return the shared `ParameterStore`, or a new one wrapping `client` if given.
+
+    Args:
+        client: Optional SSM client to use instead of the shared one.
+    """
+    global _default_store
+    if client is not None:
+        return ParameterStore(client)
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = ParameterStore()
+    return _default_store
+
+
+def set_default_store(store: ParameterStore | None) -> None:
+    """Replace the shared `ParameterStore` (e.g. with one wrapping a fake client in tests).
+
+    Args:
+        store: The new shared store; None resets to a lazily created one.
+    """
+    global _default_store
+    with _default_store_lock:
+        _default_store = store
+
+
+_lock = threading.Lock()
+_default_versions: dict[tuple[str, str], tuple[str, float]] = {}
+_parameters: dict[str, Mapping[str, str]] = {}
+
+
+def get_ssm_client() -> Any:
+    """Return the shared SSM client, creating a boto3 client on first use.
+
+    Raises:
+        ImportError: If boto3 is not installed and no client was set.
+    """
+    return get_store().client
+
+
+def set_ssm_client(client: Any) -> None:
+    """Replace the shared SSM client (None resets to a lazily created boto3 client)."""
+    set_default_store(ParameterStore(client) if client is not None else None)
+
+
+def clear_parameter_store_cache() -> None:
+    """Forget resolved default versions and fetched parameters."""
+    with _lock:
+        _default_versions.clear()
+        _parameters.clear()
+
+
+def resolve_version(
+    app: str, env: str, client: Any = None, max_age: float = DEFAULT_VERSION_TTL
+) -> str:
+    """Return `/{app}/{env}/DEFAULT_VERSION`, reusing a value read less than `max_age` ago.
+
+    Args:
+        app: Application name.
+        env: Environment name.
+        client: SSM client. Defaults to the shared client.
+        max_age: Seconds a previously read value stays valid; 0 always reads.
+    """
+    key = (app, env)
+    cached = _default_versions.get(key)
+    now = time.monotonic()
+    if cached is not None and now - cached[1] < max_age:
+        return cached[0]
+    response = get_store(client).call("get_parameter", Name=f"/{app}/{env}/{DEFAULT_VERSION}")
+    version = response["Parameter"]["Value"]
+    with _lock:
+        _default_versions[key] = (version, now)
+    return version
+
+
+def fetch_parameters(
+    app: str,
+    env: str,
+    version: str | int | None = None,
+    client: Any = None,
+    max_age: float = DEFAULT_VERSION_TTL,
+) -> Mapping[str, str]:
+    """Fetch a version's parameters as a read-only {name: value} mapping.
+
+    Pages through `get_parameters_by_path` in batches of 10 (the SSM
+    maximum), decrypting SecureStrings and following delta versions to
+    their base. The result is cached per process.
+
+    Args:
+        app: Application name.
+        env: Environment name.
+        version: Version to load. None resolves `DEFAULT_VERSION`.
+        client: SSM client. Defaults to the shared client.
+        max_age: Passed to `resolve_version` when `version` is None.
+    """
+    if version is None:
+        version = resolve_version(app, env, client, max_age)
+    path = f"/{app}/{env}/{version}"
+    parameters = _parameters.get(path)
+    if parameters is not None:
+        instrument.event("cache.hit", cache="parameter_store", path=path)
+        return parameters
+
+    instrument.event("cache.miss", cache="parameter_store", path=path)
+    with instrument.span("parameter_store.fetch", path=path) as attrs:
+        fetched = get_store(client).read_version(path, with_decryption=True)
+        values = {name.rsplit("/", 1)[-1]: value for name, value in fetched.items()}
+        attrs["parameters"] = len(values)
+        attrs["bytes"] = sum(len(value) for value in values.values())
+
+    parameters = MappingProxyType(values)
+    # An empty version may still be being written; only pin populated ones.
+    if values:
+        with _lock:
+            parameters = _parameters.setdefault(path, parameters)
+    return parameters
@@ -2,26 +2,27 @@
 
 from __future__ import annotations
 
-import argparse
-from typing import Any
+import contextvars
+from collections.abc import Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING, Any
 
+from pydantic import BaseModel
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource
+
+from acme_config.metadata import ConfigMeta, get_config_meta
+from acme_config.parameter_store import DEFAULT_VERSION_TTL
 from acme_config.schema import AppConfig
+from acme_config.sources import (
+    DotEnvSource,
+    IndexedEnvSource,
+    ParameterStoreSource,
+    shared_sources,
+)
 
+if TYPE_CHECKING:
+    import argparse
 
-def _get_field_metadata(config_class: type[AppConfig]) -> dict[str, dict[str, Any]]:
-    """Extract field metadata (cli_flag, secret, description) from config class."""
-    result: dict[str, dict[str, Any]] = {}
-    for name, field_info in config_class.model_fields.items():
-        extra = field_info.json_schema_extra or {}
-        result[name] = {
-            "cli_flag": extra.get("cli_flag"),
-            "secret": extra.get("secret", False),
-            "description": field_info.description or "",
-            "default": field_info.default,
-            "required": field_info.is_required(),
-            "annotation": field_info.annotation,
-        }
-    return result
+    from acme_config.cache import ResolutionCache
 
 
 def build_cli_parser(
@@ -31,40 +32,20 @@ def build_cli_parser(
 ) -> argparse.ArgumentParser:
     """Generate an argparse parser from a config class.
 
-    Only fields with `cli_flag` set will become CLI arguments.
+    Only fields with `cli_flag` set will become CLI arguments. The field
+    walk is compiled once per class (see `acme_config.cli.CliSpec`); each
+    call returns a new parser that the caller may extend. For a shared,
+    cached parser use `acme_config.cli.get_cli_parser`, and to get just the
+    values given on the command line use `acme_config.cli.parse_cli`.
 
     Args:
         config_class: The AppConfig subclass to generate a parser for.
         prog: Program name for the parser.
         description: Description for the parser.
     """
-    parser = argparse.ArgumentParser(prog=prog, description=description)
-    metadata = _get_field_metadata(config_class)
-
-    for field_name, meta in metadata.items():
-        cli_flag = meta["cli_flag"]
-        if not cli_flag:
-            continue
-
-        kwargs: dict[str, Any] = {}
-        kwargs["dest"] = field_name
-        kwargs["help"] = meta["description"]
-
-        annotation = meta["annotation"]
-        if annotation is bool:
-            # Boolean fields become --flag / --no-flag
-            if meta["default"] is False:
-                kwargs["action"] = "store_true"
-            else:
-                kwargs["action"] = "store_false"
-        else:
-            kwargs["type"] = str  # Let pydantic handle type coercion
-            if not meta["required"] and meta["default"] is not None:
-                kwargs["default"] = None  # None = "not provided via CLI"
-
-        parser.add_argument(cli_flag, **kwargs)
+    from acme_config.cli import get_cli_spec
 
-    return parser
+    return get_cli_spec(config_class).build_parser(prog, description)
 
 
 def resolve_config[T: AppConfig](
@@ -72,15 +53,17 @@ def resolve_config[T: AppConfig](
     cli_args: dict[str, Any] | None = None,
     overrides: dict[str, Any] | None = None,
     env_file: str | None = None,
+    cache: ResolutionCache | None = None,
 ) -> T:
     """Create a config instance with full precedence resolution.
 
     Resolution order (later overrides earlier):
     1. Field defaults
     2. .env file
-    3. Environment variables
-    4. CLI args (if provided)
-    5. Explicit overrides (if provided)
+    3. AWS Parameter Store (if `model_config["parameter_store"]` is set)
+    4. Environment variables
+    5. CLI args (if provided)
+    6. Explicit overrides (if provided)
 
     Args:
         config_class: The AppConfig subclass to instantiate.
@@ -88,7 +71,68 @@ def resolve_config[T: AppConfig](
             Keys with None values are skipped (not provided).
         overrides: Dict of explicit override values (highest priority).
         env_file: Path to .env file. If None, uses the class default.
+        cache: Optional `ResolutionCache`. When given, an unchanged resolution
+            returns a copy of the cached instance instead of revalidating.
+    """
+    if cache is not None:
+        return cache.resolve(
+            config_class, cli_args=cli_args, overrides=overrides, env_file=env_file
+        )
+    return config_class(**_init_kwargs(cli_args, overrides, env_file))
+
+
+async def aresolve_config[T: AppConfig](
+    config_class: type[T],
+    cli_args: dict[str, Any] | None = None,
+    overrides: dict[str, Any] | None = None,
+    env_file: str | None = None,
+    *,
+    timeout: float | None = None,
+    source_timeouts: Mapping[str, float] | None = None,
+) -> T:
+    """Async `resolve_config`: load the settings sources without blocking the event loop.
+
+    The sources (.env file, Parameter Store, secrets directory, custom
+    sources) load concurrently; file reads and SSM calls run on worker
+    threads. Values are merged with the same precedence as
+    `resolve_config`, then validated on the event loop. Sources can
+    implement `acme_config.sources.AsyncSettingsSource` to be awaited
+    natively.
+
+    Args:
+        config_class: The AppConfig subclass to instantiate.
+        cli_args: Dict of CLI argument values. Keys with None values are skipped.
+        overrides: Dict of explicit override values (highest priority).
+        env_file: Path to .env file. If None, uses the class default.
+        timeout: Seconds each source may take to load. None waits indefinitely.
+        source_timeouts: Per-source timeouts keyed by source class name
+            (e.g. `{"ParameterStoreSource": 2.0}`), overriding `timeout`.
+
+    Raises:
+        TimeoutError: If a source does not load in time.
+        ValidationError: If the merged values are invalid.
     """
+    import asyncio
+
+    from acme_config import instrument
+    from acme_config.sources import abuild_settings_sources
+
+    init_kwargs = _init_kwargs(cli_args, overrides, env_file)
+    with instrument.span("resolve", config=config_class.__name__):
+        built = await abuild_settings_sources(
+            config_class, init_kwargs, timeout=timeout, source_timeouts=source_timeouts
+        )
+        if built is None:
+            # A feature only the stock pipeline supports; keep it off the loop.
+            return await asyncio.to_thread(config_class, **init_kwargs)
+        return config_class(_build_sources=built)
+
+
+def _init_kwargs(
+    cli_args: dict[str, Any] | None,
+    overrides: dict[str, Any] | None,
+    env_file: str | None,
+) -> dict[str, Any]:
     # Build kwargs for pydantic-settings constructor
     init_kwargs: dict[str, Any] = {}
 
@@ -106,4 +150,311 @@ def resolve_config[T: AppConfig](
     if overrides:
         init_kwargs.update(overrides)
 
-    return config_class(**init_kwargs)
+    return init_kwargs
+
+
+_ABSENT = object()
+
+LAYERS = ("dotenv", "parameter_store", "environ", "cli", "overrides")
+"""Resolution layers above field defaults, lowest precedence first."""
+
+
+def _validate_values[T: AppConfig](config_class: type[T], values: dict[str, Any]) -> T:
+    """Validate already-merged field values without re-reading any settings source.
+
+    `BaseSettings.__init__` (and therefore `model_validate`) always rebuilds
+    the .env/environment sources, so go through pydantic's base `__init__`.
+    """
+    input_names = get_config_meta(config_class).input_names
+    if input_names:
+        # Aliased fields only validate from their alias.
+        values = {input_names.get(name, name): value for name, value in values.items()}
+    config = config_class.__new__(config_class)
+    BaseModel.__init__(config, **values)
+    return config
+
+
+def _read_layer(source: PydanticBaseSettingsSource, meta: ConfigMeta) -> dict[str, Any]:
+    """Call a pydantic-settings source and key its field values by field name.
+
+    Sources return aliased fields under their alias; other keys are dropped.
+    """
+    by_key = meta.by_key
+    return {by_key[k].name: v for k, v in source().items() if k in by_key}
+
+
+class ConfigResolver[T: AppConfig]:
+    """Layered resolver that revalidates only fields whose winning value changed.
+
+    Each precedence layer (.env, Parameter Store, environment, CLI args,
+    overrides) is kept as a separate, pre-parsed mapping of field name to
+    raw value. Changing a layer re-merges field by field and revalidates
+    only the fields whose winning value changed; the new instance shares
+    every other validated value with the previous one.
+
+    Classes that declare model validators are always revalidated in full,
+    since those can depend on any combination of fields. Fields with field
+    validators are revalidated on every change, since a validator can read
+    other fields through `info.data`.
+
+    Example::
+
+        resolver = ConfigResolver(MyConfig, env_file=".env")
+        base = resolver.config
+        per_request = resolver.with_overrides({"tenant": "acme"})
+
+    Args:
+        config_class: The AppConfig subclass to resolve.
+        cli_args: Dict of CLI argument values. Keys with None values are skipped.
+        overrides: Dict of explicit override values (highest priority).
+        env_file: Path to .env file. If None, uses the class default.
+    """
+
+    def __init__(
+        self,
+        config_class: type[T],
+        cli_args: dict[str, Any] | None = None,
+        overrides: dict[str, Any] | None = None,
+        env_file: str | None = None,
+    ) -> None:
+        self.config_class = config_class
+        self.env_file = env_file
+        self._meta = get_config_meta(config_class)
+        decorators = config_class.__pydantic_decorators__
+        self._incremental = not decorators.model_validators
+        # Field validators can read other fields through `info.data`, so their
+        # fields are revalidated along with any change.
+        validated: set[str] = set()
+        for decorator in decorators.field_validators.values():
+            fields = decorator.info.fields
+            validated.update(self._meta.by_name if "*" in fields else fields)
+        self._with_validators = tuple(name for name in self._meta.by_name if name in validated)
+        self._layers: dict[str, dict[str, Any]] = {
+            "dotenv": self._load("dotenv"),
+            "parameter_store": self._load("parameter_store"),
+            "environ": self._load("environ"),
+            "cli": {},
+            "overrides": {},
+        }
+        self._layers["cli"] = self._normalize("cli", cli_args)
+        self._layers["overrides"] = self._normalize("overrides", overrides)
+        self._winners = self._merge(self._layers)
+        self._config = _validate_values(config_class, self._winners)
+        self.last_revalidated: tuple[str, ...] = tuple(self._meta.by_name)
+
+    @property
+    def config(self) -> T:
+        """The currently resolved config instance."""
+        return self._config
+
+    def layer(self, name: str) -> dict[str, Any]:
+        """Return a copy of one layer's raw values, keyed by field name."""
+        return dict(self._layers[name])
+
+    def _load(self, layer: str, refresh: bool = False) -> dict[str, Any]:
+        source: PydanticBaseSettingsSource
+        if layer == "dotenv":
+            if self.env_file is not None:
+                source = DotEnvSource(self.config_class, env_file=self.env_file)
+            else:
+                source = DotEnvSource(self.config_class)
+        elif layer == "parameter_store":
+            # A reload re-reads DEFAULT_VERSION rather than waiting for its TTL.
+            max_age = 0 if refresh else DEFAULT_VERSION_TTL
+            source = ParameterStoreSource(self.config_class, max_age=max_age)
+        else:
+            source = IndexedEnvSource(self.config_class)
+        return _read_layer(source, self._meta)
+
+    @staticmethod
+    def _normalize(layer: str, values: dict[str, Any] | None) -> dict[str, Any]:
+        if not values:
+            return {}
+        if layer == "cli":
+            return {k: v for k, v in values.items() if v is not None}
+        return dict(values)
+
+    def _merge(self, layers: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        winners: dict[str, Any] = {}
+        ordered = [layers[name] for name in reversed(LAYERS)]
+        for name in self._meta.by_name:
+            for values in ordered:
+                if name in values:
+                    winners[name] = values[name]
+                    break
+        return winners
+
+    def _apply(self, layers: dict[str, dict[str, Any]]) -> tuple[T, dict[str, Any]]:
+        """Build an instance for `layers`, revalidating only changed winners."""
+        winners = self._merge(layers)
+        old = self._winners
+        changed = [
+            name
+            for name in self._meta.by_name
+            if winners.get(name, _ABSENT) is not old.get(name, _ABSENT)
+            and winners.get(name, _ABSENT) != old.get(name, _ABSENT)
+        ]
+        if not changed:
+            self.last_revalidated = ()
+            return self._config, winners
+
+        unset_required = any(
+            name not in winners and self._meta.by_name[name].required for name in changed
+        )
+        if not self._incremental or unset_required:
+            self.last_revalidated = tuple(self._meta.by_name)
+            return _validate_values(self.config_class, winners), winners
+
+        if self._with_validators:
+            # Validated fields go last, in declaration order, as in full validation.
+            changed = [n for n in changed if n not in self._with_validators]
+            changed += self._with_validators
+        config = self._config.model_copy()
+        validator = self.config_class.__pydantic_validator__
+        fields = self.config_class.__pydantic_fields__
+        for name in changed:
+            if name in winners:
+                validator.validate_assignment(config, name, winners[name])
+            else:
+                default = fields[name].get_default(call_default_factory=True)
+                validator.validate_assignment(config, name, default)
+                config.__pydantic_fields_set__.discard(name)
+        self.last_revalidated = tuple(changed)
+        return config, winners
+
+    def update(self, layer: str, values: dict[str, Any] | None) -> T:
+        """Replace one layer's values and return the re-resolved config.
+
+        Args:
+            layer: One of "dotenv", "parameter_store", "environ", "cli" or "overrides".
+            values: New raw values for the layer, keyed by field name.
+        """
+        if layer not in LAYERS:
+            raise ValueError(f"Unknown layer {layer!r}; expected one of {LAYERS}")
+        layers = {**self._layers, layer: self._normalize(layer, values)}
+        self._config, self._winners = self._apply(layers)
+        self._layers = layers
+        return self._config
+
+    def reload(self, *layers: str) -> T:
+        """Re-read the .env file, environment and/or Parameter Store and return the config.
+
+        Reloading "parameter_store" re-reads the `DEFAULT_VERSION` pointer,
+        so a newly published version is picked up immediately.
+
+        Args:
+            *layers: Any of "dotenv", "environ" and "parameter_store". Defaults
+                to "dotenv" and "environ".
+        """
+        names = layers or ("dotenv", "environ")
+        for name in names:
+            if name not in ("dotenv", "environ", "parameter_store"):
+                raise ValueError(f"Layer {name!r} has no source to reload")
+        new_layers = {**self._layers}
+        for name in names:
+            new_layers[name] = self._load(name, refresh=True)
+        self._config, self._winners = self._apply(new_layers)
+        self._layers = new_layers
+        return self._config
+
+    def with_overrides(self, overrides: dict[str, Any]) -> T:
+        """Return a config with `overrides` applied on top, leaving the resolver unchanged.
+
+        Intended for per-request overrides: only the overridden fields (and
+        any previous overrides they replace) are revalidated.
+        """
+        layers = {**self._layers, "overrides": {**self._layers["overrides"], **overrides}}
+        config, _ = self._apply(layers)
+        return config
+
+
+class ConfigBundle:
+    """Resolved configs from `resolve_many`, looked up by class.
+
+    Example::
+
+        bundle = resolve_many([DbConfig, Features])
+        db = bundle[DbConfig]  # typed as DbConfig
+    """
+
+    __slots__ = ("_configs",)
+
+    def __init__(self, configs: dict[type[BaseSettings], BaseSettings]) -> None:
+        self._configs = configs
+
+    def __getitem__[C: BaseSettings](self, config_class: type[C]) -> C:
+        return self._configs[config_class]  # type: ignore[return-value]
+
+    def get[C: BaseSettings](self, config_class: type[C]) -> C | None:
+        """Return the config for `config_class`, or None if it was not resolved."""
+        return self._configs.get(config_class)  # type: ignore[return-value]
+
+    def __contains__(self, config_class: object) -> bool:
+        return config_class in self._configs
+
+    def __iter__(self) -> Iterator[type[BaseSettings]]:
+        return iter(self._configs)
+
+    def __len__(self) -> int:
+        return len(self._configs)
+
+    def values(self) -> list[BaseSettings]:
+        """The resolved configs, in the order their classes were given."""
+        return list(self._configs.values())
+
+    def __repr__(self) -> str:
+        return f"ConfigBundle({', '.join(c.__name__ for c in self._configs)})"
+
+
+def resolve_many(
+    config_classes: Iterable[type[BaseSettings]],
+    cli_args: dict[str, Any] | None = None,
+    overrides: Mapping[type[BaseSettings], dict[str, Any]] | None = None,
+    env_file: str | None = None,
+    max_workers: int | None = None,
+) -> ConfigBundle:
+    """Resolve many config and feature-flag classes against one read of the sources.
+
+    The environment is scanned and each .env file is read once for the whole
+    batch (see `sources.shared_sources`); each class then picks out the
+    variables under its own `env_prefix`. Precedence per class is the same
+    as `resolve_config`.
+
+    Args:
+        config_classes: `AppConfig` and/or `FeatureFlags` subclasses.
+        cli_args: Shared dict of CLI argument values. Each class receives the
+            keys naming one of its fields; keys with None values are skipped.
+        overrides: Explicit override values per class (highest priority).
+        env_file: Path to .env file for every class. If None, each class
+            uses its own default.
+        max_workers: Validate classes on this many threads. Worth it when
+            sources do I/O (e.g. Parameter Store) or on free-threaded Python;
+            pure validation is otherwise GIL-bound. None validates in order.
+
+    Raises:
+        ValidationError: For the first class (in input order) that fails.
+    """
+    classes = list(dict.fromkeys(config_classes))
+    cli_values = {k: v for k, v in (cli_args or {}).items() if v is not None}
+
+    def build(config_class: type[BaseSettings]) -> BaseSettings:
+        fields = get_config_meta(config_class).by_name
+        init_kwargs: dict[str, Any] = {k: v for k, v in cli_values.items() if k in fields}
+        if overrides and config_class in overrides:
+            init_kwargs.update(overrides[config_class])
+        if env_file is not None:
+            init_kwargs["_env_file"] = env_file
+        return config_class(**init_kwargs)
+
+    with shared_sources():
+        if max_workers is None or max_workers <= 1 or len(classes) <= 1:
+            configs = [build(cls) for cls in classes]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            context = contextvars.copy_context()
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(classes))) as pool:
+                # Each task runs in a copy of this context so it sees the snapshot.
+                futures = [pool.submit(context.copy().run, build, cls) for cls in classes]
+                configs = [future.result() for future in futures]
+    return ConfigBundle(dict(zip(classes, configs, strict=True)))
@@ -7,11 +7,13 @@ via pydantic-settings, with optional CLI flag mapping.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
+from acme_config.sources import _ValidateStage, settings_init
+
 
 def ConfigField(
     default: Any = ...,
@@ -19,6 +21,7 @@ def ConfigField(
     description: str = "",
     cli_flag: str | None = None,
     secret: bool = False,
+    reload: Literal["hot", "restart"] = "restart",
     **kwargs: Any,
 ) -> Any:
     """Declare a configuration field with metadata.
@@ -29,11 +32,19 @@ def ConfigField(
         cli_flag: CLI argument name (e.g. "--bucket-name"). If set,
             `build_cli_parser()` will generate this argument automatically.
         secret: If True, value is redacted in `describe_config()` output.
+        reload: "hot" if a running app can pick up a new value, "restart"
+            if it needs a restart. Reported by `diff_config()`.
         **kwargs: Additional arguments passed to pydantic `Field`.
+
+    Raises:
+        ValueError: If `reload` is not "hot" or "restart".
     """
+    if reload not in ("hot", "restart"):
+        raise ValueError(f"reload must be 'hot' or 'restart', got {reload!r}")
     json_schema_extra = {
         "cli_flag": cli_flag,
         "secret": secret,
+        "reload": reload,
     }
     return Field(
         default=default,
@@ -43,12 +54,13 @@ def ConfigField(
     )
 
 
-class AppConfig(BaseSettings):
+class AppConfig(BaseSettings, _ValidateStage):
     """Base class for app configuration.
 
     Subclass this and declare fields to define what configuration your
     app needs. Values are resolved from (in order of precedence):
-    defaults < .env file < environment variables < CLI args < explicit overrides.
+    defaults < .env file < Parameter Store (if configured) < environment
+    variables < CLI args < explicit overrides.
 
     Example::
 
@@ -63,3 +75,5 @@ class AppConfig(BaseSettings):
     """
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8", "extra": "ignore"}
+
+    __init__ = settings_init
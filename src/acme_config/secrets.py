@@ -0,0 +1,230 @@
+"""Lazily resolved secret values.
+
+A `SecretRef` field holds a reference to a secret (e.g. `ssm:/svc/prod/db`)
+rather than the secret itself. Constructing the config only records the
+reference; the backend is called on the first `get_secret_value()`, and
+the result is cached, optionally for a limited time.
+
+References have the form `<scheme>:<location>`. Built-in schemes:
+
+- `env:NAME` reads an environment variable.
+- `file:/path` reads a file (trailing newline stripped), e.g. a mounted secret.
+- `ssm:/name` reads a decrypted Parameter Store parameter.
+
+Values without a registered scheme are literal secrets. More schemes can
+be added with `register_secret_resolver`.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pydantic import GetCoreSchemaHandler
+    from pydantic_core import CoreSchema
+
+SecretResolver = Callable[[str], str]
+
+_resolvers: dict[str, SecretResolver] = {}
+
+
+def register_secret_resolver(scheme: str, resolver: SecretResolver) -> None:
+    """Register a backend for references of the form `<scheme>:<location>`.
+
+    Args:
+        scheme: Reference prefix, without the colon.
+        resolver: Called with the location; returns the secret value.
+    """
+    _resolvers[scheme] = resolver
+
+
+def _resolve_env(name: str) -> str:
+    try:
+        return os.environ[name]
+    except KeyError:
+        raise LookupError(f"Environment variable {name} is not set") from None
+
+
+def _resolve_file(path: str) -> str:
+    with open(os.path.expanduser(path), encoding="utf-8") as f:
+        return f.read().rstrip("\n")
+
+
+def _resolve_ssm(name: str) -> str:
+    from acme_config.parameter_store import get_store
+
+    response = get_store().call("get_parameter", Name=name, WithDecryption=True)
+    return response["Parameter"]["Value"]
+
+
+register_secret_resolver("env", _resolve_env)
+register_secret_resolver("file", _resolve_file)
+register_secret_resolver("ssm", _resolve_ssm)
+
+_UNRESOLVED = object()
+
+
+class SecretRef:
+    """A secret that is fetched on first use.
+
+    Use it as a field type; the raw config value is the reference::
+
+        class MyConfig(AppConfig):
+            db_password: SecretRef = ConfigField(description="DB password")
+
+        # MYAPP_DB_PASSWORD=ssm:/myapp/prod/db_password
+        config.db_password.get_secret_value()  # fetched here, then cached
+
+    For a time-limited cache annotate the field with `SecretTTL`.
+    Concurrent first calls resolve the secret once. `str()` and `repr()`
+    never reveal or resolve it.
+
+    Args:
+        reference: `<scheme>:<location>` or a literal secret.
+        ttl: Seconds to cache the resolved value. None caches forever.
+    """
+
+    __slots__ = ("reference", "ttl", "_value", "_expires", "_lock")
+
+    def __init__(self, reference: str, ttl: float | None = None) -> None:
+        self.reference = reference
+        self.ttl = ttl
+        self._value: Any = _UNRESOLVED
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def scheme(self) -> str | None:
+        """The reference's registered scheme, or None for a literal secret."""
+        scheme, sep, _ = self.reference.partition(":")
+        return scheme if sep and scheme in _resolvers else None
+
+    @property
+    def is_resolved(self) -> bool:
+        """Whether a cached, unexpired value is available."""
+        return self._value is not _UNRESOLVED and (
+            self.ttl is None or time.monotonic() < self._expires
+        )
+
+    def get_secret_value(self) -> str:
+        """Return the secret, resolving it on first call or after the TTL expires.
+
+        Raises:
+            Exception: Whatever the backend raises; nothing is cached then.
+        """
+        value = self._value
+        if value is not _UNRESOLVED and (self.ttl is None or time.monotonic() < self._expires):
+            return value
+        with self._lock:
+            if self.is_resolved:
+                return self._value
+            scheme = self.scheme
+            if scheme is None:
+                value = self.reference
+            else:
+                value = _resolvers[scheme](self.reference[len(scheme) + 1 :])
+            if self.ttl is not None:
+                self._expires = time.monotonic() + self.ttl
+            self._value = value
+            return value
+
+    def invalidate(self) -> None:
+        """Drop the cached value so the next access fetches it again."""
+        with self._lock:
+            self._value = _UNRESOLVED
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SecretRef):
+            return NotImplemented
+        return self.reference == other.reference
+
+    def __hash__(self) -> int:
+        return hash(self.reference)
+
+    def __str__(self) -> str:
+        return "***"
+
+    def __repr__(self) -> str:
+        scheme = self.scheme
+        return f"SecretRef('{scheme}:***')" if scheme else "SecretRef('***')"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle the reference only, never a resolved value.
+        return (type(self), (self.reference, self.ttl))
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        from pydantic_core import core_schema
+
+        from_str = core_schema.no_info_after_validator_function(cls, core_schema.str_schema())
+        return core_schema.json_or_python_schema(
+            json_schema=from_str,
+            python_schema=core_schema.union_schema([core_schema.is_instance_schema(cls), from_str]),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda ref, info: str(ref) if info.mode_is_json() else ref,
+                info_arg=True,
+            ),
+        )
+
+
+class SecretTTL:
+    """Field annotation setting how long a `SecretRef` caches its value.
+
+    Example::
+
+        api_token: Annotated[SecretRef, SecretTTL(300)] = ConfigField(description="Token")
+
+    Args:
+        seconds: Cache lifetime of the resolved value.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+    def __get_pydantic_core_schema__(
+        self, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        from pydantic_core import core_schema
+
+        seconds = self.seconds
+
+        def with_ttl(ref: SecretRef) -> SecretRef:
+            if ref.ttl != seconds:
+                ref = SecretRef(ref.reference, ttl=seconds)
+            return ref
+
+        return core_schema.no_info_after_validator_function(with_ttl, handler(source_type))
+
+
+def reveal_secrets(value: Any) -> Any:
+    """Return `value` with its secrets in a form that validates back to them.
+
+    JSON serialization masks `SecretStr`, `SecretBytes` and `Secret` values
+    (and redacts `SecretRef` references), so the JSON of a config cannot be
+    validated back into the same config. This swaps each secret for its raw
+    value (a `SecretRef` for its reference, without resolving it), looking
+    inside lists, tuples, sets, dicts and models, so that
+    `to_json(reveal_secrets(value))` validates back to an equal value.
+
+    The result holds secrets in the clear; only use it for data that is
+    read back, never for display or logs.
+    """
+    from pydantic import BaseModel, Secret, SecretBytes, SecretStr
+
+    if isinstance(value, SecretRef):
+        return value.reference
+    if isinstance(value, (SecretStr, SecretBytes, Secret)):
+        return value.get_secret_value()
+    if isinstance(value, BaseModel):
+        return reveal_secrets(value.model_dump(by_alias=True, round_trip=True))
+    if isinstance(value, dict):
+        return {k: reveal_secrets(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [reveal_secrets(v) for v in value]
+    return value
@@ -0,0 +1,348 @@
+"""Config snapshots published to shared memory for worker pools.
+
+The master process resolves a config once and publishes it with
+`SharedConfig`; workers attach with `SharedConfigView` and read fields
+straight from the segment, decoding each one on first access. Publishing
+again bumps a generation counter that workers see on their next read, so
+every worker switches to the same new snapshot.
+
+Example::
+
+    # master, before forking or starting the pool
+    shared = SharedConfig(MyConfig)
+    shared.publish(resolve_config(MyConfig))
+
+    # worker
+    view = SharedConfigView(shared.name, MyConfig)
+    view.bucket            # decodes one field
+    view.config()          # full, validated MyConfig (cached per generation)
+
+Segment layout (little-endian)::
+
+    header  magic "ACMECFG\\0" | format u16 | reserved u16 | slot size u32
+            | schema digest 16B | generation u64           (padded to 64B)
+    slot 0, slot 1
+            generation u64 | payload length u32 | field count u32
+            | (offset u32, length u32) per field | field values as JSON
+
+Generation `g` lives in slot `g % 2`. The writer fills the inactive slot
+and then bumps the header generation; readers check the slot's generation
+before and after reading (a seqlock), and retry if a writer got there
+first. Field order and types must match between publisher and readers;
+attaching with a different class definition raises ValueError.
+
+The segment holds field values as published, including the raw values of
+secret fields (`SecretStr` etc.) and `SecretRef` references. POSIX
+segments are created readable by the owning user only.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+
+from acme_config.metadata import get_config_meta
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+    from pydantic import TypeAdapter
+    from pydantic_settings import BaseSettings
+
+    from acme_config.metadata import ConfigMeta
+
+MAGIC = b"ACMECFG\0"
+FORMAT_VERSION = 1
+DEFAULT_SIZE = 256 * 1024
+
+_HEADER = struct.Struct("<8sHHI16s")
+_GENERATION = struct.Struct("<Q")
+_GENERATION_OFFSET = _HEADER.size
+_HEADER_SIZE = 64
+_SLOT_HEADER = struct.Struct("<QII")
+_FIELD_ENTRY = struct.Struct("<II")
+_MAX_RETRIES = 100
+
+# Per-class field validators for lazy reads, shared by every view of the class.
+_ADAPTERS: weakref.WeakKeyDictionary[type, dict[str, TypeAdapter[Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Segments created by this process; their resource-tracker entry is the creator's.
+_created: set[str] = set()
+
+
+def schema_digest(config_class: type[BaseSettings]) -> bytes:
+    """Return the class's 16-byte schema digest (`ConfigMeta.schema_hash`)."""
+    return bytes.fromhex(get_config_meta(config_class).schema_hash)
+
+
+def _encode_field(value: Any) -> bytes:
+    from pydantic_core import to_json
+
+    from acme_config.secrets import reveal_secrets
+
+    # Secret types serialize masked; share their raw values (and SecretRef
+    # references) so readers validate back the published secrets.
+    return to_json(reveal_secrets(value))
+
+
+def encode_snapshot(config: BaseSettings) -> bytes:
+    """Encode a config as a slot payload (field table followed by JSON values)."""
+    meta = get_config_meta(type(config))
+    values = [_encode_field(getattr(config, f.name)) for f in meta.fields]
+    table = bytearray()
+    offset = len(values) * _FIELD_ENTRY.size
+    for value in values:
+        table += _FIELD_ENTRY.pack(offset, len(value))
+        offset += len(value)
+    return bytes(table) + b"".join(values)
+
+
+class SharedConfig:
+    """Publishes snapshots of one config class into a shared memory segment.
+
+    Create it in the master process; the segment lives until `unlink()`
+    (or `close()` with `unlink=True`). Workers attach by `name`.
+
+    Args:
+        config_class: The config class whose instances are published.
+        name: Segment name. A random name is chosen if None.
+        size: Segment size in bytes; each of the two slots gets half.
+    """
+
+    def __init__(
+        self, config_class: type[BaseSettings], *, name: str | None = None, size: int = DEFAULT_SIZE
+    ) -> None:
+        from multiprocessing.shared_memory import SharedMemory
+
+        self.config_class = config_class
+        self._shm: SharedMemory | None = SharedMemory(name=name, create=True, size=size)
+        self._buf = self._shm.buf
+        self._slot_size = (size - _HEADER_SIZE) // 2
+        if self._slot_size <= _SLOT_HEADER.size:
+            self.close(unlink=True)
+            raise ValueError(f"size {size} is too small for a shared config segment")
+        self._lock = threading.Lock()
+        _created.add(self._shm._name)  # type: ignore[attr-defined]
+        _HEADER.pack_into(
+            self._buf, 0, MAGIC, FORMAT_VERSION, 0, self._slot_size, schema_digest(config_class)
+        )
+        _GENERATION.pack_into(self._buf, _GENERATION_OFFSET, 0)
+
+    @property
+    def name(self) -> str:
+        """The segment name workers attach to."""
+        return self._shm.name if self._shm is not None else ""
+
+    @property
+    def generation(self) -> int:
+        """The generation of the latest published snapshot (0 before the first)."""
+        return _GENERATION.unpack_from(self._buf, _GENERATION_OFFSET)[0]
+
+    def publish(self, config: BaseSettings) -> int:
+        """Write `config` to the inactive slot and make it current.
+
+        Returns:
+            The new generation.
+
+        Raises:
+            TypeError: If `config` is not an instance of the published class.
+            ValueError: If the encoded config does not fit in a slot.
+        """
+        if not isinstance(config, self.config_class):
+            raise TypeError(
+                f"expected a {self.config_class.__name__} instance, got {type(config).__name__}"
+            )
+        payload = encode_snapshot(config)
+        if _SLOT_HEADER.size + len(payload) > self._slot_size:
+            raise ValueError(
+                f"encoded config is {len(payload)} bytes; slot holds "
+                f"{self._slot_size - _SLOT_HEADER.size}. Use a larger `size`."
+            )
+        field_count = len(get_config_meta(self.config_class).fields)
+        with self._lock:
+            generation = self.generation + 1
+            start = _HEADER_SIZE + (generation % 2) * self._slot_size
+            # Mark the slot as being written before touching the payload.
+            _SLOT_HEADER.pack_into(self._buf, start, 0, 0, 0)
+            body = start + _SLOT_HEADER.size
+            self._buf[body : body + len(payload)] = payload
+            _SLOT_HEADER.pack_into(self._buf, start, generation, len(payload), field_count)
+            _GENERATION.pack_into(self._buf, _GENERATION_OFFSET, generation)
+        return generation
+
+    def close(self, unlink: bool = False) -> None:
+        """Detach from the segment, and destroy it if `unlink` is True."""
+        if self._shm is None:
+            return
+        shm, self._shm = self._shm, None
+        shm.close()
+        if unlink:
+            _created.discard(shm._name)  # type: ignore[attr-defined]
+            shm.unlink()
+
+    def unlink(self) -> None:
+        """Destroy the segment. Attached workers keep their mapping until they close."""
+        self.close(unlink=True)
+
+    def __enter__(self) -> SharedConfig:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close(unlink=True)
+
+
+class SharedConfigView[T: BaseSettings]:
+    """Read-only, lazily decoded view of a config published by `SharedConfig`.
+
+    Field access (`view.bucket` or `view.get("bucket")`) follows the latest
+    generation, decodes only that field, and validates it against the
+    field's type. `config()` returns a fully validated instance, including
+    model validators.
+
+    Args:
+        name: Segment name (`SharedConfig.name`).
+        config_class: The published config class.
+
+    Raises:
+        ValueError: If the segment is not a config snapshot, uses another
+            format version, or was published for a different class definition.
+    """
+
+    def __init__(self, name: str, config_class: type[T]) -> None:
+        from multiprocessing.shared_memory import SharedMemory
+
+        self.config_class = config_class
+        self._meta: ConfigMeta = get_config_meta(config_class)
+        self._shm: SharedMemory | None = SharedMemory(name=name)
+        _untrack(self._shm)
+        self._buf = self._shm.buf
+        magic, version, _, slot_size, digest = _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{name!r} is not an acme_config snapshot (format {FORMAT_VERSION})")
+        if digest != schema_digest(config_class):
+            self.close()
+            raise ValueError(f"{name!r} was published for a different {config_class.__name__}")
+        self._slot_size = slot_size
+        self._index = {f.name: i for i, f in enumerate(self._meta.fields)}
+        self._names = [json.dumps(f.name).encode() for f in self._meta.fields]
+        self._seen = -1
+        self._values: dict[str, Any] = {}
+        self._config: T | None = None
+        self._adapters = _ADAPTERS.setdefault(config_class, {})
+
+    @property
+    def generation(self) -> int:
+        """The generation currently published (0 if nothing has been published yet)."""
+        return _GENERATION.unpack_from(self._buf, _GENERATION_OFFSET)[0]
+
+    def changed(self) -> bool:
+        """Whether a newer snapshot was published since this view last read one."""
+        return self.generation != self._seen
+
+    def _read(self, fields: list[int] | None) -> tuple[int, list[bytes]]:
+        """Copy the JSON of `fields` (all if None) from the current slot, seqlock-checked."""
+        buf = self._buf
+        for _ in range(_MAX_RETRIES):
+            generation = _GENERATION.unpack_from(buf, _GENERATION_OFFSET)[0]
+            if generation == 0:
+                raise LookupError("no config has been published to this segment yet")
+            start = _HEADER_SIZE + (generation % 2) * self._slot_size
+            slot_generation, _, count = _SLOT_HEADER.unpack_from(buf, start)
+            if slot_generation != generation:
+                continue
+            body = start + _SLOT_HEADER.size
+            chunks = []
+            for i in range(count) if fields is None else fields:
+                offset, length = _FIELD_ENTRY.unpack_from(buf, body + i * _FIELD_ENTRY.size)
+                chunks.append(bytes(buf[body + offset : body + offset + length]))
+            if _SLOT_HEADER.unpack_from(buf, start)[0] == generation:
+                return generation, chunks
+        raise RuntimeError("shared config kept changing while being read")
+
+    def _sync(self, generation: int) -> None:
+        if generation != self._seen:
+            self._seen = generation
+            self._values = {}
+            self._config = None
+
+    def get(self, name: str) -> Any:
+        """Return one field's value from the latest snapshot.
+
+        Raises:
+            AttributeError: If `name` is not a field of the config class.
+            LookupError: If nothing has been published yet.
+        """
+        index = self._index.get(name)
+        if index is None:
+            raise AttributeError(f"{self.config_class.__name__} has no field {name!r}")
+        if self.generation == self._seen and name in self._values:
+            return self._values[name]
+        generation, (raw,) = self._read([index])
+        self._sync(generation)
+        adapter = self._adapters.get(name)
+        if adapter is None:
+            from pydantic import TypeAdapter
+
+            info = self.config_class.__pydantic_fields__[name]
+            adapter = TypeAdapter(info.rebuild_annotation())
+            self._adapters[name] = adapter
+        value = adapter.validate_json(raw)
+        self._values[name] = value
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.get(name)
+
+    def config(self) -> T:
+        """Return the latest snapshot as a validated config instance.
+
+        The instance is cached until the next publish; do not mutate it.
+        No source (.env, environment, Parameter Store) is read.
+        """
+        if self._config is not None and self.generation == self._seen:
+            return self._config
+        generation, chunks = self._read(None)
+        self._sync(generation)
+        body = b",".join(name + b":" + chunk for name, chunk in zip(self._names, chunks))
+        # Not `model_validate_json`: that runs `BaseSettings.__init__`, which
+        # re-reads every settings source.
+        config = self.config_class.__new__(self.config_class)
+        self.config_class.__pydantic_validator__.validate_json(
+            b"{" + body + b"}", self_instance=config
+        )
+        self._config = config
+        return config
+
+    def close(self) -> None:
+        """Detach from the segment."""
+        if self._shm is None:
+            return
+        shm, self._shm = self._shm, None
+        shm.close()
+
+    def __enter__(self) -> SharedConfigView[T]:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _untrack(shm: SharedMemory) -> None:
+    # Before Python 3.13 attaching registers the segment with this process's
+    # resource tracker, which would unlink it when the worker exits.
+    if shm._name in _created:  # type: ignore[attr-defined]
+        return
+    try:
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    except Exception:
+        pass
@@ -0,0 +1,299 @@
+"""Binary config snapshots for fast cold starts.
+
+`dump_snapshot(config)` encodes a resolved config instance as a compact,
+versioned blob stamped with the class's schema hash; `load_snapshot(cls,
+data)` turns it back into an instance without reading any source. When
+the blob was written for the same class definition, values are trusted
+and the instance is built with `model_construct`, skipping validation;
+otherwise they are validated like any other input.
+
+Bake a snapshot at build time (`ac bake --config myapp.config:MyConfig
+--output config.snap`) and load it at startup::
+
+    with open("config.snap", "rb") as f:
+        config = load_snapshot(MyConfig, f.read())
+
+Values are stored with a small tagged encoding (None, bool, int, float,
+str, bytes, list, tuple, set, frozenset, dict, `SecretStr` and
+`SecretBytes`, which are stored as their raw values, and `SecretRef`,
+which is stored as its reference). A field holding any other type
+(datetime, enum, nested model, ...) is stored as JSON, with any secrets in
+it unmasked, and validated against the field's type on load, even on the
+fast path.
+
+Layout (little-endian)::
+
+    magic "ACMESNAP" | format u16 | reserved u16 | schema digest 16B | field count u32
+    per field: name length u16 | name (UTF-8) | flags u8 | value
+
+Snapshots hold secret field values as resolved; store them like the
+secrets they contain.
+"""
+
+from __future__ import annotations
+
+import struct
+import weakref
+from typing import TYPE_CHECKING, Any
+
+from acme_config.metadata import get_config_meta
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+    from pydantic_settings import BaseSettings
+
+MAGIC = b"ACMESNAP"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<8sHH16sI")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+# Per-field flags.
+_JSON = 1  # value is JSON and must be validated
+_SET = 2  # field was explicitly set (in `model_fields_set`)
+
+# Per-class field validators for JSON-encoded fields.
+_ADAPTERS: weakref.WeakKeyDictionary[type, dict[str, TypeAdapter[Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class _Unsupported(Exception):
+    """A value the tagged encoding cannot represent exactly."""
+
+
+def _encode(value: Any, out: bytearray) -> None:
+    from pydantic import SecretBytes, SecretStr
+
+    from acme_config.secrets import SecretRef
+
+    cls = type(value)
+    if value is None:
+        out += b"N"
+    elif value is True:
+        out += b"T"
+    elif value is False:
+        out += b"F"
+    elif cls is int:
+        if -(2**63) <= value < 2**63:
+            out += b"i"
+            out += _I64.pack(value)
+        else:
+            digits = str(value).encode()
+            out += b"I"
+            out += _U32.pack(len(digits))
+            out += digits
+    elif cls is float:
+        out += b"f"
+        out += _F64.pack(value)
+    elif cls is str:
+        data = value.encode()
+        out += b"s"
+        out += _U32.pack(len(data))
+        out += data
+    elif cls is bytes:
+        out += b"b"
+        out += _U32.pack(len(value))
+        out += value
+    elif cls is list or cls is tuple or cls is set or cls is frozenset:
+        out += _CONTAINER_TAGS[cls]
+        out += _U32.pack(len(value))
+        for item in value:
+            _encode(item, out)
+    elif cls is dict:
+        out += b"d"
+        out += _U32.pack(len(value))
+        for key, item in value.items():
+            _encode(key, out)
+            _encode(item, out)
+    elif cls is SecretRef:
+        out += b"r"
+        _encode(value.reference, out)
+        _encode(value.ttl, out)
+    elif cls is SecretStr:
+        out += b"x"
+        _encode(value.get_secret_value(), out)
+    elif cls is SecretBytes:
+        out += b"y"
+        _encode(value.get_secret_value(), out)
+    else:
+        raise _Unsupported(cls)
+
+
+_CONTAINER_TAGS = {list: b"l", tuple: b"t", set: b"S", frozenset: b"Z"}
+
+
+def _decode(buf: memoryview, pos: int) -> tuple[Any, int]:
+    tag = buf[pos]
+    pos += 1
+    if tag == 0x73:  # s
+        (size,) = _U32.unpack_from(buf, pos)
+        pos += 4
+        return str(buf[pos : pos + size], "utf-8"), pos + size
+    if tag == 0x69:  # i
+        return _I64.unpack_from(buf, pos)[0], pos + 8
+    if tag == 0x4E:  # N
+        return None, pos
+    if tag == 0x54:  # T
+        return True, pos
+    if tag == 0x46:  # F
+        return False, pos
+    if tag == 0x66:  # f
+        return _F64.unpack_from(buf, pos)[0], pos + 8
+    if tag in _CONTAINERS:
+        (count,) = _U32.unpack_from(buf, pos)
+        pos += 4
+        items = []
+        for _ in range(count):
+            item, pos = _decode(buf, pos)
+            items.append(item)
+        container = _CONTAINERS[tag]
+        return (items if container is list else container(items)), pos
+    if tag == 0x64:  # d
+        (count,) = _U32.unpack_from(buf, pos)
+        pos += 4
+        mapping = {}
+        for _ in range(count):
+            key, pos = _decode(buf, pos)
+            mapping[key], pos = _decode(buf, pos)
+        return mapping, pos
+    if tag == 0x62:  # b
+        (size,) = _U32.unpack_from(buf, pos)
+        pos += 4
+        return bytes(buf[pos : pos + size]), pos + size
+    if tag == 0x49:  # I
+        (size,) = _U32.unpack_from(buf, pos)
+        pos += 4
+        return int(str(buf[pos : pos + size], "ascii")), pos + size
+    if tag == 0x72:  # r
+        from acme_config.secrets import SecretRef
+
+        reference, pos = _decode(buf, pos)
+        ttl, pos = _decode(buf, pos)
+        return SecretRef(reference, ttl=ttl), pos
+    if tag == 0x78:  # x
+        from pydantic import SecretStr
+
+        secret, pos = _decode(buf, pos)
+        return SecretStr(secret), pos
+    if tag == 0x79:  # y
+        from pydantic import SecretBytes
+
+        secret, pos = _decode(buf, pos)
+        return SecretBytes(secret), pos
+    raise ValueError(f"corrupt snapshot: unknown tag {tag:#x} at offset {pos - 1}")
+
+
+_CONTAINERS: dict[int, type] = {0x6C: list, 0x74: tuple, 0x53: set, 0x5A: frozenset}
+
+
+def dump_snapshot(config: BaseSettings) -> bytes:
+    """Encode a config or feature-flag instance as a snapshot; see `load_snapshot`.
+
+    Args:
+        config: An `AppConfig` or `FeatureFlags` instance.
+    """
+    from pydantic_core import to_json
+
+    from acme_config.secrets import reveal_secrets
+
+    meta = get_config_meta(type(config))
+    values = config.__dict__
+    fields_set = config.model_fields_set
+    out = bytearray(
+        _HEADER.pack(MAGIC, FORMAT_VERSION, 0, bytes.fromhex(meta.schema_hash), len(meta.fields))
+    )
+    for field in meta.fields:
+        name = field.name.encode()
+        out += _U16.pack(len(name))
+        out += name
+        flags = _SET if field.name in fields_set else 0
+        value = values[field.name]
+        encoded = bytearray()
+        try:
+            _encode(value, encoded)
+        except _Unsupported:
+            # JSON masks secret types; store their raw values.
+            data = to_json(reveal_secrets(value))
+            encoded = bytearray(b"s")
+            encoded += _U32.pack(len(data))
+            encoded += data
+            flags |= _JSON
+        out.append(flags)
+        out += encoded
+    return bytes(out)
+
+
+def _field_adapter(config_class: type[BaseSettings], name: str) -> TypeAdapter[Any]:
+    adapters = _ADAPTERS.setdefault(config_class, {})
+    adapter = adapters.get(name)
+    if adapter is None:
+        from pydantic import TypeAdapter
+
+        adapter = TypeAdapter(config_class.__pydantic_fields__[name].rebuild_annotation())
+        adapters[name] = adapter
+    return adapter
+
+
+def load_snapshot[T: BaseSettings](
+    config_class: type[T], data: bytes | bytearray | memoryview
+) -> T:
+    """Build a config instance from a snapshot written by `dump_snapshot`.
+
+    If the snapshot's schema hash matches `config_class`, values are used
+    as stored (only JSON-encoded fields are validated) and model
+    validators do not run. Otherwise the stored values are matched to the
+    current fields by name and the instance is fully validated, so a
+    snapshot from an older class definition still loads if its values fit.
+    No source (.env, environment, Parameter Store) is read either way.
+
+    Args:
+        config_class: The config class the snapshot was taken from.
+        data: The snapshot bytes.
+
+    Raises:
+        ValueError: If `data` is not a snapshot in this format version.
+        ValidationError: If the schema changed and the stored values no
+            longer validate.
+    """
+    buf = memoryview(data)
+    if len(buf) < _HEADER.size:
+        raise ValueError("not an acme_config snapshot (too short)")
+    magic, version, _, digest, count = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError(f"not an acme_config snapshot (format {FORMAT_VERSION})")
+    current = digest == bytes.fromhex(get_config_meta(config_class).schema_hash)
+    pos = _HEADER.size
+    values: dict[str, Any] = {}
+    fields_set = set()
+    try:
+        for _ in range(count):
+            (size,) = _U16.unpack_from(buf, pos)
+            pos += 2
+            name = str(buf[pos : pos + size], "utf-8")
+            pos += size
+            flags = buf[pos]
+            value, pos = _decode(buf, pos + 1)
+            if flags & _JSON:
+                if current:
+                    value = _field_adapter(config_class, name).validate_json(value)
+                else:
+                    from pydantic_core import from_json
+
+                    value = from_json(value)
+            if flags & _SET:
+                fields_set.add(name)
+            values[name] = value
+    except (struct.error, IndexError, UnicodeDecodeError) as exc:
+        raise ValueError(f"corrupt snapshot: {exc}") from None
+
+    if current:
+        return config_class.model_construct(_fields_set=fields_set, **values)
+
+    from acme_config.resolver import _validate_values
+
+    fields = config_class.__pydantic_fields__
+    return _validate_values(config_class, {k: v for k, v in values.items() if k in fields})
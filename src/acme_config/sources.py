@@ -0,0 +1,489 @@
+"""Settings sources used by `AppConfig` and `FeatureFlags`.
+
+These replace pydantic-settings' stock sources with faster equivalents.
+`build_settings_sources` assembles them in the same precedence order
+pydantic-settings uses, and `BaseSettings.__init__` merges and validates
+them: init kwargs > environment > .env file > secrets directory > defaults.
+
+Classes with a `parameter_store` entry in `model_config` also read AWS
+Parameter Store, between the environment and the .env file:
+init kwargs > environment > Parameter Store > .env file > secrets > defaults.
+
+`abuild_settings_sources` loads the same sources concurrently for asyncio
+callers; sources that implement `AsyncSettingsSource` are awaited, and
+other blocking sources run on a worker thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Protocol
+
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    EnvSettingsSource,
+    InitSettingsSource,
+    PydanticBaseSettingsSource,
+    SecretsSettingsSource,
+)
+from pydantic_settings.sources import DefaultSettingsSource
+from pydantic_settings.sources.utils import parse_env_vars
+
+from acme_config import instrument
+from acme_config.envfile import load_env_mapping
+from acme_config.environ import environ_index
+from acme_config.metadata import get_config_meta
+from acme_config.parameter_store import DEFAULT_VERSION_TTL, fetch_parameters
+
+# Init options (`_env_file=...` etc.) this module knows how to honour. Any
+# other pydantic-settings option falls back to the stock source pipeline.
+_SOURCE_OPTIONS = frozenset(
+    {
+        "_env_file",
+        "_env_file_encoding",
+        "_case_sensitive",
+        "_env_prefix",
+        "_env_prefix_target",
+        "_env_ignore_empty",
+        "_env_nested_delimiter",
+        "_env_nested_max_split",
+        "_env_parse_none_str",
+        "_env_parse_enums",
+        "_secrets_dir",
+        "_nested_model_default_partial_update",
+    }
+)
+
+
+class SourceSnapshot:
+    """Source data read once and shared by every settings class built under it.
+
+    See `shared_sources`.
+    """
+
+    def __init__(self) -> None:
+        self._env_files: dict[tuple[str, str, bool], Mapping[str, str | None]] = {}
+
+    def env_file(self, path: Path, encoding: str, case_sensitive: bool) -> Mapping[str, str | None]:
+        """Return a .env file's mapping, reading it on first request only."""
+        key = (os.path.abspath(path), encoding, case_sensitive)
+        mapping = self._env_files.get(key)
+        if mapping is None:
+            mapping = load_env_mapping(path, encoding=encoding, case_sensitive=case_sensitive)
+            self._env_files[key] = mapping
+        return mapping
+
+
+_snapshot: ContextVar[SourceSnapshot | None] = ContextVar("acme_config_snapshot", default=None)
+
+
+@contextmanager
+def shared_sources() -> Iterator[SourceSnapshot]:
+    """Read the environment and .env files once for all settings built in this block.
+
+    Inside the block, .env files are read (or `stat`-ed) only the first time
+    a class asks for them, and the environment is not rechecked for changes.
+    Use it around a batch of instantiations that should see one consistent
+    view of the sources, e.g. at service boot.
+    """
+    environ_index.refresh()
+    snapshot = SourceSnapshot()
+    token = _snapshot.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _snapshot.reset(token)
+
+
+class AsyncSettingsSource(Protocol):
+    """A settings source that can load without blocking the event loop.
+
+    `aresolve_config` awaits `acall()` instead of calling the source. It
+    returns the same {field name: value} dict as the synchronous
+    `__call__`, which every source still needs for `resolve_config`.
+    """
+
+    async def acall(self) -> dict[str, Any]: ...
+
+
+class DotEnvSource(DotEnvSettingsSource):
+    """Dotenv source backed by the cached reader in `acme_config.envfile`."""
+
+    def _read_env_file(self, file_path: Path) -> Mapping[str, str | None]:
+        encoding = self.env_file_encoding or "utf-8"
+        case_sensitive = bool(self.case_sensitive)
+        snapshot = _snapshot.get()
+        if snapshot is not None:
+            mapping = snapshot.env_file(file_path, encoding, case_sensitive)
+        else:
+            mapping = load_env_mapping(file_path, encoding=encoding, case_sensitive=case_sensitive)
+        if self.env_ignore_empty or self.env_parse_none_str is not None:
+            return parse_env_vars(
+                mapping, self.case_sensitive, self.env_ignore_empty, self.env_parse_none_str
+            )
+        return mapping
+
+    def _read_env_files(self) -> Mapping[str, str | None]:
+        env_files = self.env_file
+        if env_files is None:
+            return {}
+        if isinstance(env_files, (str, os.PathLike)):
+            env_files = [env_files]
+
+        found = [Path(f).expanduser() for f in env_files]
+        found = [p for p in found if p.is_file() or p.is_fifo()]
+        if len(found) == 1:
+            # Hand back the cached mapping itself instead of copying it.
+            return self._read_env_file(found[0])
+        dotenv_vars: dict[str, str | None] = {}
+        for path in found:
+            dotenv_vars.update(self._read_env_file(path))
+        return dotenv_vars
+
+    async def acall(self) -> dict[str, Any]:
+        """Read the .env file(s) on a worker thread."""
+        if self.env_file is None:
+            return self()
+        return await asyncio.to_thread(self)
+
+    def __call__(self) -> dict[str, Any]:
+        with instrument.span("source", config=self.settings_cls.__name__, source="DotEnvSource"):
+            if (
+                self.config.get("extra") == "ignore"
+                and getattr(self, "dotenv_filtering", None) is None
+            ):
+                # Extra keys would be dropped by validation anyway, so skip the
+                # stock scan that matches every file key against every field.
+                return super(DotEnvSettingsSource, self).__call__()
+            return super().__call__()
+
+
+class IndexedEnvSource(EnvSettingsSource):
+    """Environment source that reads from the shared prefix index.
+
+    Only the variables under the class's `env_prefix` are handed to
+    pydantic-settings, so field lookups never touch the rest of the
+    environment. Classes with aliased fields see the whole (case-folded)
+    environment, since aliases are not prefixed.
+    """
+
+    def _load_env_vars(self) -> Mapping[str, str | None]:
+        prefix = "" if get_config_meta(self.settings_cls).has_aliases else self.env_prefix
+        mapping = environ_index.lookup(
+            prefix, case_sensitive=bool(self.case_sensitive), refresh=_snapshot.get() is None
+        )
+        if self.env_ignore_empty or self.env_parse_none_str is not None:
+            return parse_env_vars(
+                mapping, self.case_sensitive, self.env_ignore_empty, self.env_parse_none_str
+            )
+        return mapping
+
+    def __call__(self) -> dict[str, Any]:
+        with instrument.span(
+            "source", config=self.settings_cls.__name__, source="IndexedEnvSource"
+        ):
+            return super().__call__()
+
+
+class ParameterStoreSource(PydanticBaseSettingsSource):
+    """Settings source reading `/{app}/{env}/{version}` from AWS Parameter Store.
+
+    Parameter names are matched against the class's env var names (e.g.
+    `MYAPP_DB_URL`), falling back to bare field names. Unset arguments are
+    taken from the class's `model_config["parameter_store"]`; see
+    `acme_config.parameter_store.ParameterStoreConfig`.
+
+    Args:
+        settings_cls: The settings class.
+        app: Application name.
+        env: Environment name.
+        version: Version to load. None resolves `DEFAULT_VERSION`.
+        client: SSM client. Defaults to the shared boto3 client.
+        max_age: Seconds a previously resolved `DEFAULT_VERSION` is reused;
+            0 re-reads it.
+    """
+
+    def __init__(
+        self,
+        settings_cls: type[BaseSettings],
+        app: str | None = None,
+        env: str | None = None,
+        version: str | int | None = None,
+        client: Any = None,
+        max_age: float = DEFAULT_VERSION_TTL,
+    ) -> None:
+        super().__init__(settings_cls)
+        options = self.config.get("parameter_store") or {}
+        self.app = app if app is not None else options.get("app")
+        self.env = env if env is not None else options.get("env")
+        self.version = version if version is not None else options.get("version")
+        self.client = client if client is not None else options.get("client")
+        self.max_age = max_age
+
+    def get_field_value(self, field: FieldInfo, field_name: str) -> tuple[Any, str, bool]:
+        # Unused: __call__ maps parameters onto fields in a single pass.
+        return None, field_name, False
+
+    async def acall(self) -> dict[str, Any]:
+        """Fetch the parameters on a worker thread (the SSM client is blocking)."""
+        if not self.app or not self.env:
+            return {}
+        return await asyncio.to_thread(self)
+
+    def __call__(self) -> dict[str, Any]:
+        if not self.app or not self.env:
+            return {}
+        with instrument.span(
+            "source", config=self.settings_cls.__name__, source="ParameterStoreSource"
+        ):
+            return self._load()
+
+    def _load(self) -> dict[str, Any]:
+        parameters = fetch_parameters(self.app, self.env, self.version, self.client, self.max_age)
+        meta = get_config_meta(self.settings_cls)
+        fields = self.settings_cls.__pydantic_fields__
+        data: dict[str, Any] = {}
+        for name, value in parameters.items():
+            field = meta.by_env.get(name.upper()) or meta.by_name.get(name)
+            if field is None:
+                continue
+            info = fields[field.name]
+            if self.field_is_complex(info):
+                value = self.decode_complex_value(field.name, info, value)
+            data[field.name] = value
+        return data
+
+    def __repr__(self) -> str:
+        return f"ParameterStoreSource(app={self.app!r}, env={self.env!r}, version={self.version!r})"
+
+
+def build_settings_sources(
+    settings_cls: type[BaseSettings], values: dict[str, Any]
+) -> tuple[tuple[PydanticBaseSettingsSource, ...], dict[str, Any]] | None:
+    """Build the class's settings sources, highest precedence first.
+
+    Builds the acme_config sources with the options `BaseSettings.__init__`
+    would use, passes them through the class's `settings_customise_sources`
+    and adds the Parameter Store and defaults sources. The result is meant
+    for `BaseSettings.__init__(_build_sources=...)`, which merges and
+    validates it exactly as it does its own sources. Building the stock
+    sources first would read the environment and .env file once more for
+    every instantiation.
+
+    Returns None when `values` or the class config ask for a feature only
+    the stock pipeline supports (e.g. pydantic-settings' own CLI parsing).
+
+    Args:
+        settings_cls: The settings class being instantiated.
+        values: Keyword arguments passed to the constructor.
+
+    Returns:
+        The sources and the init kwargs, as `_build_sources` expects them.
+    """
+    config = settings_cls.model_config
+    if config.get("cli_parse_args") is not None or config.get("cli_settings_source") is not None:
+        return None
+    options: dict[str, Any] = {}
+    init_kwargs: dict[str, Any] = {}
+    for key, value in values.items():
+        if key.startswith("_"):
+            if key not in _SOURCE_OPTIONS:
+                return None
+            options[key[1:]] = value
+        else:
+            init_kwargs[key] = value
+
+    def option(name: str) -> Any:
+        value = options.get(name)
+        return value if value is not None else config.get(name)
+
+    # An explicit `_env_file=None` disables the .env file.
+    env_file = options["env_file"] if "env_file" in options else config.get("env_file")
+    partial_update = option("nested_model_default_partial_update")
+    env_options: dict[str, Any] = {
+        "case_sensitive": option("case_sensitive"),
+        "env_prefix": option("env_prefix"),
+        "env_prefix_target": option("env_prefix_target"),
+        "env_nested_delimiter": option("env_nested_delimiter"),
+        "env_nested_max_split": option("env_nested_max_split"),
+        "env_ignore_empty": option("env_ignore_empty"),
+        "env_parse_none_str": option("env_parse_none_str"),
+        "env_parse_enums": option("env_parse_enums"),
+    }
+
+    dotenv_settings = DotEnvSource(
+        settings_cls,
+        env_file=env_file,
+        env_file_encoding=option("env_file_encoding"),
+        **env_options,
+    )
+    sources = settings_cls.settings_customise_sources(
+        settings_cls,
+        init_settings=InitSettingsSource(
+            settings_cls,
+            init_kwargs=init_kwargs,
+            nested_model_default_partial_update=partial_update,
+        ),
+        env_settings=IndexedEnvSource(settings_cls, **env_options),
+        dotenv_settings=dotenv_settings,
+        file_secret_settings=SecretsSettingsSource(
+            settings_cls,
+            secrets_dir=option("secrets_dir"),
+            case_sensitive=env_options["case_sensitive"],
+            env_prefix=env_options["env_prefix"],
+            env_prefix_target=env_options["env_prefix_target"],
+        ),
+    )
+
+    if config.get("parameter_store") and not any(
+        isinstance(source, ParameterStoreSource) for source in sources
+    ):
+        # Slot in just above the .env file (or last, if that was customised away).
+        position = next(
+            (i for i, source in enumerate(sources) if source is dotenv_settings), len(sources)
+        )
+        sources = (
+            *sources[:position],
+            ParameterStoreSource(settings_cls),
+            *sources[position:],
+        )
+
+    defaults = DefaultSettingsSource(
+        settings_cls, nested_model_default_partial_update=partial_update
+    )
+    return (*sources, defaults), init_kwargs
+
+
+class _ValidateStage(BaseModel):
+    """Reports validation as the "validate" stage.
+
+    `AppConfig` and `FeatureFlags` list it after `BaseSettings`, so it runs
+    when `BaseSettings.__init__` hands the merged sources to `BaseModel`.
+    """
+
+    def __init__(self, /, **data: Any) -> None:
+        with instrument.span("validate", config=type(self).__name__):
+            super().__init__(**data)
+
+
+def settings_init(self: BaseSettings, **values: Any) -> None:
+    """`__init__` of `AppConfig` and `FeatureFlags`.
+
+    Runs `BaseSettings.__init__` on the sources from `build_settings_sources`,
+    or on pydantic-settings' own sources when those are needed.
+    """
+    if "_build_sources" in values:
+        # Sources already loaded by `abuild_settings_sources`.
+        BaseSettings.__init__(self, **values)
+        return
+    with instrument.span("resolve", config=type(self).__name__):
+        built = build_settings_sources(type(self), values)
+        if built is None:
+            BaseSettings.__init__(self, **values)
+        else:
+            BaseSettings.__init__(self, _build_sources=built)
+
+
+def _source_name(source: Any) -> str:
+    return getattr(source, "__name__", type(source).__name__)
+
+
+class _LoadedSource(PydanticBaseSettingsSource):
+    """A source's values, loaded ahead of time by `abuild_settings_sources`."""
+
+    def __init__(self, settings_cls: type[BaseSettings], name: str, state: dict[str, Any]) -> None:
+        super().__init__(settings_cls)
+        self.__name__ = name
+        self.state = state
+
+    def get_field_value(self, field: FieldInfo, field_name: str) -> tuple[Any, str, bool]:
+        return None, field_name, False
+
+    def __call__(self) -> dict[str, Any]:
+        return self.state
+
+
+# Sources that report their own "source" stage from `__call__`.
+_TIMED_SOURCES = (DotEnvSource, IndexedEnvSource, ParameterStoreSource)
+
+
+async def _aload_source(
+    settings_cls: type[BaseSettings], source: Any, timeout: float | None
+) -> dict[str, Any]:
+    name = _source_name(source)
+    span = (
+        nullcontext()
+        if isinstance(source, _TIMED_SOURCES)
+        else instrument.span("source", config=settings_cls.__name__, source=name)
+    )
+    with span:
+        acall = getattr(source, "acall", None)
+        if acall is not None:
+            work = acall()
+        elif isinstance(source, (InitSettingsSource, IndexedEnvSource)) or (
+            isinstance(source, SecretsSettingsSource) and source.secrets_dir is None
+        ):
+            # In-memory: cheaper to call than to hand to a thread.
+            return source()
+        else:
+            work = asyncio.to_thread(source)
+        try:
+            return await asyncio.wait_for(work, timeout)
+        except TimeoutError:
+            raise TimeoutError(
+                f"{name} did not load {settings_cls.__name__} within {timeout}s"
+            ) from None
+
+
+async def abuild_settings_sources(
+    settings_cls: type[BaseSettings],
+    values: dict[str, Any],
+    *,
+    timeout: float | None = None,
+    source_timeouts: Mapping[str, float] | None = None,
+) -> tuple[tuple[PydanticBaseSettingsSource, ...], dict[str, Any]] | None:
+    """Async `build_settings_sources`: load the sources concurrently ahead of time.
+
+    Sources are gathered at once. Sources implementing `AsyncSettingsSource`
+    are awaited; the .env and Parameter Store sources offload their
+    blocking reads to a thread, and other sources that may block (custom
+    or stock sources without `acall`) are run on one. Since they load
+    concurrently, no source sees what the others returned. The loaded
+    values are returned in precedence order for `BaseSettings.__init__`
+    to merge.
+
+    Args:
+        settings_cls: The settings class being instantiated.
+        values: Keyword arguments passed to the constructor.
+        timeout: Seconds each source may take. None waits indefinitely.
+        source_timeouts: Per-source timeouts keyed by source class name
+            (e.g. `"ParameterStoreSource"`), overriding `timeout`.
+
+    Raises:
+        TimeoutError: If a source does not load in time. A source running
+            on a thread cannot be interrupted and finishes in the background.
+    """
+    built = build_settings_sources(settings_cls, values)
+    if built is None:
+        return None
+    (*sources, defaults), init_kwargs = built
+    source_timeouts = source_timeouts or {}
+    states = await asyncio.gather(
+        *(
+            _aload_source(settings_cls, source, source_timeouts.get(_source_name(source), timeout))
+            for source in sources
+        )
+    )
+    loaded = tuple(
+        _LoadedSource(settings_cls, _source_name(source), state)
+        for source, state in zip(sources, states, strict=True)
+    )
+    return (*loaded, defaults), init_kwargs
@@ -0,0 +1,235 @@
+"""Test helpers.
+
+`FakeSSMClient` is an in-memory stand-in for a boto3 SSM client covering
+the Parameter Store calls acme_config makes. It mirrors the real request
+and response shapes, batch limits and error codes, and can inject latency
+and throttling so concurrency and backoff can be exercised without AWS.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+
+class FakeClientError(Exception):
+    """Error shaped like `botocore.exceptions.ClientError` (has `.response`)."""
+
+    def __init__(self, code: str, message: str, operation_name: str) -> None:
+        super().__init__(f"An error occurred ({code}) when calling the {operation_name} operation")
+        self.response = {"Error": {"Code": code, "Message": message}}
+        self.operation_name = operation_name
+
+
+class _Exceptions:
+    """Exception classes exposed as `client.exceptions`, as boto3 does."""
+
+    ClientError = FakeClientError
+
+    class ParameterNotFound(FakeClientError):
+        pass
+
+    class ParameterAlreadyExists(FakeClientError):
+        pass
+
+    class ThrottlingException(FakeClientError):
+        pass
+
+    class ValidationException(FakeClientError):
+        pass
+
+
+class _Paginator:
+    def __init__(self, method: Any) -> None:
+        self._method = method
+
+    def paginate(self, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        token = None
+        while True:
+            page = self._method(**kwargs, **({"NextToken": token} if token else {}))
+            yield page
+            token = page.get("NextToken")
+            if not token:
+                return
+
+
+class FakeSSMClient:
+    """In-memory SSM client for tests and benchmarks.
+
+    Args:
+        latency: Seconds each call sleeps, to simulate a network round trip.
+        max_concurrency: Calls allowed in flight at once; further concurrent
+            calls fail with `ThrottlingException`. None disables throttling.
+        throttle_every: Fail every n-th call with `ThrottlingException`.
+
+    Attributes:
+        calls: Number of calls per operation name.
+        throttled: Number of calls rejected with `ThrottlingException`.
+        max_in_flight: Highest number of concurrent calls seen.
+    """
+
+    exceptions = _Exceptions
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        max_concurrency: int | None = None,
+        throttle_every: int | None = None,
+    ) -> None:
+        self.latency = latency
+        self.max_concurrency = max_concurrency
+        self.throttle_every = throttle_every
+        self.parameters: dict[str, dict[str, Any]] = {}
+        self.calls: Counter[str] = Counter()
+        self.throttled = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    # -- call accounting --------------------------------------------------
+
+    def _enter(self, operation: str) -> None:
+        with self._lock:
+            self.calls[operation] += 1
+            total = sum(self.calls.values())
+            overloaded = (
+                self.max_concurrency is not None and self._in_flight >= self.max_concurrency
+            )
+            scheduled = self.throttle_every is not None and total % self.throttle_every == 0
+            if overloaded or scheduled:
+                self.throttled += 1
+                raise _Exceptions.ThrottlingException(
+                    "ThrottlingException", "Rate exceeded", operation
+                )
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _exit(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _call(self, operation: str, fn: Any, *args: Any) -> Any:
+        self._enter(operation)
+        try:
+            with self._lock:
+                return fn(*args)
+        finally:
+            self._exit()
+
+    # -- helpers ----------------------------------------------------------
+
+    @staticmethod
+    def _public(param: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "Name": param["Name"],
+            "Type": param["Type"],
+            "Value": param["Value"],
+            "Version": param["Version"],
+            "LastModifiedDate": param["LastModifiedDate"],
+        }
+
+    @staticmethod
+    def _check_batch(names: list[str], operation: str) -> None:
+        if not 1 <= len(names) <= 10:
+            raise _Exceptions.ValidationException(
+                "ValidationException", "Names must contain between 1 and 10 items", operation
+            )
+
+    # -- SSM API ----------------------------------------------------------
+
+    def put_parameter(
+        self, *, Name: str, Value: str, Type: str = "String", Overwrite: bool = False, **_: Any
+    ) -> dict[str, Any]:
+        def put() -> dict[str, Any]:
+            existing = self.parameters.get(Name)
+            if existing is not None and not Overwrite:
+                raise _Exceptions.ParameterAlreadyExists(
+                    "ParameterAlreadyExists", f"{Name} already exists", "PutParameter"
+                )
+            version = existing["Version"] + 1 if existing else 1
+            self.parameters[Name] = {
+                "Name": Name,
+                "Type": Type,
+                "Value": Value,
+                "Version": version,
+                "LastModifiedDate": datetime.now(UTC),
+            }
+            return {"Version": version, "Tier": "Standard"}
+
+        return self._call("PutParameter", put)
+
+    def get_parameter(self, *, Name: str, WithDecryption: bool = False) -> dict[str, Any]:
+        def get() -> dict[str, Any]:
+            param = self.parameters.get(Name)
+            if param is None:
+                raise _Exceptions.ParameterNotFound("ParameterNotFound", Name, "GetParameter")
+            return {"Parameter": self._public(param)}
+
+        return self._call("GetParameter", get)
+
+    def get_parameters(self, *, Names: list[str], WithDecryption: bool = False) -> dict[str, Any]:
+        self._check_batch(Names, "GetParameters")
+
+        def get() -> dict[str, Any]:
+            found = [self._public(self.parameters[n]) for n in Names if n in self.parameters]
+            invalid = [n for n in Names if n not in self.parameters]
+            return {"Parameters": found, "InvalidParameters": invalid}
+
+        return self._call("GetParameters", get)
+
+    def get_parameters_by_path(
+        self,
+        *,
+        Path: str,
+        Recursive: bool = False,
+        WithDecryption: bool = False,
+        MaxResults: int = 10,
+        NextToken: str | None = None,
+    ) -> dict[str, Any]:
+        def get() -> dict[str, Any]:
+            prefix = Path.rstrip("/") + "/"
+            names = sorted(
+                n
+                for n in self.parameters
+                if n.startswith(prefix) and (Recursive or "/" not in n[len(prefix) :])
+            )
+            start = int(NextToken) if NextToken else 0
+            page = names[start : start + min(MaxResults, 10)]
+            response: dict[str, Any] = {
+                "Parameters": [self._public(self.parameters[n]) for n in page]
+            }
+            if start + len(page) < len(names):
+                response["NextToken"] = str(start + len(page))
+            return response
+
+        return self._call("GetParametersByPath", get)
+
+    def delete_parameter(self, *, Name: str) -> dict[str, Any]:
+        def delete() -> dict[str, Any]:
+            if self.parameters.pop(Name, None) is None:
+                raise _Exceptions.ParameterNotFound("ParameterNotFound", Name, "DeleteParameter")
+            return {}
+
+        return self._call("DeleteParameter", delete)
+
+    def delete_parameters(self, *, Names: list[str]) -> dict[str, Any]:
+        self._check_batch(Names, "DeleteParameters")
+
+        def delete() -> dict[str, Any]:
+            deleted = [n for n in Names if self.parameters.pop(n, None) is not None]
+            invalid = [n for n in Names if n not in deleted]
+            return {"DeletedParameters": deleted, "InvalidParameters": invalid}
+
+        return self._call("DeleteParameters", delete)
+
+    def get_paginator(self, operation_name: str) -> _Paginator:
+        if operation_name != "get_parameters_by_path":
+            raise NotImplementedError(f"FakeSSMClient has no paginator for {operation_name}")
+        return _Paginator(self.get_parameters_by_path)
@@ -0,0 +1,163 @@
+"""File change watching for live-reloaded configuration.
+
+`FileWatcher` blocks until one of a set of files changes. On Linux it is
+woken by inotify (through ctypes, no extra dependency); elsewhere, or if
+inotify is unavailable, it falls back to polling `os.stat`. Either way a
+change is only reported when the file's (mtime, size, inode) signature
+differs from the last one seen, so spurious events are filtered out.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Iterable
+
+# inotify(7) constants.
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+# IN_MODIFY is left out so a half-written file is not picked up; writers
+# that keep the file open are still caught by the stat safety net.
+_IN_MASK = (
+    0x00000004  # IN_ATTRIB
+    | 0x00000008  # IN_CLOSE_WRITE
+    | 0x00000040  # IN_MOVED_FROM
+    | 0x00000080  # IN_MOVED_TO
+    | 0x00000100  # IN_CREATE
+    | 0x00000200  # IN_DELETE
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+Signature = tuple[int, int, int] | None
+
+
+def _signature(path: str) -> Signature:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class _Inotify:
+    """Minimal inotify binding watching the directories of the given files."""
+
+    def __init__(self, paths: Iterable[str]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._libc = libc
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.fd = fd
+        # Watch parent directories, not the files themselves: editors and
+        # deploy tools usually replace files by renaming over them.
+        watched = 0
+        for directory in {os.path.dirname(p) for p in paths}:
+            wd = libc.inotify_add_watch(fd, os.fsencode(directory), _IN_MASK)
+            if wd >= 0:
+                watched += 1
+        if not watched:
+            os.close(fd)
+            raise OSError("no watchable directories")
+        self._names: set[bytes] = {os.fsencode(os.path.basename(p)) for p in paths}
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to `timeout` seconds; True if a watched file name saw an event."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        hit = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return hit
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if name in self._names:
+                    hit = True
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class FileWatcher:
+    """Report changes to a fixed set of files.
+
+    Args:
+        paths: Files to watch. They need not exist yet; creating one counts
+            as a change.
+        poll_interval: Seconds between stat checks. With inotify this is
+            only a safety net for missed events.
+        use_inotify: Set to False to force stat polling.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[str | os.PathLike[str]],
+        *,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+    ) -> None:
+        self.paths: tuple[str, ...] = tuple(
+            os.path.abspath(os.path.expanduser(os.fspath(p))) for p in paths
+        )
+        self.poll_interval = poll_interval
+        self._signatures = {p: _signature(p) for p in self.paths}
+        self._inotify: _Inotify | None = None
+        if use_inotify and sys.platform.startswith("linux") and self.paths:
+            try:
+                self._inotify = _Inotify(self.paths)
+            except (OSError, AttributeError, TypeError):
+                self._inotify = None
+
+    @property
+    def backend(self) -> str:
+        """`"inotify"` or `"stat"`."""
+        return "inotify" if self._inotify is not None else "stat"
+
+    def check(self) -> bool:
+        """Stat the files now. Returns True if any signature changed since the last check."""
+        changed = False
+        for path in self.paths:
+            signature = _signature(path)
+            if signature != self._signatures[path]:
+                self._signatures[path] = signature
+                changed = True
+        return changed
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until a file changes or `timeout` seconds pass.
+
+        Returns:
+            True if a change was seen, False on timeout.
+        """
+        interval = self.poll_interval if timeout is None else min(timeout, self.poll_interval)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._inotify is not None:
+                self._inotify.wait(interval)
+            else:
+                time.sleep(interval)
+            if self.check():
+                return True
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                interval = min(remaining, self.poll_interval)
+
+    def close(self) -> None:
+        """Release the inotify descriptor, if any."""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
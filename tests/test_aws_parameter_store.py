@@ -0,0 +1,310 @@
+"""Tests for the legacy Parameter Store backend, against the in-memory fake."""
+
+import argparse
+
+import pytest
+
+from acme_config.legacy._main import main_logic
+from acme_config.legacy.aws_parameter_store import (
+    AdaptiveThrottle,
+    ParameterStore,
+    fetch_parameters,
+    get_default_version,
+    set_default_store,
+    set_default_version,
+    set_parameters,
+    sync_parameters,
+)
+from acme_config.legacy.version_cache import VersionCache
+from acme_config.parameter_store import MAX_DELTA_DEPTH
+from acme_config.testing import FakeSSMClient
+
+
+def make_store(client, **kwargs):
+    kwargs.setdefault("throttle", AdaptiveThrottle(rate=10_000, max_rate=10_000))
+    kwargs.setdefault("base_delay", 0.001)
+    return ParameterStore(client, **kwargs)
+
+
+class TestParameterStore:
+    def test_put_parameters_concurrently(self):
+        client = FakeSSMClient(latency=0.005)
+        store = make_store(client, max_workers=4)
+        params = {f"/app/dev/1/KEY_{i}": str(i) for i in range(40)}
+        versions = store.put_parameters(params)
+        assert versions == dict.fromkeys(params, 1)
+        assert {n: p["Value"] for n, p in client.parameters.items()} == params
+        assert 1 < client.max_in_flight <= 4
+
+    def test_put_error_is_raised(self):
+        client = FakeSSMClient()
+        store = make_store(client)
+        store.put_parameters({"/app/dev/1/A": "1"})
+        with pytest.raises(client.exceptions.ParameterAlreadyExists):
+            store.put_parameters({"/app/dev/1/A": "2", "/app/dev/1/B": "2"})
+        assert client.parameters["/app/dev/1/A"]["Value"] == "1"
+
+    def test_retries_throttled_calls(self):
+        client = FakeSSMClient(throttle_every=3)
+        throttle = AdaptiveThrottle(rate=10_000, max_rate=10_000)
+        store = make_store(client, throttle=throttle)
+        params = {f"/app/dev/1/KEY_{i}": "v" for i in range(20)}
+        store.put_parameters(params)
+        assert len(client.parameters) == 20
+        assert client.throttled > 0
+
+    def test_gives_up_after_max_attempts(self):
+        client = FakeSSMClient(throttle_every=1)
+        store = make_store(client, max_attempts=3)
+        with pytest.raises(client.exceptions.ThrottlingException):
+            store.call("get_parameter", Name="/x")
+        assert client.calls["GetParameter"] == 3
+
+    def test_other_errors_not_retried(self):
+        client = FakeSSMClient()
+        store = make_store(client)
+        with pytest.raises(client.exceptions.ParameterNotFound):
+            store.call("get_parameter", Name="/missing")
+        assert client.calls["GetParameter"] == 1
+
+    def test_get_parameters_batches_of_ten(self):
+        client = FakeSSMClient()
+        store = make_store(client)
+        store.put_parameters({f"/p/{i}": str(i) for i in range(23)})
+        names = [f"/p/{i}" for i in range(25)]
+        values = store.get_parameters(names)
+        assert values == {f"/p/{i}": str(i) for i in range(23)}
+        assert client.calls["GetParameters"] == 3
+
+    def test_fetch_parameters_paginates(self):
+        client = FakeSSMClient()
+        store = make_store(client)
+        store.put_parameters({f"/app/dev/1/KEY_{i}": str(i) for i in range(25)})
+        store.put_parameters({"/app/dev/2/KEY_0": "other"})
+        assert store.fetch_parameters("/app/dev/1") == {f"KEY_{i}": str(i) for i in range(25)}
+        assert client.calls["GetParametersByPath"] == 3
+
+
+class TestAdaptiveThrottle:
+    def test_backs_off_and_recovers(self):
+        throttle = AdaptiveThrottle(rate=8, min_rate=2, max_rate=10)
+        throttle.on_throttle()
+        assert throttle.rate == 4
+        throttle.on_throttle()
+        throttle.on_throttle()
+        assert throttle.rate == 2
+        for _ in range(20):
+            throttle.on_success()
+        assert throttle.rate == 10
+
+
+class TestModuleFunctions:
+    def test_set_and_fetch(self):
+        client = FakeSSMClient()
+        set_parameters("app", "dev", 1, {"A": "1", "B": "2"}, client=client)
+        assert fetch_parameters("app", "dev", 1, client=client) == {"A": "1", "B": "2"}
+
+    def test_default_version(self):
+        client = FakeSSMClient()
+        set_default_version("app", "dev", 3, client=client)
+        set_default_version("app", "dev", 4, client=client)
+        assert get_default_version("app", "dev", client=client) == "4"
+
+    def test_missing_default_version(self):
+        client = FakeSSMClient()
+        with pytest.raises(client.exceptions.ParameterNotFound):
+            get_default_version("app", "prod", client=client)
+
+
+class TestSync:
+    def seed(self, store, count=1000):
+        params = {f"KEY_{i}": str(i) for i in range(count)}
+        store.put_parameters({f"/app/dev/1/{k}": v for k, v in params.items()})
+        return params
+
+    def test_plans_the_delta(self):
+        client = FakeSSMClient()
+        store = make_store(client)
+        params = self.seed(store)
+        params["KEY_1"] = "changed"
+        params["NEW"] = "new"
+        del params["KEY_2"]
+        client.calls.clear()
+        plan = store.plan_sync("/app/dev/1", params)
+        assert (plan.inserts, plan.updates, plan.deletes) == (
+            {"NEW": "new"},
+            {"KEY_1": "changed"},
+            ["KEY_2"],
+        )
+        assert plan.unchanged == 998
+        assert plan.values == params
+        assert set(client.calls) == {"GetParametersByPath"}
+
+    def test_writes_a_new_version(self):
+        client = FakeSSMClient()
+        store = make_store(client)
+        old = self.seed(store, 25)
+        params = {**old, "KEY_1": "changed"}
+        store.apply_sync(store.plan_sync("/app/dev/1", params), "/app/dev/2")
+        assert store.fetch_parameters("/app/dev/1") == old
+        assert store.fetch_parameters("/app/dev/2") == params
+
+    def test_writes_only_the_delta(self):
+        client = FakeSSMClient()
+        store = make_store(client)
+        old = self.seed(store)
+        params = {**old, "KEY_1": "changed", "KEY_2": "changed", "NEW": "new"}
+        del params["KEY_3"]
+        plan = store.plan_sync("/app/dev/1", params)
+        client.calls.clear()
+        store.apply_sync(plan, "/app/dev/2")
+        # The base pointer, 2 updates, 1 insert and 1 delete marker.
+        assert client.calls["PutParameter"] == 5
+        assert store.fetch_parameters("/app/dev/1") == old
+        assert store.fetch_parameters("/app/dev/2") == params
+
+    def test_deltas_chain_and_compact(self):
+        client = FakeSSMClient()
+        store = make_store(client)
+        params = self.seed(store, 5)
+        for version in range(2, MAX_DELTA_DEPTH + 3):
+            params = {**params, "KEY_0": str(version)}
+            plan = store.plan_sync(f"/app/dev/{version - 1}", params)
+            assert plan.depth == min(version - 2, MAX_DELTA_DEPTH)
+            store.apply_sync(plan, f"/app/dev/{version}")
+            assert store.fetch_parameters(f"/app/dev/{version}") == params
+        # The version after MAX_DELTA_DEPTH deltas is written in full.
+        assert store.plan_sync(f"/app/dev/{MAX_DELTA_DEPTH + 2}", params).depth == 0
+
+    def test_carries_over_without_delete(self):
+        client = FakeSSMClient()
+        store = make_store(client)
+        store.put_parameters({"/app/dev/1/A": "1", "/app/dev/1/B": "2"})
+        store.apply_sync(store.plan_sync("/app/dev/1", {"A": "3"}, delete=False), "/app/dev/2")
+        assert store.fetch_parameters("/app/dev/2") == {"A": "3", "B": "2"}
+        assert "/app/dev/2/B" not in client.parameters
+
+    def test_rejects_base_cycles_and_reserved_names(self):
+        client = FakeSSMClient()
+        store = make_store(client)
+        store.put_parameters(
+            {"/app/dev/1/__base__": "/app/dev/2", "/app/dev/2/__base__": "/app/dev/1"}
+        )
+        with pytest.raises(ValueError, match="cycle"):
+            store.fetch_parameters("/app/dev/1")
+        with pytest.raises(ValueError, match="reserved"):
+            store.plan_sync(None, {"__base__": "/app/dev/0"})
+
+    def test_has_parameters_follows_next_token(self):
+        class EmptyFirstPage(FakeSSMClient):
+            def get_parameters_by_path(self, **kwargs):
+                if "NextToken" not in kwargs:
+                    return {"Parameters": [], "NextToken": "0"}
+                return super().get_parameters_by_path(**kwargs)
+
+        client = EmptyFirstPage()
+        store = make_store(client)
+        store.put_parameters({"/app/dev/2/A": "1"})
+        assert store.has_parameters("/app/dev/2")
+        assert not store.has_parameters("/app/dev/3")
+
+    def test_no_changes_writes_nothing(self):
+        client = FakeSSMClient()
+        store = make_store(client)
+        params = self.seed(store, 25)
+        set_default_version("app", "dev", 1, client=client)
+        client.calls.clear()
+        plan = sync_parameters("app", "dev", 2, params, client=client)
+        assert not plan
+        assert set(client.calls) == {"GetParameter", "GetParametersByPath"}
+
+    def test_keeps_nested_and_extra_parameters(self):
+        client = FakeSSMClient()
+        store = make_store(client)
+        store.put_parameters({"/app/dev/1/A": "1", "/app/dev/1/B": "2", "/app/dev/1/sub/C": "3"})
+        assert store.plan_sync("/app/dev/1", {"A": "1"}).deletes == ["B"]
+        plan = store.plan_sync("/app/dev/1", {"A": "1"}, delete=False)
+        assert not plan
+        assert plan.values == {"A": "1", "B": "2"}
+
+    def test_refuses_existing_version(self):
+        client = FakeSSMClient()
+        store = make_store(client)
+        self.seed(store, 5)
+        store.put_parameters({"/app/dev/2/OTHER": "x"})
+        for ver_number in (1, 2):
+            with pytest.raises(ValueError, match="already exists"):
+                sync_parameters("app", "dev", ver_number, {"A": "1"}, client=client, from_version=1)
+        assert store.fetch_parameters("/app/dev/2") == {"OTHER": "x"}
+        assert "A" not in store.fetch_parameters("/app/dev/1")
+
+    def test_delete_parameters_in_batches_of_ten(self):
+        client = FakeSSMClient()
+        store = make_store(client)
+        params = self.seed(store, 25)
+        deleted = store.delete_parameters(f"/app/dev/1/{name}" for name in [*params, "MISSING"])
+        assert sorted(deleted) == sorted(f"/app/dev/1/{name}" for name in params)
+        assert client.calls["DeleteParameters"] == 3
+        assert not client.parameters
+
+    def test_dry_run_and_format(self):
+        client = FakeSSMClient()
+        set_parameters("app", "dev", 1, {"A": "1", "B": "2"}, client=client)
+        set_default_version("app", "dev", 1, client=client)
+        plan = sync_parameters(
+            "app", "dev", 2, {"A": "secret", "C": "3"}, client=client, dry_run=True
+        )
+        assert plan.format().splitlines() == [
+            "+ C",
+            "~ A",
+            "- B",
+            "/app/dev/1: 1 to add, 1 to change, 1 to delete, 0 unchanged",
+        ]
+        assert "secret" not in plan.format()
+        assert fetch_parameters("app", "dev", 2, client=client) == {}
+        assert get_default_version("app", "dev", client=client) == "1"
+
+    def test_without_default_version_writes_every_parameter(self):
+        client = FakeSSMClient()
+        plan = sync_parameters("app", "dev", 1, {"A": "1", "B": "2"}, client=client)
+        assert plan.format().splitlines()[-1] == (
+            "(no base version): 2 to add, 0 to change, 0 to delete, 0 unchanged"
+        )
+        assert sorted(client.parameters) == ["/app/dev/1/A", "/app/dev/1/B"]
+
+    def test_cli_sync_publishes_new_version(self, tmp_path, capsys):
+        client = FakeSSMClient()
+        set_default_store(make_store(client))
+        try:
+            set_parameters("app", "dev", 1, {"A": "1"})
+            set_default_version("app", "dev", 1)
+            cache = VersionCache(str(tmp_path / "cache"))
+            assert cache.fetch_parameters("app", "dev", 1) == {"A": "1"}
+            assert cache.get_default_version("app", "dev") == "1"
+            env_file = tmp_path / "params.env"
+            env_file.write_text("A=2\n")
+            args = argparse.Namespace(
+                command="sync",
+                app_name="app",
+                env="dev",
+                ver_number=2,
+                params_path=str(env_file),
+                from_version=None,
+                dry_run=False,
+                no_delete=False,
+                set_default=False,
+                cache_dir=cache.cache_dir,
+            )
+            main_logic(args)
+            assert "~ A" in capsys.readouterr().out
+            assert get_default_version("app", "dev") == "1"
+            env_file.write_text("A=3\n")
+            args.ver_number = 3
+            args.set_default = True
+            main_logic(args)
+            assert cache.get_default_version("app", "dev") == "3"
+            assert cache.fetch_parameters("app", "dev", 1) == {"A": "1"}
+            assert cache.fetch_parameters("app", "dev", 2) == {"A": "2"}
+            assert cache.fetch_parameters("app", "dev", 3) == {"A": "3"}
+        finally:
+            set_default_store(None)
@@ -0,0 +1,188 @@
+"""Tests for the resolve_config resolution cache."""
+
+import os
+import pickle
+
+from pydantic import BaseModel
+
+from acme_config.cache import ResolutionCache
+from acme_config.frozen import freeze
+from acme_config.parameter_store import clear_parameter_store_cache
+from acme_config.resolver import resolve_config
+from acme_config.schema import AppConfig, ConfigField
+from acme_config.testing import FakeSSMClient
+
+
+class CachedConfig(AppConfig):
+    model_config = {"env_prefix": "CACHED_", "env_file": None}
+
+    name: str = ConfigField(description="App name")
+    port: int = ConfigField(default=8080, description="Port")
+
+
+class Database(BaseModel):
+    host: str = "localhost"
+
+
+class TaggedConfig(AppConfig):
+    model_config = {"env_prefix": "CACHED_TAGS_", "env_file": None, "env_nested_delimiter": "__"}
+
+    name: str = ConfigField(description="App name")
+    tags: list[str] = ConfigField(default=["a"], description="Tags")
+    db: Database = ConfigField(default=Database(), description="Database")
+
+
+class TestResolutionCache:
+    def test_hit_returns_equal_instance(self, monkeypatch):
+        monkeypatch.setenv("CACHED_NAME", "svc")
+        cache = ResolutionCache()
+        first = resolve_config(CachedConfig, cache=cache)
+        second = resolve_config(CachedConfig, cache=cache)
+        assert first == second == resolve_config(CachedConfig)
+        assert type(second) is CachedConfig
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 128}
+
+    def test_instances_pickle_and_freeze(self, monkeypatch):
+        monkeypatch.setenv("CACHED_NAME", "svc")
+        cache = ResolutionCache()
+        resolve_config(CachedConfig, cache=cache)
+        config = resolve_config(CachedConfig, cache=cache)
+        assert pickle.loads(pickle.dumps(config)) == config
+        assert freeze(config).name == "svc"
+
+    def test_changes_do_not_reach_other_callers(self, monkeypatch):
+        monkeypatch.setenv("CACHED_TAGS_NAME", "svc")
+        cache = ResolutionCache()
+        first = resolve_config(TaggedConfig, cache=cache)
+        first.tags.append("leak")
+        first.db.host = "leak"
+        first.name = "leak"
+        second = resolve_config(TaggedConfig, cache=cache)
+        second.tags.append("leak")
+        third = resolve_config(TaggedConfig, cache=cache)
+        assert (third.name, third.tags, third.db.host) == ("svc", ["a"], "localhost")
+        assert cache.hits == 2
+
+    def test_nested_env_change_misses(self, monkeypatch):
+        monkeypatch.setenv("CACHED_TAGS_NAME", "svc")
+        monkeypatch.setenv("CACHED_TAGS_DB__HOST", "one")
+        cache = ResolutionCache()
+        assert resolve_config(TaggedConfig, cache=cache).db.host == "one"
+        monkeypatch.setenv("CACHED_TAGS_DB__HOST", "two")
+        assert resolve_config(TaggedConfig, cache=cache).db.host == "two"
+        assert cache.hits == 0
+
+    def test_secrets_dir_change_misses(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("CACHED_NAME", raising=False)
+
+        class SecretsConfig(CachedConfig):
+            model_config = {"secrets_dir": str(tmp_path)}
+
+        cache = ResolutionCache()
+        (tmp_path / "cached_name").write_text("first")
+        assert resolve_config(SecretsConfig, cache=cache).name == "first"
+        (tmp_path / "cached_name").write_text("second-value")
+        assert resolve_config(SecretsConfig, cache=cache).name == "second-value"
+        assert cache.hits == 0
+
+    def test_parameter_store_version_change_misses(self, monkeypatch):
+        monkeypatch.delenv("CACHED_NAME", raising=False)
+        client = FakeSSMClient()
+        for name, value in {
+            "/cached/dev/DEFAULT_VERSION": "1",
+            "/cached/dev/1/CACHED_NAME": "one",
+            "/cached/dev/2/CACHED_NAME": "two",
+        }.items():
+            client.put_parameter(Name=name, Value=value)
+
+        class StoredConfig(CachedConfig):
+            model_config = {"parameter_store": {"app": "cached", "env": "dev", "client": client}}
+
+        cache = ResolutionCache()
+        clear_parameter_store_cache()
+        try:
+            assert resolve_config(StoredConfig, cache=cache).name == "one"
+            client.put_parameter(Name="/cached/dev/DEFAULT_VERSION", Value="2", Overwrite=True)
+            clear_parameter_store_cache()
+            assert resolve_config(StoredConfig, cache=cache).name == "two"
+        finally:
+            clear_parameter_store_cache()
+        assert cache.hits == 0
+
+    def test_custom_sources_bypass_cache(self, monkeypatch):
+        monkeypatch.setenv("CACHED_NAME", "svc")
+
+        class CustomConfig(CachedConfig):
+            @classmethod
+            def settings_customise_sources(cls, settings_cls, **sources):
+                return (sources["init_settings"], sources["env_settings"])
+
+        cache = ResolutionCache()
+        resolve_config(CustomConfig, cache=cache)
+        resolve_config(CustomConfig, cache=cache)
+        assert cache.stats()["size"] == 0
+
+    def test_overrides_are_part_of_key(self, monkeypatch):
+        monkeypatch.setenv("CACHED_NAME", "svc")
+        cache = ResolutionCache()
+        a = resolve_config(CachedConfig, overrides={"port": 1}, cache=cache)
+        b = resolve_config(CachedConfig, overrides={"port": 2}, cache=cache)
+        assert (a.port, b.port) == (1, 2)
+        assert cache.misses == 2
+
+    def test_none_cli_args_normalized(self, monkeypatch):
+        monkeypatch.setenv("CACHED_NAME", "svc")
+        cache = ResolutionCache()
+        resolve_config(CachedConfig, cache=cache)
+        resolve_config(CachedConfig, cli_args={"port": None}, cache=cache)
+        assert cache.hits == 1
+
+    def test_env_change_misses(self, monkeypatch):
+        monkeypatch.setenv("CACHED_NAME", "one")
+        cache = ResolutionCache()
+        assert resolve_config(CachedConfig, cache=cache).name == "one"
+        monkeypatch.setenv("CACHED_NAME", "two")
+        assert resolve_config(CachedConfig, cache=cache).name == "two"
+        assert cache.hits == 0
+
+    def test_env_file_change_misses(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("CACHED_NAME", raising=False)
+        env_file = tmp_path / ".env"
+        env_file.write_text("CACHED_NAME=first\n")
+        cache = ResolutionCache()
+        assert resolve_config(CachedConfig, env_file=str(env_file), cache=cache).name == "first"
+        env_file.write_text("CACHED_NAME=second-value\n")
+        st = env_file.stat()
+        os.utime(env_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert resolve_config(CachedConfig, env_file=str(env_file), cache=cache).name == (
+            "second-value"
+        )
+
+    def test_interpolated_env_change_misses(self, tmp_path, monkeypatch):
+        env_file = tmp_path / ".env"
+        env_file.write_text("CACHED_NAME=${CACHED_HOSTX}/db\n")
+        monkeypatch.delenv("CACHED_NAME", raising=False)
+        monkeypatch.setenv("CACHED_HOSTX", "one")
+        cache = ResolutionCache()
+        assert resolve_config(CachedConfig, env_file=str(env_file), cache=cache).name == "one/db"
+        monkeypatch.setenv("CACHED_HOSTX", "two")
+        assert resolve_config(CachedConfig, env_file=str(env_file), cache=cache).name == "two/db"
+        assert cache.hits == 0
+
+    def test_lru_eviction(self, monkeypatch):
+        monkeypatch.setenv("CACHED_NAME", "svc")
+        cache = ResolutionCache(maxsize=2)
+        for port in (1, 2, 3):
+            resolve_config(CachedConfig, overrides={"port": port}, cache=cache)
+        assert len(cache) == 2
+        resolve_config(CachedConfig, overrides={"port": 1}, cache=cache)
+        assert cache.hits == 0
+
+    def test_unhashable_values_bypass_cache(self, monkeypatch):
+        monkeypatch.setenv("CACHED_NAME", "svc")
+        cache = ResolutionCache()
+        overrides = {"port": 1, "extra": bytearray(b"x")}
+        resolve_config(CachedConfig, overrides=overrides, cache=cache)
+        resolve_config(CachedConfig, overrides=overrides, cache=cache)
+        assert cache.stats()["size"] == 0
+        assert cache.misses == 2
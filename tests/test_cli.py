@@ -0,0 +1,113 @@
+"""Tests for compiled CLI specs and fast CLI parsing."""
+
+import subprocess
+import sys
+
+import pytest
+
+from acme_config.cli import CliOption, CliSpec, get_cli_parser, get_cli_spec, parse_cli
+from acme_config.metadata import get_config_meta
+from acme_config.resolver import build_cli_parser, resolve_config
+from acme_config.schema import AppConfig, ConfigField
+
+
+class CliConfig(AppConfig):
+    model_config = {"env_prefix": "CLI_"}
+
+    name: str = ConfigField(description="App name", cli_flag="--name")
+    port: int = ConfigField(default=8080, description="Port", cli_flag="--port")
+    debug: bool = ConfigField(default=False, description="Debug", cli_flag="--debug")
+    cache: bool = ConfigField(default=True, description="Cache", cli_flag="--no-cache")
+    token: str = ConfigField(default="", description="Token", secret=True)
+
+
+class TestCliSpec:
+    def test_compiled_options(self):
+        spec = get_cli_spec(CliConfig)
+        assert spec.options == (
+            CliOption("--name", "name", "value", "App name"),
+            CliOption("--port", "port", "value", "Port"),
+            CliOption("--debug", "debug", "store_true", "Debug"),
+            CliOption("--no-cache", "cache", "store_false", "Cache"),
+        )
+        assert spec.schema_hash == get_config_meta(CliConfig).schema_hash
+
+    def test_cached_per_class(self):
+        assert get_cli_spec(CliConfig) is get_cli_spec(CliConfig)
+
+    def test_json_round_trip(self, tmp_path):
+        spec = get_cli_spec(CliConfig)
+        path = tmp_path / "cli.json"
+        spec.save(path)
+        loaded = CliSpec.load(path)
+        assert loaded.options == spec.options
+        assert loaded.schema_hash == spec.schema_hash
+        assert loaded.class_name == "CliConfig"
+
+    def test_rejects_other_json(self):
+        with pytest.raises(ValueError):
+            CliSpec.from_json('{"format": 99}')
+
+    def test_load_does_not_import_pydantic(self, tmp_path):
+        path = tmp_path / "cli.json"
+        get_cli_spec(CliConfig).save(path)
+        code = (
+            "import sys; from acme_config.cli import CliSpec; "
+            f"spec = CliSpec.load({str(path)!r}); "
+            "assert spec.parse(['--port', '1']) == {'port': '1'}; "
+            "assert 'pydantic' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_parse_only_given_values(self):
+        spec = get_cli_spec(CliConfig)
+        assert spec.parse([]) == {}
+        assert spec.parse(["--port", "9000", "--debug"]) == {"port": "9000", "debug": True}
+        assert spec.parse(["--name=x", "--no-cache"]) == {"name": "x", "cache": False}
+        assert spec.parse(["--port", "1", "--port", "2"]) == {"port": "2"}
+
+    @pytest.mark.parametrize(
+        "argv",
+        [["--help"], ["--po", "1"], ["positional"], ["--port"], ["--port", "-1"], ["--debug=1"]],
+    )
+    def test_parse_defers_to_argparse(self, argv):
+        assert get_cli_spec(CliConfig).parse(argv) is None
+
+
+class TestParseCli:
+    def test_fast_path(self):
+        assert parse_cli(CliConfig, ["--name", "svc", "--debug"]) == {"name": "svc", "debug": True}
+
+    def test_fallback_keeps_only_given_values(self):
+        # Abbreviations go through argparse, which still omits missing options.
+        assert parse_cli(CliConfig, ["--po", "1"]) == {"port": "1"}
+
+    def test_invalid_arguments_exit(self):
+        with pytest.raises(SystemExit):
+            parse_cli(CliConfig, ["--unknown"])
+
+    def test_missing_switch_does_not_override_env(self, monkeypatch):
+        monkeypatch.setenv("CLI_NAME", "svc")
+        monkeypatch.setenv("CLI_DEBUG", "true")
+        config = resolve_config(CliConfig, cli_args=parse_cli(CliConfig, ["--port", "1"]))
+        assert config.debug is True
+        assert config.port == 1
+
+    def test_matches_build_cli_parser(self):
+        argv = ["--name", "svc", "--port", "1", "--no-cache"]
+        parsed = vars(build_cli_parser(CliConfig).parse_args(argv))
+        assert parse_cli(CliConfig, argv) == {k: parsed[k] for k in ("name", "port", "cache")}
+
+
+class TestParserCache:
+    def test_shared_per_prog_and_description(self):
+        parser = get_cli_parser(CliConfig, prog="svc")
+        assert get_cli_parser(CliConfig, prog="svc") is parser
+        assert get_cli_parser(CliConfig, prog="other") is not parser
+        assert get_cli_parser(CliConfig, prog="svc", description="d") is not parser
+
+    def test_build_cli_parser_returns_new_parser(self):
+        parser = build_cli_parser(CliConfig)
+        parser.add_argument("--verbose", action="store_true")
+        assert build_cli_parser(CliConfig) is not parser
+        build_cli_parser(CliConfig).add_argument("--verbose", action="store_true")
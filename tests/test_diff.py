@@ -0,0 +1,114 @@
+"""Tests for config diffs."""
+
+import pytest
+
+from acme_config.cache import ResolutionCache
+from acme_config.diff import diff_config
+from acme_config.features import FeatureFlag, FeatureFlags
+from acme_config.frozen import freeze
+from acme_config.resolver import resolve_config
+from acme_config.schema import AppConfig, ConfigField
+from acme_config.secrets import SecretRef
+
+
+class DiffConfig(AppConfig):
+    model_config = {"env_prefix": "DIFF_", "env_file": None}
+
+    name: str = ConfigField(default="svc", description="Name")
+    port: int = ConfigField(default=8080, description="Port")
+    log_level: str = ConfigField(default="INFO", description="Log level", reload="hot")
+    tags: list[str] = ConfigField(default=[], description="Tags", reload="hot")
+    password: str = ConfigField(default="pw", description="Password", secret=True)
+    token: SecretRef = ConfigField(default="env:DIFF_TOKEN_SOURCE", description="Token")
+
+
+class OtherConfig(AppConfig):
+    model_config = {"env_prefix": "OTHER_", "env_file": None}
+
+    name: str = ConfigField(default="svc", description="Name")
+
+
+class DiffFlags(FeatureFlags):
+    model_config = {"env_prefix": "DIFF_FEATURE_", "env_file": None}
+
+    beta: bool = FeatureFlag(default=False, description="Beta")
+    legacy: bool = FeatureFlag(default=True, description="Legacy", reload="restart")
+
+
+class TestDiffConfig:
+    def test_no_changes(self):
+        diff = diff_config(DiffConfig(), DiffConfig())
+        assert not diff
+        assert len(diff) == 0
+        assert not diff.restart_required
+
+    def test_changed_fields(self):
+        diff = diff_config(DiffConfig(), DiffConfig(port=9000, log_level="DEBUG"))
+        assert diff.changed == ["port", "log_level"]
+        assert diff.hot == ["log_level"]
+        assert diff.restart == ["port"]
+        assert diff.restart_required
+        change = diff["port"]
+        assert (change.old, change.new, change.env_var) == (8080, 9000, "DIFF_PORT")
+        assert "port" in diff and "name" not in diff
+        assert str(change) == "port: 8080 -> 9000 [restart]"
+
+    def test_secrets_redacted(self):
+        diff = diff_config(DiffConfig(), DiffConfig(password="new", token="env:OTHER"))
+        assert diff.changed == ["password", "token"]
+        for change in diff:
+            assert change.secret
+            assert (change.old, change.new) == ("***", "***")
+        assert "new" not in repr(diff) and "OTHER" not in str(list(diff))
+
+    def test_secret_ref_compared_by_reference(self):
+        assert not diff_config(DiffConfig(token="env:A"), DiffConfig(token="env:A"))
+
+    def test_class_mismatch(self):
+        with pytest.raises(TypeError, match="cannot diff DiffConfig against OtherConfig"):
+            diff_config(DiffConfig(), OtherConfig())
+
+    def test_frozen_and_cached_instances(self, monkeypatch):
+        old = DiffConfig(tags=["a"])
+        assert not diff_config(freeze(old), old)
+        assert diff_config(old, freeze(DiffConfig(tags=["b"]))).changed == ["tags"]
+        monkeypatch.setenv("DIFF_PORT", "1")
+        cached = resolve_config(DiffConfig, cache=ResolutionCache())
+        assert diff_config(old, cached).changed == ["port", "tags"]
+
+    def test_feature_flags_default_hot(self):
+        diff = diff_config(DiffFlags(), DiffFlags(beta=True, legacy=False))
+        assert diff.hot == ["beta"]
+        assert diff.restart == ["legacy"]
+
+    def test_invalid_reload(self):
+        with pytest.raises(ValueError, match="reload"):
+            ConfigField(default=1, reload="sometimes")
+
+
+class TestApply:
+    def test_applies_hot_changes_only(self):
+        old = DiffConfig()
+        diff = diff_config(old, DiffConfig(port=9000, log_level="DEBUG", tags=["x"]))
+        applied = diff.apply(old)
+        assert (applied.port, applied.log_level, applied.tags) == (8080, "DEBUG", ["x"])
+        assert old.log_level == "INFO"
+
+    def test_applies_everything_with_restart(self):
+        new = DiffConfig(port=9000, password="new")
+        applied = diff_config(DiffConfig(), new).apply(DiffConfig(), restart=True)
+        assert applied == new
+
+    def test_from_frozen(self):
+        old = DiffConfig()
+        applied = diff_config(old, freeze(DiffConfig(tags=["x"]))).apply(old)
+        assert applied.tags == ["x"]
+
+    def test_no_changes_returns_config(self):
+        old = DiffConfig()
+        assert diff_config(old, DiffConfig(port=1)).apply(old) is old
+
+    def test_wrong_class(self):
+        diff = diff_config(DiffConfig(), DiffConfig(log_level="DEBUG"))
+        with pytest.raises(TypeError):
+            diff.apply(OtherConfig())
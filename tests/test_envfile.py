@@ -0,0 +1,130 @@
+"""Tests for the fast .env reader."""
+
+import pytest
+from dotenv import dotenv_values
+
+from acme_config.envfile import (
+    clear_env_file_cache,
+    env_file_cache_info,
+    env_file_references,
+    load_env_mapping,
+    parse_dotenv,
+    read_env_file,
+)
+from acme_config.schema import AppConfig, ConfigField
+
+SAMPLE = """\
+# comment
+export PLAIN=value
+SPACED = padded   # inline comment
+HASH=a#b
+SINGLE='it\\'s # not a comment'
+DOUBLE="line1\\nline2\\t\\"quoted\\""
+MULTI="first
+second"
+EMPTY=
+NO_VALUE
+REF=${PLAIN}-${MISSING:-fallback}
+"""
+
+
+class FileConfig(AppConfig):
+    model_config = {"env_prefix": "FILECFG_"}
+
+    name: str = ConfigField(description="Name")
+    port: int = ConfigField(default=8080, description="Port")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_env_file_cache()
+    yield
+    clear_env_file_cache()
+
+
+class TestParseDotenv:
+    def test_matches_python_dotenv(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text(SAMPLE)
+        assert read_env_file(path) == dict(dotenv_values(path))
+
+    def test_values(self):
+        values = dict(parse_dotenv(SAMPLE))
+        assert values["PLAIN"] == "value"
+        assert values["SPACED"] == "padded"
+        assert values["HASH"] == "a#b"
+        assert values["SINGLE"] == "it's # not a comment"
+        assert values["DOUBLE"] == 'line1\nline2\t"quoted"'
+        assert values["MULTI"] == "first\nsecond"
+        assert values["EMPTY"] == ""
+        assert values["NO_VALUE"] is None
+
+    def test_malformed_lines_skipped(self):
+        assert parse_dotenv("foo bar=baz\nOK=1\n") == [("OK", "1")]
+
+    def test_crlf(self):
+        assert parse_dotenv("A=1\r\nB=2\r\n") == [("A", "1"), ("B", "2")]
+
+
+class TestReadEnvFile:
+    def test_interpolation(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("FROM_ENV", "env")
+        path = tmp_path / ".env"
+        path.write_text("A=${FROM_ENV}\nB=${A}/x\nC=${NOPE:-d}\n")
+        assert read_env_file(path) == {"A": "env", "B": "env/x", "C": "d"}
+        assert read_env_file(path, interpolate=False)["B"] == "${A}/x"
+
+    def test_environ_references(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("A=${HOST}\nB=${A}:${PORT:-1}\nC=${LATER}\nLATER=x\n")
+        assert env_file_references(path) == {"HOST", "PORT", "LATER"}
+
+    def test_cached_by_mtime_and_size(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("A=1\n")
+        read_env_file(path)
+        read_env_file(path)
+        assert env_file_cache_info()["hits"] == 1
+
+        path.write_text("A=22\n")
+        assert read_env_file(path) == {"A": "22"}
+        assert env_file_cache_info()["misses"] == 2
+
+    def test_returns_copies(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("A=1\n")
+        read_env_file(path)["A"] = "changed"
+        assert read_env_file(path) == {"A": "1"}
+
+    def test_case_folded_mapping(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("Mixed_Case=1\n")
+        assert dict(load_env_mapping(path, case_sensitive=False)) == {"mixed_case": "1"}
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("")
+        assert read_env_file(path) == {}
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            read_env_file(tmp_path / "missing.env")
+
+
+class TestDotEnvSource:
+    def test_app_config_reads_file(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("FILECFG_NAME", raising=False)
+        path = tmp_path / ".env"
+        path.write_text("FILECFG_NAME=from-file\nFILECFG_PORT=9000\nOTHER=1\n")
+        config = FileConfig(_env_file=str(path))
+        assert (config.name, config.port) == ("from-file", 9000)
+
+        FileConfig(_env_file=str(path))
+        assert env_file_cache_info()["hits"] == 1
+
+    def test_env_and_init_precedence(self, tmp_path, monkeypatch):
+        path = tmp_path / ".env"
+        path.write_text("FILECFG_NAME=from-file\nFILECFG_PORT=9000\n")
+        monkeypatch.setenv("FILECFG_PORT", "9100")
+        config = FileConfig(_env_file=str(path), name="from-init")
+        assert (config.name, config.port) == ("from-init", 9100)
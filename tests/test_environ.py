@@ -0,0 +1,78 @@
+"""Tests for the prefix-indexed environment source."""
+
+from pydantic import Field
+
+from acme_config.environ import EnvironIndex
+from acme_config.schema import AppConfig, ConfigField
+
+
+class IndexedConfig(AppConfig):
+    model_config = {"env_prefix": "IDX_", "env_file": None}
+
+    name: str = ConfigField(default="default", description="Name")
+    count: int = ConfigField(default=0, description="Count")
+
+
+class AliasedConfig(AppConfig):
+    model_config = {"env_prefix": "ALIASED_", "env_file": None}
+
+    token: str = Field(default="", validation_alias="RAW_TOKEN")
+
+
+class TestEnvironIndex:
+    def test_prefix_view(self, monkeypatch):
+        monkeypatch.setenv("IDX_NAME", "x")
+        monkeypatch.setenv("OTHER_NAME", "y")
+        index = EnvironIndex()
+        view = index.lookup("IDX_")
+        assert view["idx_name"] == "x"
+        assert "other_name" not in view
+
+    def test_case_sensitive_view(self, monkeypatch):
+        monkeypatch.setenv("IDX_Name", "x")
+        index = EnvironIndex()
+        assert index.lookup("IDX_", case_sensitive=True)["IDX_Name"] == "x"
+        assert "idx_name" in index.lookup("idx_")
+
+    def test_views_shared_until_change(self, monkeypatch):
+        monkeypatch.setenv("IDX_NAME", "x")
+        index = EnvironIndex()
+        first = index.lookup("IDX_")
+        assert index.lookup("idx_") is first
+        assert index.refresh() is False
+
+        monkeypatch.setenv("IDX_NAME", "changed")
+        generation = index.generation
+        assert index.lookup("IDX_")["idx_name"] == "changed"
+        assert index.generation == generation + 1
+
+    def test_detects_removal(self, monkeypatch):
+        monkeypatch.setenv("IDX_COUNT", "1")
+        index = EnvironIndex()
+        assert "idx_count" in index.lookup("IDX_")
+        monkeypatch.delenv("IDX_COUNT")
+        assert "idx_count" not in index.lookup("IDX_")
+
+    def test_force_refresh(self, monkeypatch):
+        index = EnvironIndex()
+        index.lookup("IDX_")
+        assert index.refresh() is False
+        assert index.refresh(force=True) is True
+
+
+class TestIndexedEnvSource:
+    def test_config_reads_prefixed_vars(self, monkeypatch):
+        monkeypatch.setenv("IDX_NAME", "from-env")
+        monkeypatch.setenv("idx_count", "3")
+        config = IndexedConfig()
+        assert (config.name, config.count) == ("from-env", 3)
+
+    def test_sees_environment_changes(self, monkeypatch):
+        monkeypatch.setenv("IDX_COUNT", "1")
+        assert IndexedConfig().count == 1
+        monkeypatch.setenv("IDX_COUNT", "2")
+        assert IndexedConfig().count == 2
+
+    def test_aliases_bypass_prefix(self, monkeypatch):
+        monkeypatch.setenv("RAW_TOKEN", "secret")
+        assert AliasedConfig().token == "secret"
@@ -1,6 +1,11 @@
 """Tests for feature flags."""
 
-from acme_config.features import FeatureFlag, FeatureFlags, list_flags
+import threading
+
+import pytest
+from pydantic import ValidationError
+
+from acme_config.features import FeatureFlag, FeatureFlags, LiveFeatureFlags, list_flags
 
 
 class SampleFeatures(FeatureFlags):
@@ -40,6 +45,108 @@ class TestFeatureFlags:
         assert flags.parallel is False
 
 
+class MixedFeatures(FeatureFlags):
+    model_config = {"env_prefix": "MIXED_FEATURE_", "env_file": None}
+
+    alpha: bool = FeatureFlag(default=True, description="Alpha")
+    limit: int = 5
+    beta: bool = FeatureFlag(default=False, description="Beta")
+    gamma: bool = FeatureFlag(default=True, description="Gamma")
+
+
+class TestCompiledFlags:
+    def test_as_mask(self):
+        # Bits follow declaration order of bool fields: alpha=0, beta=1, gamma=2.
+        assert MixedFeatures().as_mask() == 0b101
+
+    def test_enabled_set(self, monkeypatch):
+        monkeypatch.setenv("MIXED_FEATURE_BETA", "true")
+        assert MixedFeatures().enabled_set() == frozenset({"alpha", "beta", "gamma"})
+
+    def test_assignment_updates_mask(self):
+        flags = MixedFeatures()
+        assert flags.is_enabled("beta") is False
+        flags.beta = True
+        assert flags.is_enabled("beta") is True
+        assert flags.as_mask() == 0b111
+
+    def test_non_bool_field_raises_type_error(self):
+        with pytest.raises(TypeError):
+            MixedFeatures().is_enabled("limit")
+
+    def test_unvalidated_value_raises_type_error(self):
+        flags = MixedFeatures.model_construct(alpha="yes")
+        with pytest.raises(TypeError):
+            flags.is_enabled("alpha")
+        assert flags.is_enabled("gamma") is True
+
+    def test_copy_recompiles(self):
+        flags = MixedFeatures()
+        flags.is_enabled("alpha")
+        copy = flags.model_copy(update={"alpha": False})
+        assert copy.is_enabled("alpha") is False
+        assert flags.is_enabled("alpha") is True
+
+
+class RolloutFeatures(FeatureFlags):
+    model_config = {"env_prefix": "ROLLOUT_FEATURE_", "env_file": None}
+
+    search: bool = FeatureFlag(default=True, rollout=20, allow=["vip"], deny=["banned"])
+    everyone: bool = FeatureFlag(default=True, deny=["banned"])
+    nobody: bool = FeatureFlag(default=True, rollout=0, allow=["vip"])
+    plain: bool = FeatureFlag(default=True)
+    off: bool = FeatureFlag(default=False, rollout=100)
+    numeric: bool = FeatureFlag(default=True, rollout=0, allow=[42, "a"], deny=[7])
+
+
+class TestRollouts:
+    def test_rollout_fraction(self):
+        ids = [f"user-{i}" for i in range(20_000)]
+        enabled = RolloutFeatures().evaluate_many("search", ids)
+        assert 0.18 < sum(enabled) / len(ids) < 0.22
+
+    def test_stable_buckets(self):
+        # Buckets must never move between releases or processes.
+        flags = RolloutFeatures()
+        enabled = [i for i in range(8) if flags.evaluate("search", f"user-{i}")]
+        assert enabled == [7]
+
+    def test_allow_and_deny(self):
+        flags = RolloutFeatures()
+        assert flags.evaluate("search", "vip") is True
+        assert flags.evaluate("search", "banned") is False
+        assert flags.evaluate("everyone", "anyone") is True
+        assert flags.evaluate("everyone", "banned") is False
+        assert flags.evaluate_many("nobody", ["vip", "user-1"]) == [True, False]
+
+    def test_int_entity_ids_in_lists(self):
+        flags = RolloutFeatures()
+        assert flags.evaluate("numeric", 42) is True
+        assert flags.evaluate("numeric", "a") is True
+        assert flags.evaluate_many("numeric", [42, "42", 7, 8]) == [True, True, False, False]
+
+    def test_global_switch(self, monkeypatch):
+        flags = RolloutFeatures()
+        assert flags.evaluate("off", "vip") is False
+        monkeypatch.setenv("ROLLOUT_FEATURE_SEARCH", "false")
+        assert RolloutFeatures().evaluate_many("search", ["vip", "user-7"]) == [False, False]
+
+    def test_flag_without_rules(self):
+        assert RolloutFeatures().evaluate_many("plain", [1, 2]) == [True, True]
+
+    def test_evaluate_many_matches_evaluate(self):
+        flags = RolloutFeatures()
+        ids = [*range(500), "vip", "banned"]
+        assert flags.evaluate_many("search", ids) == [flags.evaluate("search", e) for e in ids]
+
+    def test_errors(self):
+        flags = RolloutFeatures()
+        with pytest.raises(AttributeError):
+            flags.evaluate("missing", "user")
+        with pytest.raises(ValueError):
+            FeatureFlag(rollout=150)
+
+
 class TestListFlags:
     def test_list_all_flags(self):
         flags = SampleFeatures()
@@ -58,3 +165,69 @@ class TestListFlags:
         assert dashboard["value"] is True
         assert dashboard["default"] is False
         assert dashboard["description"] == "Enable new dashboard"
+
+
+class LiveSample(FeatureFlags):
+    model_config = {"env_prefix": "LIVE_FEATURE_"}
+
+    beta: bool = FeatureFlag(default=False, description="Beta")
+    limit: int = 1
+
+
+@pytest.fixture(params=[True, False], ids=["inotify", "stat"])
+def use_inotify(request):
+    return request.param
+
+
+class TestLiveFeatureFlags:
+    def test_reloads_on_file_change(self, tmp_path, use_inotify):
+        env_file = tmp_path / ".env"
+        env_file.write_text("LIVE_FEATURE_BETA=false\n")
+        changed = threading.Event()
+        with LiveFeatureFlags(
+            LiveSample, env_file=env_file, poll_interval=0.05, use_inotify=use_inotify
+        ) as live:
+            live.subscribe(lambda old, new: changed.set())
+            assert live.is_enabled("beta") is False
+            env_file.write_text("LIVE_FEATURE_BETA=true\nLIVE_FEATURE_LIMIT=2\n")
+            assert changed.wait(5)
+            assert live.is_enabled("beta") is True
+            assert live.current.limit == 2
+
+    def test_reloads_on_environment_change(self, monkeypatch):
+        monkeypatch.delenv("LIVE_FEATURE_BETA", raising=False)
+        seen = []
+        changed = threading.Event()
+        with LiveFeatureFlags(LiveSample, env_file=[], poll_interval=0.05) as live:
+            live.subscribe(lambda old, new: (seen.append((old.beta, new.beta)), changed.set()))
+            monkeypatch.setenv("LIVE_FEATURE_BETA", "true")
+            assert changed.wait(5)
+        assert seen == [(False, True)]
+
+    def test_manual_reload(self, monkeypatch):
+        live = LiveFeatureFlags(LiveSample, env_file=[], start=False)
+        before = live.current
+        assert live.reload() is False
+        assert live.current is before
+        monkeypatch.setenv("LIVE_FEATURE_BETA", "true")
+        assert live.reload() is True
+        assert live.current is not before
+        assert before.beta is False
+        live.close()
+
+    def test_unsubscribe(self, monkeypatch):
+        calls = []
+        live = LiveFeatureFlags(LiveSample, env_file=[], start=False)
+        unsubscribe = live.subscribe(lambda old, new: calls.append(new))
+        unsubscribe()
+        monkeypatch.setenv("LIVE_FEATURE_BETA", "true")
+        live.reload()
+        assert calls == []
+
+    def test_invalid_values_keep_snapshot(self, monkeypatch):
+        live = LiveFeatureFlags(LiveSample, env_file=[], start=False)
+        before = live.current
+        monkeypatch.setenv("LIVE_FEATURE_LIMIT", "not-a-number")
+        with pytest.raises(ValidationError):
+            live.reload()
+        assert live.current is before
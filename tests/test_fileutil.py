@@ -0,0 +1,24 @@
+"""Tests for the shared file helpers."""
+
+import os
+
+import pytest
+
+from acme_config.fileutil import atomic_write
+
+
+class TestAtomicWrite:
+    def test_creates_parents_and_replaces(self, tmp_path):
+        path = tmp_path / "a" / "b" / "out.bin"
+        atomic_write(path, b"one")
+        atomic_write(str(path), b"two")
+        assert path.read_bytes() == b"two"
+        assert os.listdir(path.parent) == ["out.bin"]
+
+    def test_failed_write_keeps_old_file(self, tmp_path):
+        path = tmp_path / "out.bin"
+        atomic_write(path, b"old")
+        with pytest.raises(TypeError):
+            atomic_write(path, "not bytes")
+        assert path.read_bytes() == b"old"
+        assert os.listdir(tmp_path) == ["out.bin"]
@@ -0,0 +1,132 @@
+"""Tests for frozen config snapshots."""
+
+import pickle
+
+import pytest
+
+from acme_config.features import FeatureFlag, FeatureFlags
+from acme_config.frozen import FrozenConfig, freeze, frozen_type
+from acme_config.schema import AppConfig, ConfigField
+
+
+class TenantConfig(AppConfig):
+    model_config = {"env_prefix": "TENANT_", "env_file": None}
+
+    bucket: str = ConfigField(description="Bucket")
+    region: str = ConfigField(default="eu-west-1", description="Region")
+    replicas: int = ConfigField(default=1, description="Replicas")
+    tags: list[str] = ConfigField(default_factory=list, description="Tags")
+    token: str = ConfigField(default="", secret=True)
+
+
+class TenantFeatures(FeatureFlags):
+    model_config = {"env_prefix": "TENANT_FEATURE_", "env_file": None}
+
+    beta: bool = FeatureFlag(default=False, description="Beta")
+
+
+class MapConfig(AppConfig):
+    model_config = {"env_prefix": "MAP_", "env_file": None}
+
+    limits: dict[str, int] = ConfigField(default_factory=dict, description="Limits")
+
+
+def make(bucket="data", **overrides):
+    return TenantConfig(bucket=bucket, **overrides)
+
+
+class TestFreeze:
+    def test_attribute_access(self):
+        frozen = freeze(make(tags=["a", "b"]))
+        assert isinstance(frozen, FrozenConfig)
+        assert frozen.bucket == "data"
+        assert frozen.replicas == 1
+        assert frozen.tags == ("a", "b")
+        assert frozen.field_names == ("bucket", "region", "replicas", "tags", "token")
+        assert frozen.config_class is TenantConfig
+
+    def test_immutable(self):
+        frozen = freeze(make())
+        with pytest.raises(AttributeError):
+            frozen.bucket = "other"
+        with pytest.raises(AttributeError):
+            frozen.extra = 1
+
+    def test_no_instance_dict(self):
+        assert not hasattr(freeze(make()), "__dict__")
+
+    def test_hashable_and_equal(self):
+        a, b = freeze(make()), freeze(make())
+        assert a == b
+        assert hash(a) == hash(b)
+        assert len({a, b, freeze(make("other"))}) == 2
+
+    def test_not_equal_to_plain_tuple_or_other_class(self):
+        frozen = freeze(make())
+        assert frozen != tuple(frozen)
+        assert tuple(frozen) != frozen
+        assert freeze(TenantFeatures()) != (False,)
+
+    def test_strings_interned_across_instances(self):
+        region = "".join(["ap-", "south-", "2"])
+        a = freeze(make(region=region))
+        b = freeze(make(region="".join(["ap-", "south-", "2"])))
+        assert a.region is b.region
+
+    def test_repr_redacts_secrets(self):
+        text = repr(freeze(make(token="hunter2")))
+        assert "hunter2" not in text
+        assert text.startswith("FrozenTenantConfig(bucket='data'")
+
+    def test_pickle_round_trip(self):
+        frozen = freeze(make(tags=["x"]))
+        restored = pickle.loads(pickle.dumps(frozen))
+        assert restored == frozen
+        assert type(restored) is frozen_type(TenantConfig)
+
+    def test_pickle_omits_field_names(self):
+        data = pickle.dumps(freeze(make()))
+        assert b"replicas" not in data
+        assert len(data) < len(pickle.dumps(make()))
+
+    def test_mapping_values(self):
+        frozen = freeze(MapConfig(limits={"a": 1}))
+        with pytest.raises(TypeError):
+            frozen.limits["b"] = 2
+        assert pickle.loads(pickle.dumps(frozen)).limits == {"a": 1}
+        with pytest.raises(TypeError):
+            hash(frozen)
+
+    def test_thaw(self, monkeypatch):
+        frozen = freeze(make(tags=["a"]))
+        monkeypatch.setenv("TENANT_BUCKET", "from-env")
+        config = frozen.thaw()
+        assert isinstance(config, TenantConfig)
+        assert config.bucket == "data"
+        assert config.tags == ["a"]
+
+    def test_feature_flags(self):
+        frozen = freeze(TenantFeatures(beta=True))
+        assert frozen.beta is True
+        assert frozen.thaw().is_enabled("beta")
+
+    def test_frozen_type_cached(self):
+        assert frozen_type(TenantConfig) is frozen_type(TenantConfig)
+
+    def test_wrong_arity(self):
+        with pytest.raises(ValueError):
+            frozen_type(TenantConfig)(("only-one",))
+
+    @pytest.mark.parametrize("name", ["count", "index", "thaw", "config_class", "field_names"])
+    def test_rejects_fields_shadowing_methods(self, name):
+        Shadowing = type(
+            "Shadowing",
+            (AppConfig,),
+            {
+                "__annotations__": {name: int},
+                name: ConfigField(default=1, description="Clashes"),
+                "model_config": {"env_prefix": "SHADOW_", "env_file": None},
+            },
+        )
+        with pytest.raises(TypeError, match=f"field\\(s\\) {name} would shadow"):
+            freeze(Shadowing())
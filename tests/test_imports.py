@@ -0,0 +1,42 @@
+"""Tests for the lazy package exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import acme_config
+
+
+def loaded_modules(code: str) -> set[str]:
+    script = f"{code}\nimport sys\nprint(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyExports:
+    def test_import_does_not_load_pydantic(self):
+        modules = loaded_modules("import acme_config")
+        assert "pydantic" not in modules
+        assert "acme_config.schema" not in modules
+
+    def test_cli_does_not_load_pydantic(self):
+        modules = loaded_modules("import acme_config.legacy._main")
+        assert "pydantic" not in modules
+        assert "boto3" not in modules
+
+    def test_exports_resolve(self):
+        from acme_config.schema import AppConfig
+
+        assert acme_config.AppConfig is AppConfig
+        for name in acme_config.__all__:
+            assert getattr(acme_config, name) is not None
+
+    def test_dir_lists_exports(self):
+        assert set(acme_config.__all__) <= set(dir(acme_config))
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            acme_config.does_not_exist  # noqa: B018
@@ -1,11 +1,24 @@
 """Tests for config inspection utilities."""
 
+import io
+
+from pydantic import BaseModel, model_validator
+
 from acme_config.inspect import (
+    ValidationIssue,
     describe_config,
     generate_dotenv_template,
     generate_manifest,
+    iter_dotenv_template_lines,
+    iter_manifest_lines,
+    read_manifest_sections,
+    update_manifest,
     validate_env,
+    validate_many,
+    write_manifest,
 )
+from acme_config.metadata import get_config_meta
+from acme_config.resolver import resolve_config
 from acme_config.schema import AppConfig, ConfigField
 
 
@@ -70,6 +83,112 @@ class TestValidateEnv:
         issues = validate_env(InspectableConfig)
         assert len(issues) == 0
 
+    def test_issue_names_env_var(self, monkeypatch):
+        monkeypatch.setenv("INS_NAME", "test")
+        monkeypatch.setenv("INS_PORT", "eighty")
+        assert validate_env(InspectableConfig) == [
+            "INS_PORT (port): Input should be a valid integer, unable to parse string "
+            "as an integer [type=int_parsing]"
+        ]
+
+
+class BulkConfig(AppConfig):
+    model_config = {"env_prefix": "BULK_"}
+
+    name: str = ConfigField(description="App name")
+    port: int = ConfigField(default=8080, description="Port")
+    hosts: list[str] = ConfigField(default_factory=list, description="Hosts")
+    low: int = ConfigField(default=0, description="Low")
+    high: int = ConfigField(default=10, description="High")
+
+    @model_validator(mode="after")
+    def check_range(self):
+        if self.low > self.high:
+            raise ValueError("low must not exceed high")
+        return self
+
+
+class Database(BaseModel):
+    host: str
+    port: int = 5432
+
+
+class NestedBulkConfig(AppConfig):
+    model_config = {"env_prefix": "VN_", "env_file": None, "env_nested_delimiter": "__"}
+
+    db: Database = ConfigField(description="Database")
+
+
+class TestValidateMany:
+    def test_valid_sources(self, tmp_path):
+        env_file = tmp_path / "a.env"
+        env_file.write_text('BULK_NAME=a\nBULK_HOSTS=["x", "y"]\n')
+        assert validate_many(BulkConfig, [env_file, {"BULK_NAME": "b"}]) == []
+
+    def test_structured_issues(self, tmp_path):
+        env_file = tmp_path / "bad.env"
+        env_file.write_text("BULK_PORT=eighty\n")
+        issues = validate_many(BulkConfig, [{"BULK_NAME": "ok"}, env_file])
+        assert issues == [
+            ValidationIssue(
+                source=str(env_file),
+                field="name",
+                env_var="BULK_NAME",
+                type="missing",
+                message="Field required",
+            ),
+            ValidationIssue(
+                source=str(env_file),
+                field="port",
+                env_var="BULK_PORT",
+                type="int_parsing",
+                message="Input should be a valid integer, unable to parse string as an integer",
+                input="eighty",
+            ),
+        ]
+
+    def test_ignores_process_environment(self, monkeypatch):
+        monkeypatch.setenv("BULK_NAME", "from-env")
+        issues = validate_many(BulkConfig, [{}])
+        assert [(i.source, i.field, i.type) for i in issues] == [("<mapping 0>", "name", "missing")]
+
+    def test_env_var_names_case_insensitive(self):
+        assert validate_many(BulkConfig, [{"bulk_name": "a"}]) == []
+
+    def test_bad_json_reported(self):
+        issues = validate_many(BulkConfig, [{"BULK_NAME": "a", "BULK_HOSTS": "[oops"}])
+        assert [(i.field, i.type) for i in issues] == [("hosts", "list_type")]
+
+    def test_nested_delimiter(self, monkeypatch):
+        monkeypatch.setenv("VN_DB__HOST", "h")
+        assert resolve_config(NestedBulkConfig).db.host == "h"
+        assert validate_many(NestedBulkConfig, [{"VN_DB__HOST": "h"}]) == []
+        merged = {"vn_db": '{"host": "h"}', "VN_DB__PORT": "1"}
+        assert validate_many(NestedBulkConfig, [merged]) == []
+        issues = validate_many(NestedBulkConfig, [{"VN_DB__HOST": "h", "VN_DB__PORT": "x"}])
+        assert [(i.field, i.type) for i in issues] == [("db", "int_parsing")]
+
+    def test_model_validator_issue(self):
+        issues = validate_many(BulkConfig, [{"BULK_NAME": "a", "BULK_LOW": "5", "BULK_HIGH": "1"}])
+        assert len(issues) == 1
+        assert issues[0].field is None
+        assert issues[0].type == "value_error"
+
+    def test_unreadable_file(self, tmp_path):
+        missing = tmp_path / "missing.env"
+        issues = validate_many(BulkConfig, [missing])
+        assert [(i.source, i.type) for i in issues] == [(str(missing), "source_unreadable")]
+
+    def test_process_pool(self, tmp_path):
+        sources = []
+        for i in range(20):
+            env_file = tmp_path / f"{i}.env"
+            env_file.write_text(f"BULK_NAME=svc{i}\n" + ("BULK_PORT=x\n" if i % 5 == 0 else ""))
+            sources.append(env_file)
+        issues = validate_many(BulkConfig, sources, max_workers=2, chunksize=3)
+        assert [i.source for i in issues] == [str(sources[i]) for i in (0, 5, 10, 15)]
+        assert issues == validate_many(BulkConfig, sources)
+
 
 class TestDescribeConfig:
     def test_shows_values(self, monkeypatch):
@@ -92,3 +211,81 @@ class TestDescribeConfig:
         config = InspectableConfig()
         desc = describe_config(config)
         assert "InspectableConfig" in desc
+
+
+class OtherInspectable(AppConfig):
+    model_config = {"env_prefix": "OINS_"}
+
+    region: str = ConfigField(default="eu-west-1", description="Region")
+
+
+class TestManifestStreaming:
+    def test_iter_lines_sections(self):
+        lines = list(iter_manifest_lines([InspectableConfig, OtherInspectable]))
+        assert all(line.endswith("\n") for line in lines)
+        text = "".join(lines)
+        meta = get_config_meta(InspectableConfig)
+        assert f"# == {__name__}.InspectableConfig schema={meta.schema_hash}\n" in text
+        assert "OINS_REGION  # Region [default=eu-west-1]\n" in text
+        # Field lines match the single-class manifest.
+        for line in generate_manifest(InspectableConfig).splitlines()[5:]:
+            assert f"{line}\n" in lines
+
+    def test_write_manifest(self):
+        buf = io.StringIO()
+        write_manifest(buf, [InspectableConfig])
+        assert buf.getvalue() == "".join(iter_manifest_lines([InspectableConfig]))
+
+    def test_read_sections_round_trip(self):
+        text = "".join(iter_manifest_lines([InspectableConfig, OtherInspectable]))
+        sections = read_manifest_sections(text.splitlines(keepends=True))
+        assert list(sections) == [
+            f"{__name__}.InspectableConfig",
+            f"{__name__}.OtherInspectable",
+        ]
+        schema, lines = sections[f"{__name__}.OtherInspectable"]
+        assert schema == get_config_meta(OtherInspectable).schema_hash
+        assert lines[-1] == "\n"
+
+    def test_update_only_changed_sections(self, tmp_path):
+        path = tmp_path / "env.manifest"
+        assert update_manifest(path, [InspectableConfig, OtherInspectable]) == [
+            f"{__name__}.InspectableConfig",
+            f"{__name__}.OtherInspectable",
+        ]
+        # Hand edits to an unchanged section survive: it is copied, not regenerated.
+        text = path.read_text().replace("INS_PORT  # Port", "INS_PORT  # Port (kept)")
+        path.write_text(text)
+        mtime = path.stat().st_mtime_ns
+        assert update_manifest(path, [InspectableConfig, OtherInspectable]) == []
+        assert path.stat().st_mtime_ns == mtime
+
+        stale = text.replace(get_config_meta(OtherInspectable).schema_hash, "0" * 32)
+        stale = stale.replace("OINS_REGION", "OINS_OLD")
+        path.write_text(stale)
+        assert update_manifest(path, [InspectableConfig, OtherInspectable]) == [
+            f"{__name__}.OtherInspectable"
+        ]
+        assert path.read_text() == text
+
+    def test_update_drops_removed_classes(self, tmp_path):
+        path = tmp_path / "env.manifest"
+        update_manifest(path, [InspectableConfig, OtherInspectable])
+        assert update_manifest(path, [OtherInspectable]) == []
+        assert "INS_NAME" not in path.read_text()
+
+    def test_schema_hash_tracks_fields(self):
+        def define(description):
+            class Hashed(AppConfig):
+                model_config = {"env_prefix": "HASH_"}
+
+                name: str = ConfigField(description=description)
+
+            return Hashed
+
+        assert get_config_meta(define("a")).schema_hash == get_config_meta(define("a")).schema_hash
+        assert get_config_meta(define("a")).schema_hash != get_config_meta(define("b")).schema_hash
+
+    def test_dotenv_template_lines(self):
+        lines = list(iter_dotenv_template_lines(InspectableConfig))
+        assert "".join(lines) == generate_dotenv_template(InspectableConfig) + "\n"
@@ -0,0 +1,229 @@
+"""Tests for instrumentation hooks."""
+
+import logging
+
+import pytest
+from pydantic import ValidationError, field_validator
+
+from acme_config import instrument
+from acme_config.cache import ResolutionCache
+from acme_config.envfile import clear_env_file_cache, read_env_file
+from acme_config.instrument import (
+    Instrumentation,
+    LoggingInstrumentation,
+    OpenTelemetryInstrumentation,
+    StatsInstrumentation,
+    instrumentation,
+    profile_fields,
+    set_instrumentation,
+)
+from acme_config.parameter_store import (
+    AdaptiveThrottle,
+    ParameterStore,
+    clear_parameter_store_cache,
+    fetch_parameters,
+)
+from acme_config.resolver import resolve_config
+from acme_config.schema import AppConfig, ConfigField
+from acme_config.testing import FakeSSMClient
+
+
+class Recorder(Instrumentation):
+    def __init__(self):
+        self.stages = []
+        self.events = []
+
+    def stage(self, name, seconds, attrs):
+        self.stages.append((name, dict(attrs)))
+
+    def event(self, name, attrs):
+        self.events.append((name, dict(attrs)))
+
+
+class InstConfig(AppConfig):
+    model_config = {"env_prefix": "INST_", "env_file": None}
+
+    name: str = ConfigField(description="Name")
+    port: int = ConfigField(default=8080, description="Port")
+
+    @field_validator("name")
+    @classmethod
+    def strip(cls, value: str) -> str:
+        return value.strip()
+
+
+@pytest.fixture
+def recorder():
+    hook = Recorder()
+    with instrumentation(hook):
+        yield hook
+
+
+class TestRegistration:
+    def test_off_by_default(self):
+        assert instrument.get_instrumentation() is None
+        with instrument.span("x") as attrs:
+            attrs["ignored"] = 1
+        instrument.event("x")
+        instrument.record("x", 1.0)
+
+    def test_set_returns_previous(self):
+        hook = Recorder()
+        assert set_instrumentation(hook) is None
+        assert set_instrumentation(None) is hook
+
+    def test_context_manager_restores(self):
+        with instrumentation(Recorder()):
+            assert instrument.enabled()
+        assert not instrument.enabled()
+
+    def test_span_reports_errors(self, recorder):
+        with pytest.raises(KeyError), instrument.span("boom", config="C"):
+            raise KeyError("x")
+        assert recorder.stages == [("boom", {"config": "C", "error": "KeyError"})]
+
+
+class TestPipeline:
+    def test_resolution_stages(self, recorder, monkeypatch):
+        monkeypatch.setenv("INST_NAME", "svc")
+        resolve_config(InstConfig)
+        names = [name for name, _ in recorder.stages]
+        assert names[-1] == "resolve"
+        assert {"source", "validate"} <= set(names)
+        sources = [attrs["source"] for name, attrs in recorder.stages if name == "source"]
+        assert "IndexedEnvSource" in sources
+        assert all(attrs["config"] == "InstConfig" for _, attrs in recorder.stages)
+
+    def test_validation_error_marks_stages(self, recorder):
+        with pytest.raises(ValidationError):
+            InstConfig()
+        assert ("validate", {"config": "InstConfig", "error": "ValidationError"}) in recorder.stages
+
+    def test_envfile_cache_events(self, recorder, tmp_path):
+        clear_env_file_cache()
+        path = tmp_path / ".env"
+        path.write_text("A=1\n")
+        read_env_file(path)
+        read_env_file(path)
+        events = [(name, attrs["cache"]) for name, attrs in recorder.events]
+        assert events == [("cache.miss", "envfile"), ("cache.hit", "envfile")]
+        parses = [attrs for name, attrs in recorder.stages if name == "envfile.parse"]
+        assert parses == [{"path": str(path), "bytes": 4}]
+
+    def test_parameter_store_fetch(self, recorder):
+        client = FakeSSMClient()
+        client.put_parameter(Name="/app/dev/1/A", Value="abc")
+        client.put_parameter(Name="/app/dev/1/B", Value="de")
+        clear_parameter_store_cache()
+        try:
+            fetch_parameters("app", "dev", 1, client)
+            fetch_parameters("app", "dev", 1, client)
+        finally:
+            clear_parameter_store_cache()
+        assert [name for name, _ in recorder.events] == ["cache.miss", "cache.hit"]
+        (fetch,) = [attrs for name, attrs in recorder.stages if name == "parameter_store.fetch"]
+        assert (fetch["parameters"], fetch["bytes"]) == (2, 5)
+
+    def test_resolution_cache_events(self, recorder, monkeypatch):
+        monkeypatch.setenv("INST_NAME", "svc")
+        cache = ResolutionCache()
+        resolve_config(InstConfig, cache=cache)
+        resolve_config(InstConfig, cache=cache)
+        events = [name for name, attrs in recorder.events if attrs["cache"] == "resolution"]
+        assert events == ["cache.miss", "cache.hit"]
+
+    def test_legacy_calls_and_throttling(self, recorder):
+        client = FakeSSMClient(throttle_every=2)
+        store = ParameterStore(client, throttle=AdaptiveThrottle(rate=1e6), base_delay=0)
+        store.call("put_parameter", Name="/a/b/1/X", Value="1", Type="String")
+        store.call("put_parameter", Name="/a/b/1/Y", Value="1", Type="String")
+        calls = [attrs for name, attrs in recorder.stages if name == "ssm.call"]
+        assert [c["attempts"] for c in calls] == [1, 2]
+        assert [name for name, _ in recorder.events] == ["ssm.throttled"]
+
+
+class TestAdapters:
+    def test_stats(self, monkeypatch):
+        monkeypatch.setenv("INST_NAME", "svc")
+        stats = StatsInstrumentation()
+        with instrumentation(stats):
+            InstConfig()
+            InstConfig()
+            instrument.event("cache.hit", cache="envfile")
+        summary = stats.summary()
+        assert summary["stages"]["resolve"]["count"] == 2
+        assert summary["stages"]["source:IndexedEnvSource"]["count"] == 2
+        assert summary["events"] == {"cache.hit:envfile": 1}
+        stats.reset()
+        assert stats.summary() == {"stages": {}, "events": {}}
+
+    def test_logging(self, caplog, monkeypatch):
+        monkeypatch.setenv("INST_NAME", "svc")
+        with caplog.at_level(logging.DEBUG, "acme_config.instrument"):
+            with instrumentation(LoggingInstrumentation()):
+                InstConfig()
+        assert any(r.getMessage().startswith("resolve took") for r in caplog.records)
+
+    def test_logging_disabled_level(self, caplog):
+        with caplog.at_level(logging.INFO, "acme_config.instrument"):
+            LoggingInstrumentation().stage("resolve", 0.1, {})
+        assert not caplog.records
+
+    def test_tracer_spans(self, monkeypatch):
+        monkeypatch.setenv("INST_NAME", "svc")
+        tracer = FakeTracer()
+        with instrumentation(OpenTelemetryInstrumentation(tracer)):
+            InstConfig()
+            instrument.record("merge", 0.5, config="C")
+        names = [span.name for span in tracer.spans]
+        assert "acme_config.resolve" in names
+        assert "acme_config.validate" in names
+        merge = tracer.spans[-1]
+        assert merge.name == "acme_config.merge"
+        assert merge.attributes == {"acme_config.config": "C"}
+        assert merge.end_time - merge.start_time == 500_000_000
+
+
+class FakeSpan:
+    def __init__(self, name, attributes, start_time=None):
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.start_time = start_time
+        self.end_time = None
+
+    def set_attributes(self, attributes):
+        self.attributes.update(attributes)
+
+    def end(self, end_time=None):
+        self.end_time = end_time
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.end()
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes=None, start_time=None):
+        span = FakeSpan(name, attributes, start_time)
+        self.spans.append(span)
+        return span
+
+    def start_as_current_span(self, name, attributes=None):
+        return self.start_span(name, attributes)
+
+
+class TestProfileFields:
+    def test_times_each_field(self, recorder):
+        timings = profile_fields(InstConfig, {"name": " svc ", "port": "1", "other": 1})
+        assert set(timings) == {"name", "port"}
+        fields = [attrs["field"] for name, attrs in recorder.stages if name == "validate.field"]
+        assert fields == ["name", "port"]
+
+    def test_invalid_value_raises(self):
+        with pytest.raises(ValidationError):
+            profile_fields(InstConfig, {"port": "not a port"})
@@ -0,0 +1,55 @@
+"""Tests for the compiled field-metadata registry."""
+
+from acme_config.metadata import get_config_meta, invalidate_config_meta
+from acme_config.schema import AppConfig, ConfigField
+
+
+class MetaConfig(AppConfig):
+    model_config = {"env_prefix": "META_"}
+
+    name: str = ConfigField(description="App name", cli_flag="--name")
+    port: int = ConfigField(default=8080, description="Port")
+    token: str = ConfigField(default="", secret=True)
+
+
+class TestConfigMeta:
+    def test_precomputes_env_vars(self):
+        meta = get_config_meta(MetaConfig)
+        assert [f.env_var for f in meta.fields] == ["META_NAME", "META_PORT", "META_TOKEN"]
+        assert meta.by_env["META_PORT"].name == "port"
+
+    def test_field_attributes(self):
+        meta = get_config_meta(MetaConfig)
+        name = meta.by_name["name"]
+        assert name.required is True
+        assert name.cli_flag == "--name"
+        assert name.description == "App name"
+        token = meta.by_name["token"]
+        assert token.secret is True
+        assert token.default == ""
+
+    def test_cli_fields(self):
+        meta = get_config_meta(MetaConfig)
+        assert [f.name for f in meta.cli_fields] == ["name"]
+
+    def test_cached_per_class(self):
+        assert get_config_meta(MetaConfig) is get_config_meta(MetaConfig)
+
+    def test_redefined_class_gets_fresh_metadata(self):
+        def define(prefix):
+            class Redefined(AppConfig):
+                model_config = {"env_prefix": prefix}
+
+                value: str = ConfigField(default="x")
+
+            return Redefined
+
+        first = get_config_meta(define("ONE_"))
+        second = get_config_meta(define("TWO_"))
+        assert first.fields[0].env_var == "ONE_VALUE"
+        assert second.fields[0].env_var == "TWO_VALUE"
+
+    def test_invalidate(self):
+        meta = get_config_meta(MetaConfig)
+        invalidate_config_meta(MetaConfig)
+        assert get_config_meta(MetaConfig) is not meta
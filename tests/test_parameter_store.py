@@ -0,0 +1,137 @@
+"""Tests for the Parameter Store settings source."""
+
+import time
+
+import pytest
+
+from acme_config.parameter_store import (
+    DEFAULT_VERSION_TTL,
+    clear_parameter_store_cache,
+    fetch_parameters,
+    resolve_version,
+)
+from acme_config.resolver import ConfigResolver, resolve_config
+from acme_config.schema import AppConfig, ConfigField
+from acme_config.sources import ParameterStoreSource
+from acme_config.testing import FakeSSMClient
+
+client = FakeSSMClient()
+
+
+@pytest.fixture(autouse=True)
+def ssm():
+    client.parameters.clear()
+    client.calls.clear()
+    clear_parameter_store_cache()
+    for name, value in {
+        "/svc/prod/DEFAULT_VERSION": "2",
+        "/svc/prod/1/PS_NAME": "old",
+        "/svc/prod/2/PS_NAME": "from-ssm",
+        "/svc/prod/2/PS_PORT": "9000",
+        "/svc/prod/2/tags": '["a", "b"]',
+        "/svc/prod/2/UNRELATED": "x",
+    }.items():
+        client.put_parameter(Name=name, Value=value)
+    client.calls.clear()
+    yield client
+    clear_parameter_store_cache()
+
+
+class PSConfig(AppConfig):
+    model_config = {
+        "env_prefix": "PS_",
+        "env_file": None,
+        "parameter_store": {"app": "svc", "env": "prod", "client": client},
+    }
+
+    name: str = ConfigField(description="Name")
+    port: int = ConfigField(default=8080, description="Port")
+    tags: list[str] = ConfigField(default=[], description="Tags")
+
+
+class TestFetch:
+    def test_default_version_cached_until_stale(self):
+        assert resolve_version("svc", "prod", client) == "2"
+        client.put_parameter(Name="/svc/prod/DEFAULT_VERSION", Value="1", Overwrite=True)
+        assert resolve_version("svc", "prod", client) == "2"
+        assert client.calls["GetParameter"] == 1
+        assert resolve_version("svc", "prod", client, max_age=0) == "1"
+        assert client.calls["GetParameter"] == 2
+
+    def test_default_version_expires(self, monkeypatch):
+        assert resolve_version("svc", "prod", client) == "2"
+        client.put_parameter(Name="/svc/prod/DEFAULT_VERSION", Value="1", Overwrite=True)
+        later = time.monotonic() + DEFAULT_VERSION_TTL
+        monkeypatch.setattr(time, "monotonic", lambda: later)
+        assert resolve_version("svc", "prod", client) == "1"
+
+    def test_retries_throttled_calls(self):
+        throttled = FakeSSMClient(throttle_every=2)
+        throttled.parameters.update(client.parameters)
+        assert fetch_parameters("svc", "prod", None, throttled)["PS_PORT"] == "9000"
+        assert throttled.throttled > 0
+
+    def test_paginates_and_caches(self):
+        for i in range(25):
+            client.put_parameter(Name=f"/svc/prod/3/K{i}", Value=str(i))
+        client.calls.clear()
+        params = fetch_parameters("svc", "prod", 3, client)
+        assert len(params) == 25
+        assert fetch_parameters("svc", "prod", 3, client) is params
+        assert client.calls["GetParametersByPath"] == 3
+
+    def test_follows_delta_versions(self):
+        client.put_parameter(Name="/svc/prod/3/__base__", Value="/svc/prod/2")
+        client.put_parameter(Name="/svc/prod/3/PS_PORT", Value="9001")
+        client.put_parameter(Name="/svc/prod/3/__deleted__/UNRELATED", Value="deleted")
+        assert dict(fetch_parameters("svc", "prod", 3, client)) == {
+            "PS_NAME": "from-ssm",
+            "PS_PORT": "9001",
+            "tags": '["a", "b"]',
+        }
+
+
+class TestParameterStoreSource:
+    def test_maps_env_names_and_field_names(self):
+        config = PSConfig()
+        assert (config.name, config.port, config.tags) == ("from-ssm", 9000, ["a", "b"])
+
+    def test_environment_wins(self, monkeypatch):
+        monkeypatch.setenv("PS_PORT", "1")
+        assert PSConfig().port == 1
+
+    def test_above_dotenv(self, tmp_path):
+        env_file = tmp_path / ".env"
+        env_file.write_text("PS_NAME=from-dotenv\n")
+        assert resolve_config(PSConfig, env_file=str(env_file)).name == "from-ssm"
+
+    def test_explicit_version(self):
+        source = ParameterStoreSource(PSConfig, version=1)
+        assert source() == {"name": "old"}
+
+    def test_fetched_once_per_process(self):
+        PSConfig()
+        PSConfig()
+        assert client.calls["GetParametersByPath"] == 1
+        assert client.calls["GetParameter"] == 1
+
+    def test_unconfigured_class_skips_source(self):
+        class Plain(AppConfig):
+            model_config = {"env_prefix": "PS_", "env_file": None}
+
+            name: str = ConfigField(default="d", description="Name")
+
+        assert Plain().name == "d"
+        assert sum(client.calls.values()) == 0
+
+    def test_resolver_layer(self, monkeypatch):
+        resolver = ConfigResolver(PSConfig)
+        assert resolver.layer("parameter_store")["name"] == "from-ssm"
+        monkeypatch.setenv("PS_NAME", "env")
+        assert resolver.reload("environ").name == "env"
+
+    def test_reload_rereads_default_version(self):
+        resolver = ConfigResolver(PSConfig)
+        client.put_parameter(Name="/svc/prod/DEFAULT_VERSION", Value="1", Overwrite=True)
+        assert resolver.reload("environ").name == "from-ssm"
+        assert resolver.reload("parameter_store").name == "old"
@@ -0,0 +1,327 @@
+"""Tests for the layered incremental ConfigResolver."""
+
+import asyncio
+import time
+
+import pytest
+from pydantic import ValidationError, field_validator, model_validator
+from pydantic_settings import PydanticBaseSettingsSource
+
+from acme_config import sources
+from acme_config.features import FeatureFlag, FeatureFlags
+from acme_config.resolver import (
+    ConfigBundle,
+    ConfigResolver,
+    aresolve_config,
+    resolve_config,
+    resolve_many,
+)
+from acme_config.schema import AppConfig, ConfigField
+from acme_config.testing import FakeSSMClient
+
+
+class LayeredConfig(AppConfig):
+    model_config = {"env_prefix": "LAYERED_"}
+
+    name: str = ConfigField(description="App name")
+    port: int = ConfigField(default=8080, description="Port")
+    tags: list[str] = ConfigField(default=[], description="Tags")
+
+
+class CheckedConfig(AppConfig):
+    model_config = {"env_prefix": "CHECKED_", "env_file": None}
+
+    low: int = ConfigField(default=0)
+    high: int = ConfigField(default=10)
+
+    @model_validator(mode="after")
+    def _ordered(self):
+        if self.low > self.high:
+            raise ValueError("low must not exceed high")
+        return self
+
+
+class AliasedConfig(AppConfig):
+    model_config = {"env_prefix": "ALIASED_", "env_file": None}
+
+    name: str = ConfigField(default="d", alias="SVC_NAME")
+
+
+class DerivedConfig(AppConfig):
+    model_config = {"env_prefix": "DERIVED_", "env_file": None}
+
+    host: str = ConfigField(default="localhost")
+    url: str = ConfigField(default="")
+
+    @field_validator("url")
+    @classmethod
+    def _default_url(cls, value, info):
+        return value or f"http://{info.data['host']}"
+
+
+class TestConfigResolver:
+    def test_precedence(self, tmp_path, monkeypatch):
+        env_file = tmp_path / ".env"
+        env_file.write_text("LAYERED_NAME=from-file\nLAYERED_PORT=1000\n")
+        monkeypatch.setenv("LAYERED_PORT", "2000")
+        resolver = ConfigResolver(LayeredConfig, env_file=str(env_file))
+        assert resolver.config.name == "from-file"
+        assert resolver.config.port == 2000
+
+        config = resolver.update("cli", {"port": "3000", "name": None})
+        assert config.port == 3000
+        assert config.name == "from-file"
+
+    def test_complex_values_parsed(self, monkeypatch):
+        monkeypatch.setenv("LAYERED_NAME", "svc")
+        monkeypatch.setenv("LAYERED_TAGS", '["a", "b"]')
+        resolver = ConfigResolver(LayeredConfig, env_file="missing.env")
+        assert resolver.config.tags == ["a", "b"]
+
+    def test_only_changed_fields_revalidated(self, monkeypatch):
+        monkeypatch.setenv("LAYERED_NAME", "svc")
+        monkeypatch.setenv("LAYERED_TAGS", '["a"]')
+        resolver = ConfigResolver(LayeredConfig, env_file="missing.env")
+        base = resolver.config
+
+        config = resolver.with_overrides({"port": "9000"})
+        assert resolver.last_revalidated == ("port",)
+        assert config.port == 9000
+        assert config.tags is base.tags
+        assert resolver.config is base
+
+    def test_unchanged_update_reuses_instance(self, monkeypatch):
+        monkeypatch.setenv("LAYERED_NAME", "svc")
+        resolver = ConfigResolver(LayeredConfig, env_file="missing.env")
+        base = resolver.config
+        assert resolver.update("cli", {"name": "svc"}) is base
+        assert resolver.last_revalidated == ()
+
+    def test_removed_value_falls_back_to_default(self, monkeypatch):
+        monkeypatch.setenv("LAYERED_NAME", "svc")
+        resolver = ConfigResolver(LayeredConfig, overrides={"port": 1}, env_file="missing.env")
+        assert resolver.config.port == 1
+        config = resolver.update("overrides", {})
+        assert config.port == 8080
+        assert "port" not in config.model_fields_set
+
+    def test_reload_environ(self, monkeypatch):
+        monkeypatch.setenv("LAYERED_NAME", "one")
+        resolver = ConfigResolver(LayeredConfig, env_file="missing.env")
+        monkeypatch.setenv("LAYERED_NAME", "two")
+        assert resolver.reload("environ").name == "two"
+        assert resolver.last_revalidated == ("name",)
+
+    def test_invalid_value_raises(self, monkeypatch):
+        monkeypatch.setenv("LAYERED_NAME", "svc")
+        resolver = ConfigResolver(LayeredConfig, env_file="missing.env")
+        with pytest.raises(ValidationError):
+            resolver.with_overrides({"port": "not-a-number"})
+
+    def test_model_validators_force_full_validation(self):
+        resolver = ConfigResolver(CheckedConfig)
+        with pytest.raises(ValidationError):
+            resolver.with_overrides({"low": 50})
+        assert resolver.with_overrides({"low": 5}).low == 5
+        assert resolver.last_revalidated == ("low", "high")
+
+    def test_alias_keys_map_to_fields(self, monkeypatch):
+        monkeypatch.setenv("SVC_NAME", "fromenv")
+        resolver = ConfigResolver(AliasedConfig)
+        assert resolver.config.name == "fromenv"
+        assert resolver.config == resolve_config(AliasedConfig)
+        assert resolver.with_overrides({"name": "cli"}).name == "cli"
+
+    def test_field_validators_rerun_on_change(self):
+        resolver = ConfigResolver(DerivedConfig)
+        assert resolver.config.url == "http://localhost"
+        config = resolver.with_overrides({"host": "db"})
+        assert config.url == "http://db"
+        assert resolver.last_revalidated == ("host", "url")
+
+    def test_unknown_layer(self):
+        resolver = ConfigResolver(CheckedConfig)
+        with pytest.raises(ValueError):
+            resolver.update("defaults", {})
+
+
+class DbConfig(AppConfig):
+    model_config = {"env_prefix": "MANY_DB_"}
+
+    host: str = ConfigField(default="localhost", description="Host", cli_flag="--host")
+    port: int = ConfigField(default=5432, description="Port")
+
+
+class CacheConfig(AppConfig):
+    model_config = {"env_prefix": "MANY_CACHE_"}
+
+    host: str = ConfigField(default="localhost", description="Host")
+    ttl: int = ConfigField(default=60, description="TTL")
+
+
+class ManyFeatures(FeatureFlags):
+    model_config = {"env_prefix": "MANY_FEATURE_"}
+
+    beta: bool = FeatureFlag(default=False, description="Beta")
+
+
+class TestResolveMany:
+    def test_bundle_lookup(self, monkeypatch):
+        monkeypatch.setenv("MANY_DB_PORT", "6543")
+        monkeypatch.setenv("MANY_FEATURE_BETA", "true")
+        bundle = resolve_many([DbConfig, CacheConfig, ManyFeatures], env_file="missing.env")
+        assert isinstance(bundle, ConfigBundle)
+        assert list(bundle) == [DbConfig, CacheConfig, ManyFeatures]
+        assert len(bundle) == 3
+        assert bundle[DbConfig].port == 6543
+        assert bundle[CacheConfig].ttl == 60
+        assert bundle[ManyFeatures].is_enabled("beta")
+        assert LayeredConfig not in bundle
+        assert bundle.get(LayeredConfig) is None
+
+    def test_env_file_read_once(self, tmp_path, monkeypatch):
+        env_file = tmp_path / ".env"
+        env_file.write_text("MANY_DB_HOST=db\nMANY_CACHE_HOST=cache\n")
+        calls = []
+        load = sources.load_env_mapping
+
+        def counting_load(*args, **kwargs):
+            calls.append(args[0])
+            return load(*args, **kwargs)
+
+        monkeypatch.setattr(sources, "load_env_mapping", counting_load)
+        bundle = resolve_many([DbConfig, CacheConfig], env_file=str(env_file))
+        assert bundle[DbConfig].host == "db"
+        assert bundle[CacheConfig].host == "cache"
+        assert len(calls) == 1
+
+    def test_cli_args_and_overrides_per_class(self):
+        bundle = resolve_many(
+            [DbConfig, CacheConfig],
+            cli_args={"host": "cli-host", "port": None, "unrelated": 1},
+            overrides={CacheConfig: {"host": "override"}},
+            env_file="missing.env",
+        )
+        assert bundle[DbConfig].host == "cli-host"
+        assert bundle[DbConfig].port == 5432
+        assert bundle[CacheConfig].host == "override"
+
+    def test_threaded_matches_sequential(self, monkeypatch):
+        monkeypatch.setenv("MANY_CACHE_TTL", "5")
+        classes = [DbConfig, CacheConfig, ManyFeatures]
+        sequential = resolve_many(classes, env_file="missing.env")
+        threaded = resolve_many(classes, env_file="missing.env", max_workers=3)
+        assert [threaded[c] for c in classes] == [sequential[c] for c in classes]
+
+    def test_invalid_class_raises(self, monkeypatch):
+        monkeypatch.setenv("MANY_DB_PORT", "nope")
+        with pytest.raises(ValidationError):
+            resolve_many([CacheConfig, DbConfig], env_file="missing.env", max_workers=2)
+
+    def test_snapshot_scoped_to_call(self):
+        resolve_many([DbConfig], env_file="missing.env")
+        assert sources._snapshot.get() is None
+
+
+class SlowSource(PydanticBaseSettingsSource):
+    """Async source returning `values` after `delay` seconds."""
+
+    delay = 0.1
+    values = {"region": "from-async"}
+
+    def get_field_value(self, field, field_name):
+        return None, field_name, False
+
+    def __call__(self):
+        time.sleep(self.delay)
+        return dict(self.values)
+
+    async def acall(self):
+        await asyncio.sleep(self.delay)
+        return dict(self.values)
+
+
+class BlockingSource(SlowSource):
+    """Sync-only source; aresolve_config runs it on a thread."""
+
+    delay = 0.1
+    values = {"zone": "from-thread"}
+    acall = None
+
+
+ssm = FakeSSMClient(latency=0.1)
+ssm.put_parameter(Name="/async/dev/1/ASYNC_ZONE", Value="from-ssm")
+ssm.put_parameter(Name="/async/dev/1/ASYNC_NAME", Value="from-ssm")
+
+
+class AsyncConfig(AppConfig):
+    model_config = {
+        "env_prefix": "ASYNC_",
+        "parameter_store": {"app": "async", "env": "dev", "version": 1, "client": ssm},
+    }
+
+    name: str = ConfigField(description="Name")
+    port: int = ConfigField(default=8080, description="Port")
+    region: str = ConfigField(default="none", description="Region")
+    zone: str = ConfigField(default="none", description="Zone")
+
+    @classmethod
+    def settings_customise_sources(
+        cls, settings_cls, init_settings, env_settings, dotenv_settings, file_secret_settings
+    ):
+        return (
+            init_settings,
+            env_settings,
+            SlowSource(settings_cls),
+            BlockingSource(settings_cls),
+            dotenv_settings,
+            file_secret_settings,
+        )
+
+
+@pytest.fixture
+def fresh_ssm():
+    from acme_config.parameter_store import clear_parameter_store_cache
+
+    clear_parameter_store_cache()
+    yield ssm
+    clear_parameter_store_cache()
+
+
+class TestAresolveConfig:
+    def test_matches_resolve_config(self, tmp_path, monkeypatch, fresh_ssm):
+        env_file = tmp_path / ".env"
+        env_file.write_text("ASYNC_NAME=from-file\nASYNC_PORT=1\nASYNC_REGION=from-file\n")
+        monkeypatch.setenv("ASYNC_PORT", "2")
+        kwargs = {"env_file": str(env_file), "cli_args": {"port": None}}
+        config = asyncio.run(aresolve_config(AsyncConfig, **kwargs))
+        assert config == resolve_config(AsyncConfig, **kwargs)
+        assert (config.name, config.port) == ("from-ssm", 2)
+        assert (config.region, config.zone) == ("from-async", "from-thread")
+
+    def test_overrides_win(self, fresh_ssm):
+        config = asyncio.run(aresolve_config(AsyncConfig, overrides={"region": "forced"}))
+        assert (config.name, config.region) == ("from-ssm", "forced")
+
+    def test_sources_load_concurrently(self, fresh_ssm):
+        # Three sources taking 0.1 s each: async, threaded and Parameter Store.
+        start = time.perf_counter()
+        asyncio.run(aresolve_config(AsyncConfig, env_file=None))
+        assert time.perf_counter() - start < 0.25
+
+    def test_timeout(self, fresh_ssm, monkeypatch):
+        monkeypatch.setattr(SlowSource, "delay", 1.0)
+        with pytest.raises(TimeoutError, match="SlowSource did not load AsyncConfig"):
+            asyncio.run(aresolve_config(AsyncConfig, timeout=0.3))
+
+    def test_source_timeouts_override(self, fresh_ssm):
+        with pytest.raises(TimeoutError, match="ParameterStoreSource"):
+            asyncio.run(
+                aresolve_config(
+                    AsyncConfig, timeout=5, source_timeouts={"ParameterStoreSource": 0.01}
+                )
+            )
+
+    def test_validation_error(self, fresh_ssm):
+        with pytest.raises(ValidationError):
+            asyncio.run(aresolve_config(AsyncConfig, overrides={"port": "not a port"}))
@@ -1,6 +1,8 @@
 """Tests for AppConfig schema declaration and resolution."""
 
 import pytest
+from pydantic import BaseModel
+from pydantic_settings import BaseSettings
 
 from acme_config.resolver import build_cli_parser, resolve_config
 from acme_config.schema import AppConfig, ConfigField
@@ -47,6 +49,29 @@ class TestAppConfig:
         config = SampleConfig(_env_file=str(env_file))
         assert config.name == "from-env"
 
+    def test_nested_partial_update_keeps_defaults(self, monkeypatch):
+        class Sub(BaseModel):
+            a: int = 2
+            b: int = 2
+
+        config = {
+            "env_prefix": "NESTED_",
+            "env_nested_delimiter": "__",
+            "nested_model_default_partial_update": True,
+            "env_file": None,
+        }
+
+        class Stock(BaseSettings):
+            model_config = config
+            sub: Sub = Sub(a=5, b=6)
+
+        class Nested(AppConfig):
+            model_config = config
+            sub: Sub = Sub(a=5, b=6)
+
+        monkeypatch.setenv("NESTED_SUB__A", "9")
+        assert Nested().sub == Stock().sub == Sub(a=9, b=6)
+
 
 class TestResolveConfig:
     def test_basic_resolve(self, monkeypatch):
@@ -0,0 +1,124 @@
+"""Tests for lazily resolved secrets."""
+
+import pickle
+import threading
+import time
+from typing import Annotated
+
+import pytest
+from pydantic import SecretStr
+
+from acme_config.inspect import describe_config
+from acme_config.metadata import get_config_meta
+from acme_config.schema import AppConfig, ConfigField
+from acme_config.secrets import (
+    SecretRef,
+    SecretTTL,
+    register_secret_resolver,
+    reveal_secrets,
+)
+
+calls: list[str] = []
+
+
+def slow_vault(location: str) -> str:
+    calls.append(location)
+    time.sleep(0.01)
+    return f"secret-for-{location}"
+
+
+register_secret_resolver("testvault", slow_vault)
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+class SecretConfig(AppConfig):
+    model_config = {"env_prefix": "SEC_", "env_file": None}
+
+    password: SecretRef = ConfigField(default="testvault:db", description="DB password")
+    token: Annotated[SecretRef, SecretTTL(0.05)] = ConfigField(
+        default="testvault:token", description="API token"
+    )
+    literal: SecretRef = ConfigField(default="hunter2", description="Literal secret")
+
+
+class TestSecretRef:
+    def test_not_resolved_at_construction(self):
+        config = SecretConfig()
+        assert calls == []
+        assert not config.password.is_resolved
+
+    def test_resolves_once(self):
+        config = SecretConfig()
+        assert config.password.get_secret_value() == "secret-for-db"
+        assert config.password.get_secret_value() == "secret-for-db"
+        assert calls == ["db"]
+
+    def test_concurrent_first_access(self):
+        ref = SecretRef("testvault:shared")
+        barrier = threading.Barrier(8)
+        results = []
+
+        def read():
+            barrier.wait()
+            results.append(ref.get_secret_value())
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == ["secret-for-shared"] * 8
+        assert calls == ["shared"]
+
+    def test_ttl_expiry(self):
+        config = SecretConfig()
+        assert config.token.ttl == 0.05
+        config.token.get_secret_value()
+        time.sleep(0.06)
+        assert not config.token.is_resolved
+        config.token.get_secret_value()
+        assert calls == ["token", "token"]
+
+    def test_literal_and_env(self, monkeypatch):
+        monkeypatch.setenv("SEC_PASSWORD", "env:REAL_PASSWORD")
+        monkeypatch.setenv("REAL_PASSWORD", "from-env")
+        config = SecretConfig()
+        assert config.literal.get_secret_value() == "hunter2"
+        assert config.password.get_secret_value() == "from-env"
+
+    def test_file_scheme(self, tmp_path):
+        path = tmp_path / "secret"
+        path.write_text("s3cr3t\n")
+        assert SecretRef(f"file:{path}").get_secret_value() == "s3cr3t"
+
+    def test_errors_are_not_cached(self, monkeypatch):
+        ref = SecretRef("env:SEC_MISSING")
+        with pytest.raises(LookupError):
+            ref.get_secret_value()
+        monkeypatch.setenv("SEC_MISSING", "late")
+        assert ref.get_secret_value() == "late"
+
+    def test_never_revealed(self):
+        config = SecretConfig()
+        config.literal.get_secret_value()
+        text = repr(config) + str(config) + config.model_dump_json()
+        assert "hunter2" not in text
+        assert repr(config.password) == "SecretRef('testvault:***')"
+        restored = pickle.loads(pickle.dumps(config.literal))
+        assert not restored.is_resolved
+
+    def test_describe_config_does_not_resolve(self):
+        config = SecretConfig()
+        assert get_config_meta(SecretConfig).by_name["password"].secret
+        assert "password = ***" in describe_config(config)
+        assert calls == []
+
+    def test_reveal_secrets_does_not_resolve(self):
+        ref = SecretRef("testvault:db")
+        value = {"a": [SecretStr("raw"), ref], "b": 1}
+        assert reveal_secrets(value) == {"a": ["raw", "testvault:db"], "b": 1}
+        assert not ref.is_resolved
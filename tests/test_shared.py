@@ -0,0 +1,166 @@
+"""Tests for shared-memory config snapshots."""
+
+import multiprocessing
+import sys
+
+import pytest
+from pydantic import BaseModel, SecretBytes, SecretStr, ValidationError, model_validator
+
+from acme_config.schema import AppConfig, ConfigField
+from acme_config.secrets import SecretRef
+from acme_config.shared import SharedConfig, SharedConfigView, encode_snapshot
+
+
+class PoolConfig(AppConfig):
+    model_config = {"env_prefix": "POOL_", "env_file": None}
+
+    bucket: str = ConfigField(description="Bucket")
+    workers: int = ConfigField(default=4, description="Workers")
+    tags: list[str] = ConfigField(default_factory=list, description="Tags")
+    password: SecretRef = ConfigField(default=SecretRef("env:POOL_PW"), description="DB password")
+
+
+class OtherConfig(AppConfig):
+    model_config = {"env_prefix": "OTHER_", "env_file": None}
+
+    bucket: int = ConfigField(default=0, description="Bucket")
+
+
+class Credentials(BaseModel):
+    user: str
+    password: SecretStr
+
+
+class SecretConfig(AppConfig):
+    model_config = {"env_prefix": "SECRETPOOL_", "env_file": None}
+
+    api_key: SecretStr = ConfigField(description="API key")
+    signing_key: SecretBytes = ConfigField(default=b"", description="Signing key")
+    db: Credentials | None = ConfigField(default=None, description="DB credentials")
+    tokens: dict[str, SecretStr] = ConfigField(default_factory=dict, description="Tokens")
+
+
+class RangeConfig(AppConfig):
+    model_config = {"env_prefix": "RANGE_", "env_file": None}
+
+    low: int = ConfigField(default=0, description="Low")
+    high: int = ConfigField(default=10, description="High")
+
+    @model_validator(mode="after")
+    def check(self):
+        if self.low > self.high:
+            raise ValueError("low > high")
+        return self
+
+
+@pytest.fixture
+def shared():
+    segment = SharedConfig(PoolConfig)
+    yield segment
+    segment.unlink()
+
+
+def read_in_child(name, queue):
+    with SharedConfigView(name, PoolConfig) as view:
+        queue.put((view.bucket, view.config().workers))
+
+
+class TestSharedConfig:
+    def test_publish_and_read(self, shared):
+        assert shared.publish(PoolConfig(bucket="data", tags=["a"])) == 1
+        with SharedConfigView(shared.name, PoolConfig) as view:
+            assert view.generation == 1
+            assert view.bucket == "data"
+            assert view.get("tags") == ["a"]
+            config = view.config()
+            assert isinstance(config, PoolConfig)
+            assert config.workers == 4
+            assert view.config() is config
+
+    def test_generation_bump_reaches_views(self, shared):
+        shared.publish(PoolConfig(bucket="one"))
+        with SharedConfigView(shared.name, PoolConfig) as view:
+            first = view.config()
+            assert not view.changed()
+            for i in range(3):
+                shared.publish(PoolConfig(bucket=f"v{i}", workers=i))
+            assert view.changed()
+            assert view.bucket == "v2"
+            assert view.workers == 2
+            assert view.config() is not first
+            assert shared.generation == 4
+
+    def test_secret_ref_keeps_reference(self, shared, monkeypatch):
+        monkeypatch.setenv("POOL_PW", "hunter2")
+        shared.publish(PoolConfig(bucket="data"))
+        with SharedConfigView(shared.name, PoolConfig) as view:
+            assert view.password.reference == "env:POOL_PW"
+            assert view.config().password.get_secret_value() == "hunter2"
+
+    def test_secret_types_round_trip(self):
+        config = SecretConfig(
+            api_key="k3y",
+            signing_key=b"s1g",
+            db={"user": "app", "password": "hunter2"},
+            tokens={"a": "t0k"},
+        )
+        with SharedConfig(SecretConfig) as segment:
+            segment.publish(config)
+            with SharedConfigView(segment.name, SecretConfig) as view:
+                assert view.api_key.get_secret_value() == "k3y"
+                loaded = view.config()
+        assert loaded.api_key.get_secret_value() == "k3y"
+        assert loaded.signing_key.get_secret_value() == b"s1g"
+        assert loaded.db.password.get_secret_value() == "hunter2"
+        assert loaded.tokens["a"].get_secret_value() == "t0k"
+        assert loaded == config
+
+    def test_nothing_published(self, shared):
+        with SharedConfigView(shared.name, PoolConfig) as view:
+            with pytest.raises(LookupError):
+                view.bucket
+
+    def test_unknown_field(self, shared):
+        shared.publish(PoolConfig(bucket="data"))
+        with SharedConfigView(shared.name, PoolConfig) as view:
+            with pytest.raises(AttributeError):
+                view.missing
+
+    def test_schema_mismatch(self, shared):
+        with pytest.raises(ValueError, match="different OtherConfig"):
+            SharedConfigView(shared.name, OtherConfig)
+
+    def test_publish_wrong_class(self, shared):
+        with pytest.raises(TypeError):
+            shared.publish(OtherConfig())
+
+    def test_payload_too_large(self):
+        with SharedConfig(PoolConfig, size=256) as segment:
+            with pytest.raises(ValueError, match="larger"):
+                segment.publish(PoolConfig(bucket="x" * 200))
+
+    def test_config_runs_model_validators(self):
+        with SharedConfig(RangeConfig) as segment:
+            segment.publish(RangeConfig.model_construct(low=5, high=1))
+            with SharedConfigView(segment.name, RangeConfig) as view:
+                assert view.low == 5
+                with pytest.raises(ValidationError):
+                    view.config()
+
+    def test_encoded_layout(self):
+        payload = encode_snapshot(PoolConfig(bucket="data"))
+        assert payload.endswith(b'"data"4[]"env:POOL_PW"')
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses fork")
+    def test_worker_process_reads_snapshot(self, shared):
+        shared.publish(PoolConfig(bucket="from-master", workers=8))
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        child = context.Process(target=read_in_child, args=(shared.name, queue))
+        child.start()
+        assert queue.get(timeout=10) == ("from-master", 8)
+        child.join(10)
+        assert child.exitcode == 0
+        # The worker exiting must not have destroyed the segment.
+        with SharedConfigView(shared.name, PoolConfig) as view:
+            assert view.bucket == "from-master"
@@ -0,0 +1,175 @@
+"""Tests for binary config snapshots."""
+
+import argparse
+from datetime import datetime
+from enum import Enum
+from typing import Annotated
+
+import pytest
+from pydantic import BaseModel, SecretBytes, SecretStr, ValidationError, model_validator
+
+from acme_config.features import FeatureFlag, FeatureFlags
+from acme_config.legacy._main import main_logic
+from acme_config.schema import AppConfig, ConfigField
+from acme_config.secrets import SecretRef, SecretTTL
+from acme_config.snapshot import dump_snapshot, load_snapshot
+
+
+class Mode(Enum):
+    FAST = "fast"
+    SAFE = "safe"
+
+
+class SnapConfig(AppConfig):
+    model_config = {"env_prefix": "SNAP_", "env_file": None}
+
+    name: str = ConfigField(default="svc", description="Name")
+    port: int = ConfigField(default=8080, description="Port")
+    ratio: float = ConfigField(default=0.5, description="Ratio")
+    debug: bool = ConfigField(default=False, description="Debug")
+    tags: list[str] = ConfigField(default=[], description="Tags")
+    limits: dict[str, int] = ConfigField(default={}, description="Limits")
+    mode: Mode = ConfigField(default=Mode.SAFE, description="Mode")
+    started: datetime = ConfigField(default=datetime(2024, 1, 1), description="Start")
+    token: Annotated[SecretRef, SecretTTL(60)] = ConfigField(
+        default="env:SNAP_TOKEN_SOURCE", description="Token"
+    )
+    note: str | None = ConfigField(default=None, description="Note")
+
+
+class RenamedConfig(AppConfig):
+    model_config = {"env_prefix": "SNAP_", "env_file": None}
+
+    name: str = ConfigField(default="svc", description="Name")
+    port: int = ConfigField(default=8080, description="Port")
+    added: int = ConfigField(default=1, description="New field")
+
+
+class StrictConfig(AppConfig):
+    model_config = {"env_prefix": "SNAP_", "env_file": None}
+
+    name: str = ConfigField(default="svc", description="Name")
+    port: str = ConfigField(default="x", description="Port, now a string")
+
+
+class CheckedConfig(AppConfig):
+    model_config = {"env_prefix": "SNAP_", "env_file": None}
+
+    name: str = ConfigField(default="svc", description="Name")
+    port: int = ConfigField(default=8080, description="Port")
+
+    @model_validator(mode="after")
+    def check_port(self):
+        if self.port < 1024:
+            raise ValueError("port must be >= 1024")
+        return self
+
+
+class Credentials(BaseModel):
+    user: str
+    password: SecretStr
+
+
+class SecretSnapConfig(AppConfig):
+    model_config = {"env_prefix": "SNAP_", "env_file": None}
+
+    api_key: SecretStr = ConfigField(description="API key")
+    signing_key: SecretBytes = ConfigField(default=b"", description="Signing key")
+    db: Credentials | None = ConfigField(default=None, description="DB credentials")
+
+
+class SecretSnapConfigV2(SecretSnapConfig):
+    added: int = ConfigField(default=1, description="New field")
+
+
+class SnapFlags(FeatureFlags):
+    model_config = {"env_prefix": "SNAP_FEATURE_", "env_file": None}
+
+    beta: bool = FeatureFlag(default=False, description="Beta")
+
+
+class TestSnapshot:
+    def test_round_trip(self):
+        config = SnapConfig(
+            port=9000,
+            tags=["a", "b"],
+            limits={"x": 2**70},
+            mode="fast",
+            started="2024-06-01T12:00:00",
+            token="ssm:/app/token",
+        )
+        loaded = load_snapshot(SnapConfig, dump_snapshot(config))
+        assert loaded == config
+        assert loaded.mode is Mode.FAST
+        assert loaded.started == datetime(2024, 6, 1, 12)
+        assert (loaded.token.reference, loaded.token.ttl) == ("ssm:/app/token", 60)
+        assert loaded.model_fields_set == config.model_fields_set
+
+    def test_does_not_read_sources(self, monkeypatch):
+        data = dump_snapshot(SnapConfig())
+        monkeypatch.setenv("SNAP_PORT", "1")
+        assert load_snapshot(SnapConfig, data).port == 8080
+
+    def test_matching_schema_skips_validation(self):
+        data = dump_snapshot(CheckedConfig.model_construct(port=80))
+        assert load_snapshot(CheckedConfig, data).port == 80
+
+    def test_changed_schema_validates_by_name(self):
+        loaded = load_snapshot(RenamedConfig, dump_snapshot(SnapConfig(port=9000)))
+        assert (loaded.name, loaded.port, loaded.added) == ("svc", 9000, 1)
+
+    def test_changed_schema_invalid_values(self):
+        with pytest.raises(ValidationError):
+            load_snapshot(StrictConfig, dump_snapshot(SnapConfig()))
+
+    def test_secret_types_keep_raw_values(self):
+        config = SecretSnapConfig(
+            api_key="k3y", signing_key=b"s1g", db={"user": "app", "password": "hunter2"}
+        )
+        data = dump_snapshot(config)
+        assert b"**********" not in data
+        # Same schema (no validation) and changed schema (validated by name).
+        for config_class in (SecretSnapConfig, SecretSnapConfigV2):
+            loaded = load_snapshot(config_class, data)
+            assert loaded.api_key.get_secret_value() == "k3y"
+            assert loaded.signing_key.get_secret_value() == b"s1g"
+            assert loaded.db.password.get_secret_value() == "hunter2"
+        assert load_snapshot(SecretSnapConfig, data) == config
+
+    def test_feature_flags(self):
+        flags = load_snapshot(SnapFlags, dump_snapshot(SnapFlags(beta=True)))
+        assert flags.beta is True
+
+    @pytest.mark.parametrize(
+        "data", [b"", b"NOTASNAP" + bytes(30), b"ACMESNAP\x63\x00" + bytes(24)]
+    )
+    def test_rejects_foreign_data(self, data):
+        with pytest.raises(ValueError, match="not an acme_config snapshot"):
+            load_snapshot(SnapConfig, data)
+
+    def test_rejects_truncated_data(self):
+        data = dump_snapshot(SnapConfig())
+        with pytest.raises(ValueError, match="corrupt snapshot"):
+            load_snapshot(SnapConfig, data[:-3])
+
+
+class TestBake:
+    def test_bakes_config_class(self, tmp_path):
+        env_file = tmp_path / ".env"
+        env_file.write_text("SNAP_PORT=9100\n")
+        output = tmp_path / "config.snap"
+        args = argparse.Namespace(
+            command="bake",
+            config="tests.test_snapshot:SnapConfig",
+            output=str(output),
+            env_file=str(env_file),
+        )
+        main_logic(args)
+        assert load_snapshot(SnapConfig, output.read_bytes()).port == 9100
+
+    def test_bad_config_spec(self, tmp_path):
+        args = argparse.Namespace(
+            command="bake", config="SnapConfig", output=str(tmp_path / "x"), env_file=None
+        )
+        with pytest.raises(ValueError, match="module:ClassName"):
+            main_logic(args)
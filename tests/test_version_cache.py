@@ -0,0 +1,87 @@
+"""Tests for the legacy on-disk version cache."""
+
+import json
+import os
+
+import pytest
+
+from acme_config.legacy.aws_parameter_store import set_default_version, set_parameters
+from acme_config.legacy.version_cache import VersionCache, default_cache_dir
+from acme_config.testing import FakeSSMClient
+
+
+@pytest.fixture
+def client():
+    client = FakeSSMClient()
+    set_parameters("app", "dev", 1, {"A": "1", "B": "2"}, client=client)
+    set_default_version("app", "dev", 1, client=client)
+    client.calls.clear()
+    return client
+
+
+class TestVersionCache:
+    def test_second_fetch_served_from_disk(self, tmp_path, client):
+        cache = VersionCache(str(tmp_path))
+        assert cache.fetch_parameters("app", "dev", 1, client=client) == {"A": "1", "B": "2"}
+        calls = sum(client.calls.values())
+        # A fresh instance (new process) must not hit SSM either.
+        again = VersionCache(str(tmp_path)).fetch_parameters("app", "dev", 1, client=client)
+        assert again == {"A": "1", "B": "2"}
+        assert sum(client.calls.values()) == calls
+
+    def test_identical_versions_share_object(self, tmp_path, client):
+        set_parameters("app", "dev", 2, {"A": "1", "B": "2"}, client=client)
+        cache = VersionCache(str(tmp_path))
+        cache.fetch_parameters("app", "dev", 1, client=client)
+        cache.fetch_parameters("app", "dev", 2, client=client)
+        assert len(os.listdir(tmp_path / "objects")) == 1
+
+    def test_corrupt_object_refetched(self, tmp_path, client):
+        cache = VersionCache(str(tmp_path))
+        cache.fetch_parameters("app", "dev", 1, client=client)
+        (obj,) = (tmp_path / "objects").iterdir()
+        obj.write_text('{"A": "tampered"}')
+        assert cache.fetch_parameters("app", "dev", 1, client=client) == {"A": "1", "B": "2"}
+
+    def test_empty_version_not_cached(self, tmp_path, client):
+        cache = VersionCache(str(tmp_path))
+        assert cache.fetch_parameters("app", "dev", 9, client=client) == {}
+        assert cache.get_cached_parameters("app", "dev", 9) is None
+
+    def test_default_version_ttl(self, tmp_path, client):
+        cache = VersionCache(str(tmp_path), default_version_ttl=60)
+        assert cache.get_default_version("app", "dev", client=client) == "1"
+        set_default_version("app", "dev", 2, client=client)
+        assert cache.get_default_version("app", "dev", client=client) == "1"
+        assert client.calls["GetParameter"] == 1
+
+    def test_default_version_revalidated(self, tmp_path, client):
+        cache = VersionCache(str(tmp_path), default_version_ttl=0)
+        assert cache.get_default_version("app", "dev", client=client) == "1"
+        ref = tmp_path / "refs" / "app" / "dev" / "DEFAULT_VERSION.json"
+        assert json.loads(ref.read_text())["etag"] == 1
+        set_default_version("app", "dev", 2, client=client)
+        assert cache.get_default_version("app", "dev", client=client) == "2"
+        assert json.loads(ref.read_text())["etag"] == 2
+
+    def test_stale_default_version_on_error(self, tmp_path, client, monkeypatch):
+        cache = VersionCache(str(tmp_path), default_version_ttl=0)
+        cache.get_default_version("app", "dev", client=client)
+
+        def offline(**kwargs):
+            raise ConnectionError("no route to host")
+
+        monkeypatch.setattr(client, "get_parameter", offline)
+        assert cache.get_default_version("app", "dev", client=client) == "1"
+
+    def test_missing_default_version(self, tmp_path, client):
+        cache = VersionCache(str(tmp_path))
+        with pytest.raises(client.exceptions.ParameterNotFound):
+            cache.get_default_version("app", "prod", client=client)
+
+    def test_default_cache_dir(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("ACME_CONFIG_CACHE_DIR", str(tmp_path))
+        assert default_cache_dir() == str(tmp_path)
+        monkeypatch.delenv("ACME_CONFIG_CACHE_DIR")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == str(tmp_path / "acme-config")
@@ -0,0 +1,47 @@
+"""Tests for the file watcher."""
+
+import sys
+
+import pytest
+
+from acme_config.watch import FileWatcher
+
+
+@pytest.fixture(params=[True, False], ids=["inotify", "stat"])
+def use_inotify(request):
+    return request.param
+
+
+class TestFileWatcher:
+    def test_backend(self, tmp_path):
+        watcher = FileWatcher([tmp_path / ".env"])
+        expected = "inotify" if sys.platform.startswith("linux") else "stat"
+        assert watcher.backend == expected
+        watcher.close()
+        assert FileWatcher([tmp_path / ".env"], use_inotify=False).backend == "stat"
+
+    def test_detects_creation(self, tmp_path, use_inotify):
+        path = tmp_path / ".env"
+        watcher = FileWatcher([path], poll_interval=0.05, use_inotify=use_inotify)
+        assert watcher.check() is False
+        path.write_text("A=1\n")
+        assert watcher.wait(5) is True
+        watcher.close()
+
+    def test_detects_replace(self, tmp_path, use_inotify):
+        path = tmp_path / ".env"
+        path.write_text("A=1\n")
+        watcher = FileWatcher([path], poll_interval=0.05, use_inotify=use_inotify)
+        staged = tmp_path / ".env.new"
+        staged.write_text("A=22\n")
+        staged.replace(path)
+        assert watcher.wait(5) is True
+        watcher.close()
+
+    def test_timeout(self, tmp_path, use_inotify):
+        path = tmp_path / ".env"
+        path.write_text("A=1\n")
+        watcher = FileWatcher([path], poll_interval=0.01, use_inotify=use_inotify)
+        (tmp_path / "other").write_text("x")
+        assert watcher.wait(0.05) is False
+        watcher.close()